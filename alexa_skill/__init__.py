@@ -19,123 +19,65 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
-import logging
-
-from alexa_skill import messages
-
-
-class Processor(object):
-    def __init__(self, request_body, buildin_intents, launch_message, session_end_message, *intents):
-        """
-        Creates instance of Alexa Processor which handles Alexa request and creates a response to it.
-
-        :param (dict) request_body: Alexa request body which was send to fulfiller webhook.
-        :param (intents.buildins.Alexa) buildin_intents: Instance of intents class which handles Alexa buildin intents
-        :param (str) launch_message: Welcoming intent which will be fired on start for all users
-        :param (str) session_end_message: Session end message which will be fired at the end of session.
-        :param (list) *intents: List of additional intent classes which will handle user responses.
-
-        Note:
-            Intents classes should inherit from alexa_skill.intents.Base.
-        """
-        self.request_body = request_body
-        self.launch_message = launch_message
-        self.session_end_message = session_end_message
-        self.buildin_intents = buildin_intents
-        self.intents_mapper = {}
-
-        map(self.intents_mapper.update, [intent.mapper for intent in intents])
-
-    def __call__(self):
-        request_types = {
-            'IntentRequest': self.intent_request,
-            'LaunchRequest': self.launch_request,
-            'SessionEndedRequest': self.session_end_request,
-        }
-        return request_types[self.request_type]()
-
-    @property
-    def locale(self):
-        """
-        Used for setting i18n internationalization strings
-        """
-        return self.request_body['request']['locale']
-
-    @property
-    def slots(self):
-        """
-        Alexa slots which are defined in Alexa console.
-
-        API Reference:
-            https://developer.amazon.com/docs/custom-skills/slot-type-reference.html
-
-        :rtype: dict
-        """
-        try:
-            return self.request_body['request']['intent']['slots']
-        except KeyError:
-            return {}
-
-    @property
-    def intent_name(self):
-        try:
-            return self.request_body['request']['intent']['name']
-        except LookupError:
-            return None
-
-    @property
-    def request_type(self):
-        return self.request_body['request']['type']
-
-    @property
-    def session_hash(self):
-        """
-        Return session hash of a user.
-        """
-        return self.request_body['session']['sessionId']
-
-    @property
-    def session_attributes(self):
-        return self.request_body['session'].get('attributes')
-
-    def session_end_request(self):
-        """
-        Returns a list with:
-            0: message for user
-            1: bool: True when alexa request was handled by Backend
-        """
-
-        message = messages.create_response(self.session_end_message, should_end_session=True)
-
-        return message, True
-
-    def launch_request(self):
-        """
-        Returns a list with:
-            0: message for user
-            1: bool: True when alexa request was handled by Backend
-        """
-
-        message = messages.create_response(self.launch_message, should_end_session=False)
-        return message, True
-
-    def intent_request(self):
-        """
-        Returns a list with:
-            0: message for user
-            1: bool: True when alexa request was handled by Backend
-            2: bool: if session should be ended
-        """
-
-        if self.intent_name and self.intent_name.startswith('AMAZON'):
-            message, handled = self.buildin_intents.mapper[self.intent_name]()
-        else:
-            try:
-                kwargs = {'slots': self.slots} if self.slots else {}
-
-                message, handled = self.intents_mapper[self.intent_name](**kwargs)
-            except (ValueError, KeyError):
-                logging.error('Intent name: {} not handled'.format(self.intent_name))
-                message, handled = self.buildin_intents.mapper['NotHandled']()
-
-        return message, handled
+"""
+Names of the package are imported on first access (PEP 562), so `import alexa_skill` stays cheap
+and applications load only what they use. Python older than 3.7 imports them eagerly.
+"""
+import sys
+
+_LAZY_NAMES = {
+    'AlexaRequest': 'alexa_skill.request',
+    'Processor': 'alexa_skill.processor',
+    'Skill': 'alexa_skill.skill',
+    'lambda_handler': 'alexa_skill.aws_lambda',
+}
+
+_SUBMODULES = frozenset((
+    'aws_lambda',
+    'cache',
+    'codec',
+    'dates',
+    'deadlines',
+    'intents',
+    'messages',
+    'processor',
+    'request',
+    'retries',
+    'router',
+    'serve',
+    'server',
+    'session',
+    'skill',
+    'slots',
+    'storage',
+    'temporal',
+    'timezones',
+    'verify',
+))
+
+__all__ = sorted(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        value = getattr(__import__(_LAZY_NAMES[name], fromlist=[name]), name)
+    elif name in _SUBMODULES:
+        value = __import__('{}.{}'.format(__name__, name), fromlist=[name])
+    else:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES) | _SUBMODULES)
+
+
+if sys.version_info < (3, 7):
+    from alexa_skill import messages  # noqa: F401
+    from alexa_skill.aws_lambda import lambda_handler  # noqa: F401
+    from alexa_skill.processor import Processor  # noqa: F401
+    from alexa_skill.request import AlexaRequest  # noqa: F401
+    from alexa_skill.skill import Skill  # noqa: F401
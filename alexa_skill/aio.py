@@ -0,0 +1,266 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Asyncio support, requires Python 3.5 or newer.
+"""
+import asyncio
+import functools
+import logging
+
+from alexa_skill import messages
+from alexa_skill.request import AlexaRequest
+from alexa_skill.retries import RetryCache
+from alexa_skill.router import SkillRouter
+from alexa_skill.router import UnknownApplication
+from alexa_skill.skill import Skill
+
+
+class AsyncSkill(Skill):
+    def __init__(self, buildin_intents, launch_message, session_end_message, *intents, executor=None):
+        """
+        Creates long-lived Alexa skill with intents handlers which can be coroutines.
+
+        Coroutine handlers (``async def``) are awaited in the event loop. Other custom intents handlers are
+        run in executor, so they do not block the event loop. Buildin intents are returning prepared responses
+        and are called directly.
+
+        Accepts the same arguments as :class:`alexa_skill.Skill` and:
+
+        :param (concurrent.futures.Executor) executor: Executor for synchronous handlers.
+            Default: event loop default executor.
+        """
+        super(AsyncSkill, self).__init__(buildin_intents, launch_message, session_end_message, *intents)
+
+        self.executor = executor
+        self.coroutine_intents = frozenset(
+            intent_name for intent_name, (handler, with_slots, with_request, deadline) in self.intents_mapper.items()
+            if asyncio.iscoroutinefunction(handler)
+        )
+
+    async def handle(self, request_body):
+        """
+        Handles Alexa request.
+
+        :param (dict) request_body: Alexa request body which was send to fulfiller webhook.
+
+        Returns a list with:
+            0: message for user
+            1: bool: True when alexa request was handled by Backend
+        """
+        return await self.handle_request(AlexaRequest(request_body))
+
+    async def handle_request(self, request):
+        """
+        Handles Alexa request which was already wrapped, e.g. by :class:`alexa_skill.router.SkillRouter`.
+
+        :param (alexa_skill.request.AlexaRequest) request: Alexa request.
+        """
+        if request.request_type == 'IntentRequest':
+            return await self.async_intent_request(request)
+
+        if request.request_type == 'SessionEndedRequest' and self.store is not None:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self.executor, self.session_end_request, request)
+
+        return self.request_types[request.request_type](request)
+
+    async def async_intent_request(self, request):
+        intent_name = request.intent_name
+
+        try:
+            handler, with_slots, with_request, deadline = self.intents_mapper[intent_name]
+        except KeyError:
+            logging.error('Intent name: {} not handled'.format(intent_name))
+            return self.not_handled()
+
+        kwargs = self.handler_kwargs(request, with_slots, with_request)
+
+        try:
+            if intent_name in self.coroutine_intents:
+                work = handler(**kwargs)
+            elif not with_slots:
+                return handler()
+            else:
+                loop = asyncio.get_event_loop()
+                work = loop.run_in_executor(self.executor, functools.partial(handler, **kwargs))
+
+            if deadline is None:
+                return await work
+
+            # Late coroutine is cancelled, late executor call is detached
+            return await asyncio.wait_for(work, deadline)
+        except asyncio.TimeoutError:
+            logging.error('Intent name: {} exceeded deadline of {} s'.format(intent_name, deadline))
+            return self.timed_out()
+        except (ValueError, KeyError):
+            logging.error('Intent name: {} not handled'.format(intent_name))
+            return self.not_handled()
+
+
+class ASGIApplication(object):
+    def __init__(self, skill, path=None, verifier=None):
+        """
+        Creates ASGI application which serves skill without any web framework.
+
+        Request body is read once, decoded and dispatched straight to the skill, encoded response is returned
+        with precomputed headers.
+
+        :param skill: Skill which handles requests, should be created once at startup. When skill is not
+            `AsyncSkill`, requests are handled in event loop default executor.
+        :param (str) path: Path of fulfiller webhook, e.g. /v1/alexa/fulfiller. Default: any path.
+        :param (alexa_skill.verify.Verifier) verifier: Verifies that requests were sent by Alexa, requests
+            which fail verification get 400. Default: requests are not verified.
+
+        Example:
+            app = ASGIApplication(AsyncSkill(...), path='/v1/alexa/fulfiller')
+        """
+        self.skill = skill
+        self.path = path
+        self.verifier = verifier
+        self.is_async = asyncio.iscoroutinefunction(skill.handle)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self.lifespan(receive, send)
+
+        if self.path is not None and scope['path'] != self.path:
+            return await self.send_empty(send, 404)
+
+        if scope['method'] != 'POST':
+            return await self.send_empty(send, 405)
+
+        body = b''
+        more_body = True
+
+        while more_body:
+            message = await receive()
+            body += message.get('body', b'')
+            more_body = message.get('more_body', False)
+
+        try:
+            request_body = messages.loads(body)
+
+            if self.verifier is not None:
+                headers = dict(scope['headers'])
+                self.verifier.verify(
+                    body,
+                    request_body,
+                    headers.get(b'signaturecertchainurl', b'').decode('latin-1'),
+                    headers.get(b'signature', b'').decode('latin-1'),
+                    headers.get(b'signature-256', b'').decode('latin-1'),
+                )
+        except ValueError:
+            return await self.send_empty(send, 400)
+
+        try:
+            if self.is_async:
+                json_response, handled = await self.skill.handle(request_body)
+            else:
+                loop = asyncio.get_event_loop()
+                json_response, handled = await loop.run_in_executor(None, self.skill.handle, request_body)
+        except UnknownApplication:
+            return await self.send_empty(send, 400)
+
+        logging.info('Response was handled by system: {}'.format(handled))
+
+        body = messages.dumps(json_response)
+
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode('ascii'))],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+    @staticmethod
+    async def send_empty(send, status):
+        await send({'type': 'http.response.start', 'status': status, 'headers': [(b'content-length', b'0')]})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    @staticmethod
+    async def lifespan(receive, send):
+        while True:
+            message = await receive()
+
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+class AsyncSkillRouter(SkillRouter):
+    """
+    Router of `AsyncSkill` skills, see :class:`alexa_skill.router.SkillRouter`.
+    """
+
+    async def handle(self, request_body):
+        return await self.handle_request(AlexaRequest(request_body))
+
+    async def handle_request(self, request):
+        return await self.route(request).handle_request(request)
+
+
+class AsyncRetryCache(RetryCache):
+    """
+    Retry cache of `AsyncSkill` skills, see :class:`alexa_skill.retries.RetryCache`.
+    """
+
+    async def handle(self, request_body):
+        return await self.handle_request(AlexaRequest(request_body))
+
+    async def handle_request(self, request):
+        request_id = request.request_id
+
+        if not request_id:
+            return await self.skill.handle_request(request)
+
+        flight, leader = self.join(request_id)
+
+        if flight is None:
+            return leader
+
+        if not leader:
+            # Cancelled retry does not cancel the original request
+            return await asyncio.shield(flight)
+
+        try:
+            result = await self.skill.handle_request(request)
+        except Exception as error:
+            flight.set_exception(error)
+            # Exception is raised here, waiters are optional
+            flight.exception()
+            raise
+        except BaseException:
+            flight.cancel()
+            raise
+        else:
+            flight.set_result(result)
+            self.responses.set(request_id, result)
+        finally:
+            self.land(request_id)
+
+        return result
+
+    @staticmethod
+    def new_flight():
+        return asyncio.get_event_loop().create_future()
@@ -0,0 +1,92 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+AWS Lambda entry point.
+"""
+import logging
+import timeit
+
+from alexa_skill import codec
+from alexa_skill import timezones as timezones_module
+
+
+def lambda_handler(skill, timezones=()):
+    """
+    Creates AWS Lambda handler for skill.
+
+    Should be called at module level of Lambda function, so the skill is created and warmed up once during
+    Lambda init and is reused by every invocation of warm container.
+
+    Example:
+        handler = lambda_handler(create_skill, timezones=['Europe/Berlin'])
+
+    Handler can be called locally with event dicts, e.g. `handler({'request': {'type': 'LaunchRequest'}})`.
+    Init duration in seconds is available as `handler.init_duration`.
+
+    :param skill: Skill or router which handles requests, or callable without arguments which creates it.
+        Time of creating skill is included in init duration.
+    :param (list) timezones: Timezones names used by skill, they are loaded during init.
+    """
+    started = timeit.default_timer()
+
+    if not hasattr(skill, 'handle'):
+        skill = skill()
+
+    warm_up(timezones)
+
+    def handler(event, context=None):
+        """
+        :param (dict) event: Alexa request.
+        :param context: Lambda context, not used.
+        :return: Alexa response.
+        :rtype: dict
+        """
+        json_response, handled = skill.handle(event)
+
+        logging.info('Response was handled by system: {}'.format(handled))
+
+        if isinstance(json_response, bytes):
+            # Rendered template responses are already encoded, Lambda runtime encodes the result on its own.
+            return codec.loads(json_response)
+
+        return json_response
+
+    handler.skill = skill
+    handler.init_duration = timeit.default_timer() - started
+
+    logging.info('Skill initialized in {:.1f} ms'.format(handler.init_duration * 1000))
+
+    return handler
+
+
+def warm_up(timezones=()):
+    """
+    Loads modules and caches used by requests, so the first invocation is not slower than others.
+
+    Slots module and dates parser are imported, timezones are resolved.
+
+    :param (list) timezones: Timezones names, importing `dateutil` is skipped when empty.
+    """
+    import alexa_skill.slots  # noqa: F401
+
+    for timezone in timezones:
+        timezones_module.get(timezone)
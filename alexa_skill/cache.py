@@ -0,0 +1,157 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import collections
+import threading
+import time
+
+# Python 2 has no monotonic clock
+_clock = getattr(time, 'monotonic', time.time)
+
+
+class LRUCache(object):
+    """
+    Bounded, thread-safe cache which evicts least recently used items.
+
+    :ivar (int) hits: Number of lookups which found a cached value.
+    :ivar (int) misses: Number of lookups which did not find a cached value.
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        :param (int) maxsize: Maximum number of cached items.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """
+        Returns cached value and marks it as recently used, otherwise returns default.
+        """
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data[key] = value
+            self.hits += 1
+
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def setdefault(self, key, value):
+        """
+        Stores value when key is not cached and returns cached value.
+        """
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                if len(self._data) >= self.maxsize:
+                    self._data.popitem(last=False)
+
+            self._data[key] = value
+
+            return value
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class TTLCache(LRUCache):
+    """
+    Bounded, thread-safe cache which evicts least recently used items and items older than `ttl`.
+    """
+
+    def __init__(self, maxsize=128, ttl=60, clock=_clock):
+        """
+        :param (int) maxsize: Maximum number of cached items.
+        :param (float) ttl: Time to live of items in seconds.
+        :param clock: Function which returns current time in seconds.
+        """
+        super(TTLCache, self).__init__(maxsize)
+        self.ttl = ttl
+        self.clock = clock
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                expires, value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+
+            if expires <= self.clock():
+                self.misses += 1
+                return default
+
+            self._data[key] = (expires, value)
+            self.hits += 1
+
+            return value
+
+    def set(self, key, value):
+        now = self.clock()
+
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (now + self.ttl, value)
+
+            # Items are stored in order of their expiry, except for recently used ones
+            while self._data:
+                first = next(iter(self._data))
+
+                if self._data[first][0] > now and len(self._data) <= self.maxsize:
+                    break
+
+                del self._data[first]
+
+    def pop(self, key, default=None):
+        with self._lock:
+            try:
+                return self._data.pop(key)[1]
+            except KeyError:
+                return default
@@ -0,0 +1,109 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+JSON codec used for Alexa requests and responses.
+
+The fastest installed backend is used: `orjson`, `ujson` or `json` from standard library.
+Backends are optional, install one with `pip install orjson`.
+
+`loads(body)` deserializes UTF-8 encoded JSON and raises `ValueError` when body is not valid JSON.
+`dumps(obj)` serializes object to compact, UTF-8 encoded JSON.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _json_loads(body):
+    if isinstance(body, bytes):
+        body = body.decode('utf-8')
+
+    return json.loads(body)
+
+
+def _json_dumps(obj):
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _orjson_loads(body):
+    return orjson.loads(body)
+
+
+def _orjson_dumps(obj):
+    return orjson.dumps(obj)
+
+
+def _ujson_loads(body):
+    if isinstance(body, bytes):
+        body = body.decode('utf-8')
+
+    return ujson.loads(body)
+
+
+def _ujson_dumps(obj):
+    encoded = ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+
+    if not isinstance(encoded, bytes):
+        encoded = encoded.encode('utf-8')
+
+    return encoded
+
+
+BACKENDS = {'json': (_json_loads, _json_dumps)}
+
+if ujson is not None:
+    BACKENDS['ujson'] = (_ujson_loads, _ujson_dumps)
+
+if orjson is not None:
+    BACKENDS['orjson'] = (_orjson_loads, _orjson_dumps)
+
+
+def use(name):
+    """
+    Selects JSON backend for the whole process, e.g. `codec.use('json')` in tests which compare encoded bytes.
+
+    :param (str) name: One of installed backends: orjson, ujson or json.
+    :raises ValueError: When backend is not installed.
+    """
+    global backend, loads, dumps
+
+    try:
+        loads, dumps = BACKENDS[name]
+    except KeyError:
+        raise ValueError('JSON backend {} is not installed'.format(name))
+
+    backend = name
+
+
+backend = None
+loads = None
+dumps = None
+
+use('orjson' if orjson is not None else 'ujson' if ujson is not None else 'json')
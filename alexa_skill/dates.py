@@ -21,46 +21,93 @@
 # THE SOFTWARE.
 import calendar
 import datetime
-import dateutil.tz
-import logging
 import re
 
+from alexa_skill import temporal
+from alexa_skill import timezones
+from alexa_skill.cache import LRUCache
+
+
+class Clock(object):
+    """
+    System clock used by date parsers to get current time.
+    """
+
+    def now(self, timezone):
+        """
+        :param (datetime.tzinfo) timezone: Timezone of returned datetime.
+        :rtype: datetime.datetime
+        """
+        return datetime.datetime.now(timezone)
+
+
+class FixedClock(Clock):
+    """
+    Clock which always returns the same time, used to get reproducible periods in tests and replays.
+    """
+
+    def __init__(self, now):
+        """
+        :param (datetime.datetime) now: Current time. Naive datetime is a local time in requested timezone.
+        """
+        self.current = now
+
+    def now(self, timezone):
+        if self.current.tzinfo is None:
+            return self.current.replace(tzinfo=timezone)
+
+        return self.current.astimezone(timezone)
+
 
 class AmazonTimeParser(object):
-    DAY_TIME_MAPPER = {
-        'MO': (8, 30),  # morning
-        'AV': (13, 00),  # after noon
-        'EV': (18, 00),  # evening
-        'NI': (21, 00),  # night
-    }
+    DAY_TIME_MAPPER = temporal.DAY_PARTS
 
     @classmethod
     def to_time(cls, amazon_time):
         """
         Parses alexa time output string to mapped time.
 
-        :param (str) amazon_time: Amazon string time. Possible choices: [MO, AV, EV, NI].
+        :param (str) amazon_time: Amazon string time. Possible choices: [MO, AF, EV, NI] or time, e.g. 11:30.
 
         :returns: Time tuple with hour as first element and minutes as second,
             otherwise None when amazon_time is not parsable.
         :rtype: tuple
+
+        .. note::
+            Use `alexa_skill.temporal.parse_time` to get seconds and day part of the time.
         """
-        time = None
+        time = temporal.parse_time(amazon_time)
 
-        if not amazon_time:
-            return time
+        if time is None:
+            return None
 
-        try:
-            time = cls.DAY_TIME_MAPPER[amazon_time]
-        except KeyError:
-            pass
+        return time.hour, time.minute
 
-        try:
-            time = map(int, amazon_time.split(':'))
-        except (ValueError, AttributeError):
-            pass
+    @classmethod
+    def to_datetime(cls, amazon_time, date=None, timezone=None, clock=None):
+        """
+        Parses alexa time output string to datetime.
 
-        return time
+        :param (str) amazon_time: Amazon string time.
+        :param (datetime.date) date: Date of returned datetime. Default: today in timezone.
+        :param timezone: Timezone name or object. Default: alexa_skill.timezones.DEFAULT_TIMEZONE
+        :param (Clock) clock: Clock used to get today's date. Default: AmazonDateParser.clock
+
+        :returns: Timezone aware datetime, otherwise None when amazon_time is not parsable.
+        :rtype: datetime.datetime
+        """
+        time = cls.to_time(amazon_time)
+
+        if time is None:
+            return None
+
+        hour, minute = time
+        timezone = timezones.get(timezone)
+
+        if date is None:
+            date = (clock or AmazonDateParser.clock).now(timezone)
+
+        return datetime.datetime(date.year, date.month, date.day, hour, minute, tzinfo=timezone)
 
 
 class AmazonDateParser(object):
@@ -70,30 +117,52 @@ class AmazonDateParser(object):
         https://developer.amazon.com/docs/custom-skills/slot-type-reference.html#date
     """
 
-    WEEK_MAPPER = {'w{}'.format(nr): 'w0{}'.format(nr) for nr in xrange(10)}
-
-    _DATE_PATTERNS = {
-        # "today", "tomorrow", "november twenty-fifth": 2015-11-25
-        '^\d{4}-\d{2}-\d{2}$': ('%Y-%m-%d', 'normal'),
-        # "this week", "next week": 2015-W48
-        '^\d{4}-W\d{1,2}$': ('%Y-W%U-%w', 'week'),
-        # "this weekend": 2015-W48-WE
-        '^\d{4}-W\d{1,2}-WE$': ('%Y-W%U-WE-%w', 'weekend'),
-        # "this month": 2015-11
-        '^\d{4}-\d{2}$': ('%Y-%m', 'month'),
-        # "next year": 2016
-        '^\d{4}$': ('%Y', 'year'),
+    _DATE_PATTERN = re.compile(
+        r"""
+        ^(?:
+            # "this decade": 201X
+            (?P<decade>\d{3})X
+            # "next year": 2016
+            | (?P<year>\d{4})(?:
+                # "this month": 2015-11, "today", "november twenty-fifth": 2015-11-25
+                -(?P<month>\d{2})(?:-(?P<day>\d{2}))?
+                # "this week", "next week": 2015-W48, "this weekend": 2015-W48-WE
+                | -W(?P<week>\d{1,2})(?P<weekend>-WE)?
+                # "next winter": 2017-WI
+                | -(?P<season>WI|SP|SU|FA)
+            )?
+        )$
+        """,
+        re.VERBOSE
+    )
+
+    # First month of a season
+    SEASONS = {
+        'WI': 12,
+        'SP': 3,
+        'SU': 6,
+        'FA': 9,
     }
 
+    clock = Clock()
+
+    _cache = LRUCache(maxsize=1024)
+    _periods = LRUCache(maxsize=1024)
+    _periods_day = datetime.date.min
+
     @classmethod
-    def to_date(cls, amazon_date):
+    def to_date(cls, amazon_date, timezone=None):
         """
         Parses alexa date output string to mapped time.
 
+        Parsed dates are cached by amazon date string.
+
         :param (str) amazon_date: Amazon date string.
+        :param timezone: Timezone name or object. Default: alexa_skill.timezones.DEFAULT_TIMEZONE
 
         :returns: Datetime with parsed date and date type. Otherwise (None, None) if date is not parsable.
         :rtype: tuple
+        :raises ValueError: When amazon date has valid format, but describes not existing date, e.g. 2018-02-30.
 
         .. note::
             Possible date types:
@@ -101,36 +170,131 @@ class AmazonDateParser(object):
                 * week
                 * weekend
                 * month
+                * season
                 * year
+                * decade
+                * present
+
+            Week and weekend dates are the last day (Sunday) of ISO-8601 week, weeks are starting on Monday.
         """
-        amazon_date = re.sub('X$', '0', amazon_date)
+        timezone = timezones.get(timezone)
 
-        for re_pattern, format_pattern_info in list(cls._DATE_PATTERNS.items()):
-            format_pattern, date_type = format_pattern_info
+        if amazon_date == 'PRESENT_REF':
+            return cls.clock.now(timezone), 'present'
 
-            if re.match(re_pattern, amazon_date):
+        result = cls._cache.get(amazon_date)
 
-                if '%U' in format_pattern:
-                    amazon_date += '-0'
-                    amazon_date = reduce(lambda a, kv: a.replace(*kv), cls.WEEK_MAPPER.iteritems(), amazon_date)
+        if result is None:
+            result = cls._parse(amazon_date)
+            cls._cache.set(amazon_date, result)
 
-                date = datetime.datetime.strptime(amazon_date, format_pattern)
-                date = date.replace(tzinfo=dateutil.tz.gettz('Europe/Berlin'))
-                logging.debug(date_type)
-                logging.debug(date)
+        date, date_type = result
 
-                return date, date_type
+        if date is None:
+            return result
 
-        return None, None
+        return date.replace(tzinfo=timezone), date_type
 
     @classmethod
-    def create_periods(cls, amazon_date, timezone=dateutil.tz.gettz('Europe/Berlin')):
-        date, date_type = cls.to_date(amazon_date)
-        today = datetime.datetime.now().replace(tzinfo=timezone)
+    def _parse(cls, amazon_date):
+        """
+        Returns naive datetime and date type of amazon date. Present reference is handled by `to_date`.
+        """
+        match = cls._DATE_PATTERN.match(amazon_date)
+
+        if match is None:
+            return None, None
+
+        decade, year, month, day, week, weekend, season = match.groups()
+
+        if decade:
+            return datetime.datetime(int(decade) * 10, 1, 1), 'decade'
+
+        year = int(year)
+
+        if day:
+            date, date_type = datetime.datetime(year, int(month), int(day)), 'normal'
+
+        elif month:
+            date, date_type = datetime.datetime(year, int(month), 1), 'month'
+
+        elif week:
+            date, date_type = cls._week_end(year, int(week)), 'weekend' if weekend else 'week'
+
+        elif season:
+            date, date_type = datetime.datetime(year, cls.SEASONS[season], 1), 'season'
+
+        else:
+            date, date_type = datetime.datetime(year, 1, 1), 'year'
+
+        return date, date_type
+
+    @staticmethod
+    def _week_end(year, week):
+        """
+        Returns Sunday of ISO-8601 week: week 1 is the week with January 4th, weeks are starting on Monday.
+        """
+        # December 28th is always in the last week of a year
+        if not 1 <= week <= datetime.date(year, 12, 28).isocalendar()[1]:
+            raise ValueError('Week number out of range: {}'.format(week))
+
+        january_4th = datetime.datetime(year, 1, 4)
+        first_monday = january_4th - datetime.timedelta(days=january_4th.weekday())
+
+        return first_monday + datetime.timedelta(days=7 * (week - 1) + 6)
+
+    @classmethod
+    def create_periods(cls, amazon_date, timezone=None, clock=None):
+        """
+        Returns start and end of period described by amazon date.
+
+        Periods are cached by amazon date, timezone and current date. Cache is cleared at midnight.
+
+        :param (str) amazon_date: Amazon date string.
+        :param timezone: Timezone name or object. Default: alexa_skill.timezones.DEFAULT_TIMEZONE
+        :param (Clock) clock: Clock used to get current time. Default: AmazonDateParser.clock
+
+        :returns: Timezone aware start and end datetimes. Otherwise (None, None) if date is not parsable.
+        :rtype: tuple
+
+        .. note::
+            Weekend periods are starting not earlier than now.
+        """
+        timezone = timezones.get(timezone)
+        now = (clock or cls.clock).now(timezone)
+
+        if amazon_date == 'PRESENT_REF':
+            return now, now
+
+        today = now.date()
+
+        if today > cls._periods_day:
+            cls._periods.clear()
+            cls._periods_day = today
+
+        # Timezone objects are not hashable, cached timezone is compared to make sure the id was not reused.
+        key = (amazon_date, id(timezone), today)
+        cached = cls._periods.get(key)
 
+        if cached is None or cached[0] is not timezone:
+            date, date_type = cls.to_date(amazon_date, timezone)
+            cached = (timezone, date_type) + cls._period(date, date_type)
+            cls._periods.set(key, cached)
+
+        timezone, date_type, start, end = cached
+
+        if date_type == 'weekend' and start < now:
+            start = now
+
+        return start, end
+
+    @staticmethod
+    def _period(date, date_type):
+        """
+        Returns start and end of period for parsed date.
+        """
         if date_type == 'weekend':
             start = date - datetime.timedelta(days=1)
-            start = today if start < today else start
             end = date
 
         elif date_type == 'week':
@@ -142,10 +306,23 @@ class AmazonDateParser(object):
             month = calendar.monthrange(date.year, date.month)
             end = start.replace(day=month[1])
 
+        elif date_type == 'season':
+            start = date
+            end = start + datetime.timedelta(days=31 * 2)
+            month = calendar.monthrange(end.year, end.month)
+            end = end.replace(day=month[1])
+
         elif date_type == 'year':
             start = date
             end = start.replace(month=12, day=31)
 
+        elif date_type == 'decade':
+            start = date
+            end = start.replace(year=start.year + 9, month=12, day=31)
+
+        elif date_type == 'present':
+            start = end = date
+
         elif date_type == 'normal':
             start = date
             end = start + datetime.timedelta(hours=4)
@@ -154,3 +331,175 @@ class AmazonDateParser(object):
             start = end = None
 
         return start, end
+
+
+# Ranges of day parts returned by Alexa in AMAZON.TIME slots, hour 24 is midnight of the next day.
+DAY_PART_RANGES = {
+    'MO': ((5, 0), (12, 0)),  # morning
+    'AF': ((12, 0), (17, 0)),  # afternoon
+    'AV': ((12, 0), (17, 0)),  # afternoon, kept for backward compatibility
+    'EV': ((17, 0), (21, 0)),  # evening
+    'NI': ((21, 0), (24, 0)),  # night
+}
+
+_resolved = LRUCache(maxsize=1024)
+
+
+def resolve(date_slot=None, time_slot=None, timezone=None, clock=None):
+    """
+    Resolves AMAZON.DATE and AMAZON.TIME slot values into one time range.
+
+    Ranges are half-open, end is not included:
+        * a day without time is the whole day, from midnight to the next midnight,
+        * a day with day part (MO, AF, EV, NI) is a range of the day part (see `DAY_PART_RANGES`),
+        * a day with time is a single point in time, start is equal to end,
+        * longer periods (week, month, ...) are covering whole days, time is ignored,
+        * time without date is a time today.
+
+    Ranges are cached by slot values, timezone and current date.
+
+    :param (str) date_slot: Value of AMAZON.DATE slot.
+    :param (str) time_slot: Value of AMAZON.TIME slot.
+    :param timezone: Timezone name or object. Default: alexa_skill.timezones.DEFAULT_TIMEZONE
+    :param (Clock) clock: Clock used to get current time. Default: AmazonDateParser.clock
+
+    :returns: Timezone aware start and end datetimes. Otherwise (None, None) if date or time is not parsable
+        or date does not exist, e.g. 2018-02-30.
+    :rtype: tuple
+    """
+    timezone = timezones.get(timezone)
+    now = (clock or AmazonDateParser.clock).now(timezone)
+
+    if date_slot == 'PRESENT_REF' and not time_slot:
+        return now, now
+
+    today = now.date()
+    key = (date_slot, time_slot, id(timezone), today)
+    cached = _resolved.get(key)
+
+    if cached is None or cached[0] is not timezone:
+        cached = (timezone,) + _resolve(date_slot, time_slot, timezone, today)
+        _resolved.set(key, cached)
+
+    timezone, date_type, start, end = cached
+
+    if date_type == 'weekend' and start < now:
+        start = now
+
+    return start, end
+
+
+def _resolve(date_slot, time_slot, timezone, today):
+    """
+    Returns date type, start and end of resolved range.
+    """
+    if date_slot and date_slot != 'PRESENT_REF':
+        try:
+            date, date_type = AmazonDateParser.to_date(date_slot, timezone)
+        except ValueError:  # Valid format, but not existing date, e.g. 2018-02-30
+            return None, None, None
+
+        if date_type is None:
+            return None, None, None
+
+        day = date.date()
+    else:
+        date_type, day = 'normal', today
+
+    if date_type != 'normal':
+        start, end = AmazonDateParser._period(date, date_type)
+        return date_type, start, _at(end.date(), 24, 0, 0, timezone)
+
+    if not time_slot:
+        return date_type, _at(day, 0, 0, 0, timezone), _at(day, 24, 0, 0, timezone)
+
+    time = temporal.parse_time(time_slot)
+
+    if time is None:
+        return None, None, None
+
+    if time.day_part:
+        (start_hour, start_minute), (end_hour, end_minute) = DAY_PART_RANGES[time.day_part]
+        return date_type, _at(day, start_hour, start_minute, 0, timezone), _at(day, end_hour, end_minute, 0, timezone)
+
+    start = _at(day, time.hour, time.minute, time.second, timezone)
+
+    return date_type, start, start
+
+
+def _at(day, hour, minute, second, timezone):
+    if hour == 24:
+        day += datetime.timedelta(days=1)
+        hour = 0
+
+    return datetime.datetime(day.year, day.month, day.day, hour, minute, second, tzinfo=timezone)
+
+
+# Date type codes returned by `parse_many`, 0 is used for dates which are not parsable.
+DATE_TYPE_CODES = {
+    'normal': 1,
+    'week': 2,
+    'weekend': 3,
+    'month': 4,
+    'season': 5,
+    'year': 6,
+    'decade': 7,
+    'present': 8,
+}
+
+
+def parse_many(values, timezone=None, today=None):
+    """
+    Parses many amazon dates into periods at once, e.g. for a column of logged slot values.
+
+    Every distinct amazon date is parsed only once. Requires numpy.
+
+    :param values: Sequence or numpy array of amazon date strings.
+    :param timezone: Timezone name or object. Default: alexa_skill.timezones.DEFAULT_TIMEZONE
+    :param (datetime.datetime) today: Current time used for present reference and weekend periods.
+        Default: now in timezone from AmazonDateParser.clock.
+
+    :returns: Arrays of periods starts, periods ends and date type codes (see `DATE_TYPE_CODES`).
+        Starts and ends are `datetime64[s]` local times in timezone, NaT when date is not parsable.
+    :rtype: tuple
+    """
+    import numpy
+
+    timezone = timezones.get(timezone)
+
+    if today is None:
+        today = AmazonDateParser.clock.now(timezone)
+    elif today.tzinfo is None:
+        today = today.replace(tzinfo=timezone)
+    else:
+        today = today.astimezone(timezone)
+
+    unique, inverse = numpy.unique(numpy.asarray(values, dtype='U'), return_inverse=True)
+
+    starts = numpy.empty(len(unique), dtype='datetime64[s]')
+    ends = numpy.empty(len(unique), dtype='datetime64[s]')
+    codes = numpy.zeros(len(unique), dtype=numpy.int8)
+
+    for index, amazon_date in enumerate(unique):
+        if amazon_date == 'PRESENT_REF':
+            date, date_type = today, 'present'
+        else:
+            try:
+                date, date_type = AmazonDateParser.to_date(amazon_date, timezone)
+            except ValueError:
+                date_type = None
+
+        if date_type is None:
+            starts[index] = ends[index] = numpy.datetime64('NaT')
+            continue
+
+        start, end = AmazonDateParser._period(date, date_type)
+
+        if date_type == 'weekend' and start < today:
+            start = today
+
+        starts[index] = numpy.datetime64(start.replace(tzinfo=None), 's')
+        ends[index] = numpy.datetime64(end.replace(tzinfo=None), 's')
+        codes[index] = DATE_TYPE_CODES[date_type]
+
+    return starts[inverse], ends[inverse], codes[inverse]
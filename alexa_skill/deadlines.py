@@ -0,0 +1,158 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Time budgets of intents handlers.
+
+Alexa drops responses which take longer than 8 seconds, handlers with deadline are run in worker threads
+and skill answers with fallback response when they are late. Late handlers cannot be stopped, they are
+detached and their results are discarded.
+"""
+import threading
+
+try:
+    import queue
+except ImportError:  # Python 2
+    import Queue as queue
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised when handler did not return before its deadline.
+    """
+
+
+def deadline(seconds):
+    """
+    Sets time budget of intents handler.
+
+    Example:
+        class BackendIntents(BaseIntents):
+            @intent('EXAMPLE.backend')
+            @deadline(3)
+            def backend(self):
+                ...
+
+    Deadline of all handlers of intents class can be set with `default_deadline` class attribute.
+
+    :param (float) seconds: Time after which skill answers with fallback response.
+    :raises ValueError: When seconds are not positive.
+    """
+    if seconds <= 0:
+        raise ValueError('Deadline should be positive, got {}'.format(seconds))
+
+    def decorator(method):
+        method.deadline = seconds
+        return method
+
+    return decorator
+
+
+class Task(object):
+    __slots__ = ('function', 'kwargs', 'done', 'result', 'error', 'detached')
+
+    def __init__(self, function, kwargs):
+        self.function = function
+        self.kwargs = kwargs
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.detached = False
+
+    def run(self):
+        if self.detached:
+            return
+
+        try:
+            self.result = self.function(**self.kwargs)
+        except Exception as error:
+            self.error = error
+        finally:
+            self.done.set()
+
+
+class Scheduler(object):
+    def __init__(self, max_workers=64):
+        """
+        Runs handlers in worker threads.
+
+        Workers are started when all of them are busy and are reused afterwards, so the pool grows to the
+        highest number of concurrent handlers, including detached late ones, but not above `max_workers`.
+        When all workers are busy, e.g. with late handlers during backend outage, handlers are not started
+        and fail with :class:`DeadlineExceeded` immediately.
+
+        :param (int) max_workers: Maximum number of worker threads.
+        """
+        self.max_workers = max_workers
+        self.tasks = queue.Queue()
+        self.idle = 0
+        self.workers = 0
+        self.lock = threading.Lock()
+
+    def call(self, function, kwargs, seconds):
+        """
+        Calls function and waits for its result at most `seconds`.
+
+        :param function: Handler.
+        :param (dict) kwargs: Handler keyword arguments.
+        :param (float) seconds: Deadline.
+        :raises DeadlineExceeded: When function did not return in time or all workers are busy. Task which
+            has not started yet is cancelled, running one is detached.
+        """
+        task = Task(function, kwargs)
+
+        with self.lock:
+            start_worker = not self.idle
+
+            if not start_worker:
+                self.idle -= 1
+            elif self.workers < self.max_workers:
+                self.workers += 1
+            else:
+                raise DeadlineExceeded('{!r} was not started, all {} workers are busy'.format(
+                    function, self.max_workers
+                ))
+
+        self.tasks.put(task)
+
+        if start_worker:
+            worker = threading.Thread(target=self.work, name='alexa-skill-deadline')
+            worker.daemon = True
+            worker.start()
+
+        if not task.done.wait(seconds):
+            task.detached = True
+            raise DeadlineExceeded('{!r} did not return in {} s'.format(function, seconds))
+
+        if task.error is not None:
+            raise task.error
+
+        return task.result
+
+    def work(self):
+        while True:
+            self.tasks.get().run()
+
+            with self.lock:
+                self.idle += 1
+
+
+default_scheduler = Scheduler()
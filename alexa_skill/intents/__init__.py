@@ -19,5 +19,8 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
+from alexa_skill.deadlines import deadline
 from alexa_skill.intents.base import BaseIntents
+from alexa_skill.intents.base import cached_intent
+from alexa_skill.intents.base import intent
 from alexa_skill.intents.buildins import BuildInIntents
@@ -22,21 +22,199 @@
 import abc
 
 from alexa_skill import messages
+from alexa_skill.cache import TTLCache
+from alexa_skill.skill import accepts_argument
 
+CACHE_SCOPES = ('global', 'user', 'session')
 
-class BaseIntents(object):
+
+def intent(name):
+    """
+    Registers intents class method as handler of Alexa intent.
+
+    Method can be registered for many intents by using decorator many times.
+
+    Example:
+        class ExampleIntents(BaseIntents):
+            @intent('EXAMPLE.hello')
+            def hello(self):
+                return self.response('Hello. Nice to meet you.'), True
+
+    :param (str) name: Alexa intent name.
+    :raises ValueError: When intent name is empty.
+    """
+    if not name:
+        raise ValueError('Intent name is required')
+
+    def decorator(method):
+        method.intent_names = getattr(method, 'intent_names', ()) + (name,)
+        return method
+
+    return decorator
+
+
+def _normalize_slots(slots):
+    normalized = []
+
+    for name, slot in (slots or {}).items():
+        value = getattr(slot, 'resolved_id', None) or getattr(slot, 'resolved_value', None) or slot.get('value')
+
+        if value:
+            normalized.append((name, value.strip().lower()))
+
+    return tuple(sorted(normalized))
+
+
+def _instance_token(intents):
+    """
+    Returns object which identifies intents instance in cache keys.
+
+    Unlike `id`, token is not reused by other instance while it is referenced by cached keys.
+    """
+    return vars(intents).setdefault('_cached_intent_token', object())
+
+
+def cached_intent(ttl=60, maxsize=256, scope='global'):
+    """
+    Caches responses of intents handler which answers the same for the same slot values.
+
+    Cache key consists of skill application id, intents instance, intent name, request locale and normalized
+    slot values (canonical values of entity resolution, stripped and lower-cased), so skills hosted in one
+    process never share responses. Requests are cached only when handler is called by skill with `request`
+    keyword argument.
+
+    Example:
+        class ProgramIntents(BaseIntents):
+            @intent('EXAMPLE.program')
+            @cached_intent(ttl=300, scope='global')
+            def program(self, slots=None):
+                ...
+
+    Cache of the handler with hits and misses counters is available as `ProgramIntents.program.cache`.
+
+    :param (float) ttl: Time to live of cached responses in seconds.
+    :param (int) maxsize: Maximum number of cached responses, least recently used are evicted.
+    :param (str) scope: 'global' shares responses between all users, 'user' between sessions of one user
+        and 'session' only within one session.
+    :raises ValueError: When scope is not known or handler is a coroutine.
+    """
+    if scope not in CACHE_SCOPES:
+        raise ValueError('Cache scope should be one of {}, got {}'.format(', '.join(CACHE_SCOPES), scope))
+
+    def decorator(method):
+        import inspect
+
+        if getattr(inspect, 'iscoroutinefunction', lambda function: False)(method):
+            raise ValueError('Coroutine handler {} cannot be cached'.format(method.__name__))
+
+        cache = TTLCache(maxsize, ttl)
+        with_request = accepts_argument(method, 'request')
+
+        def handler(self, slots=None, request=None):
+            kwargs = {}
+
+            if slots is not None:
+                kwargs['slots'] = slots
+
+            if with_request:
+                kwargs['request'] = request
+
+            if request is None:
+                return method(self, **kwargs)
+
+            if scope == 'user':
+                owner = request.user_id
+            elif scope == 'session':
+                owner = request.session_id
+            else:
+                owner = None
+
+            if scope != 'global' and owner is None:
+                return method(self, **kwargs)
+
+            key = (
+                request.application_id, _instance_token(self), request.intent_name, request.locale, owner,
+                _normalize_slots(slots),
+            )
+            response = cache.get(key)
+
+            if response is None:
+                message, handled = method(self, **kwargs)
+
+                # Cached message is shared by many requests, so it is frozen and serialized once
+                if isinstance(message, dict) and not isinstance(message, messages.PreparedResponse):
+                    message = messages.prepare_response(message)
+
+                response = message, handled
+                cache.set(key, response)
+
+            return response
+
+        handler.__name__ = method.__name__
+        handler.__doc__ = method.__doc__
+        handler.__dict__.update(method.__dict__)
+        handler.cache = cache
+
+        return handler
+
+    return decorator
+
+
+class IntentsMeta(abc.ABCMeta):
+    """
+    Collects methods registered with `intent` decorator once, when intents class is created.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        cls = super(IntentsMeta, mcs).__new__(mcs, name, bases, namespace)
+        registry = {}
+
+        for attribute, value in namespace.items():
+            for intent_name in getattr(value, 'intent_names', ()):
+                if intent_name in registry:
+                    raise ValueError('Intent {} is registered twice in {}: {} and {}'.format(
+                        intent_name, name, registry[intent_name], attribute
+                    ))
+
+                registry[intent_name] = attribute
+
+        inherited = {}
+
+        for base in reversed(cls.__mro__[1:]):
+            inherited.update(getattr(base, 'intents_registry', {}))
+
+        inherited.update(registry)
+        cls.intents_registry = inherited
+
+        return cls
+
+
+class BaseIntents(IntentsMeta(str('IntentsBase'), (object,), {})):
     """
-    Base class for creating any Intent which will be used in processor
+    Base class for creating any Intent which will be used in processor.
+
+    Intents handlers are registered with `intent` decorator, or by overriding `mapper` property.
     """
-    __metaclass__ = abc.ABCMeta
 
-    @abc.abstractproperty
+    # Default time budget of handlers in seconds, see :func:`alexa_skill.deadlines.deadline`
+    default_deadline = None
+
+    @property
     def mapper(self):
         """
-        Dictionary which map alexa intent name with intent method name.
+        Dictionary which map alexa intent name with intent method.
+
+        Default mapper is built once per instance from methods registered with `intent` decorator.
 
         :rtype dict
         """
+        try:
+            return self._mapper
+        except AttributeError:
+            self._mapper = messages.FrozenDict(
+                (intent_name, getattr(self, attribute)) for intent_name, attribute in self.intents_registry.items()
+            )
+            return self._mapper
 
     @staticmethod
     def response(*args, **kwargs):
@@ -47,3 +225,14 @@ class BaseIntents(object):
             https://developer.amazon.com/docs/custom-skills/request-and-response-json-reference.html#response-format
         """
         return messages.create_response(*args, **kwargs)
+
+    @classmethod
+    def prepare_response(cls, *args, **kwargs):
+        """
+        Creates read-only alexa response with pre-serialized JSON body.
+
+        Should be used for constant responses which are created once and returned for many requests.
+
+        :rtype: alexa_skill.messages.PreparedResponse
+        """
+        return messages.prepare_response(cls.response(*args, **kwargs))
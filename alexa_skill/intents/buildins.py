@@ -20,28 +20,32 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 from alexa_skill.intents.base import BaseIntents
+from alexa_skill.intents.base import intent
 
 
 class BuildInIntents(BaseIntents):
     """
     Buildin intents class which is handling all standard intents which are sent from Alexa.
+
+    Responses depend only on constructor arguments, so they are created and serialized once
+    (see :func:`alexa_skill.messages.prepare_response`) and shared by all requests.
     """
 
-    def __init__(self, help_message, not_handled_message, stop_message='stop', cancel_message='cancel'):
+    def __init__(self, help_message, not_handled_message, stop_message='stop', cancel_message='cancel',
+                 timeout_message='Sorry, this takes longer than expected. Please try again.'):
         self.help_message = help_message
         self.not_handled_message = not_handled_message
         self.stop_message = stop_message
         self.cancel_message = cancel_message
+        self.timeout_message = timeout_message
 
-    @property
-    def mapper(self):
-        return {
-            'AMAZON.CancelIntent': self.cancel,
-            'AMAZON.StopIntent': self.stop,
-            'AMAZON.HelpIntent': self.help,
-            'NotHandled': self.not_handled,
-        }
+        self.cancel_response = self.prepare_response(self.cancel_message, should_end_session=True)
+        self.stop_response = self.prepare_response(self.stop_message, should_end_session=True)
+        self.help_response = self.prepare_response(self.help_message, should_end_session=True)
+        self.not_handled_response = self.prepare_response(self.not_handled_message, should_end_session=False)
+        self.timeout_response = self.prepare_response(self.timeout_message, should_end_session=False)
 
+    @intent('AMAZON.CancelIntent')
     def cancel(self):
         """
         Handles build-in Alexa cancel intent.
@@ -50,11 +54,9 @@ class BuildInIntents(BaseIntents):
         :returns: [Alexa voice message string, should end session bool]
         :rtype: list
         """
+        return self.cancel_response, True
 
-        response = self.response(self.cancel_message, should_end_session=True)
-
-        return response, True
-
+    @intent('AMAZON.StopIntent')
     def stop(self):
         """
         Handles build-in Alexa stop intent.
@@ -62,11 +64,9 @@ class BuildInIntents(BaseIntents):
         :returns: [Alexa voice message string, should end session bool]
         :rtype: list
         """
+        return self.stop_response, True
 
-        response = self.response(self.stop_message, should_end_session=True)
-
-        return response, True
-
+    @intent('AMAZON.HelpIntent')
     def help(self):
         """
         Handles build-in Alexa help intent.
@@ -74,15 +74,22 @@ class BuildInIntents(BaseIntents):
         :returns: [Alexa voice message string, should end session bool]
         :rtype: list
         """
-        response = self.response(self.help_message, should_end_session=True)
-
-        return response, True
+        return self.help_response, True
 
+    @intent('NotHandled')
     def not_handled(self):
         """
         Returns not handled message.
 
         :returns: [Alexa voice message string, should end session bool]
         """
-        response = self.response(self.not_handled_message, should_end_session=False)
-        return response, False
+        return self.not_handled_response, False
+
+    @intent('Timeout')
+    def timeout(self):
+        """
+        Returns message for handlers which exceeded their deadline.
+
+        :returns: [Alexa voice message string, should end session bool]
+        """
+        return self.timeout_response, False
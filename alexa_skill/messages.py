@@ -19,6 +19,10 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
+import json
+import re
+
+from alexa_skill import codec
 
 
 def speech_output(text, speech_type='SSML'):
@@ -117,13 +121,14 @@ def confirm_slots_directives(slots):
             "slotToConfirm": slot,
             "updatedIntent": updated_intent
         }
-        for slot, updated_intent in slots.iteritems()
+        for slot, updated_intent in slots.items()
     ]
     return message
 
 
 def create_response(
-    text, card_title='', should_end_session=True, reprompt=None, confirm_slots=False, speech_type='SSML'
+    text, card_title='', should_end_session=True, reprompt=None, confirm_slots=False, speech_type='SSML',
+    session_attributes=None
 ):
     """
     Creates response for Alexa skill with answer for user intent.
@@ -135,6 +140,8 @@ def create_response(
     :param (str) reprompt: Defines reprompt output speech text. Default: will be no reprompt.
     :param (dict) confirm_slots: Dict of slot name which require confirmation as key and updated intent dict as value.
     :param (str) speech_type: Defines type of speech which should be returned. Choices: SSML or PlainText.
+    :param (dict) session_attributes: Attributes which Alexa sends back with next request of the session.
+                                      Use `alexa_skill.session.encode` to send them compact.
 
     :return: Dict with Alexa response format.
 
@@ -156,4 +163,206 @@ def create_response(
     if confirm_slots:
         message['response']['directives'] = confirm_slots_directives(confirm_slots)
 
+    if session_attributes is not None:
+        message['sessionAttributes'] = session_attributes
+
     return message
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError('{} is read-only'.format(type(self).__name__))
+
+
+def _thaw(self, memo):
+    return codec.loads(codec.dumps(self))
+
+
+class FrozenDict(dict):
+    """
+    Read-only dictionary used for responses which are shared between requests.
+    Deep copy of frozen dictionary is a regular, mutable dictionary.
+    """
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only
+    __deepcopy__ = _thaw
+
+
+class FrozenList(list):
+    """
+    Read-only list used for responses which are shared between requests.
+    """
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __setslice__ = __delslice__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = reverse = sort = _read_only
+    __deepcopy__ = _thaw
+
+
+class PreparedResponse(FrozenDict):
+    """
+    Read-only Alexa response with its JSON body serialized once.
+
+    :ivar (bytes) body: UTF-8 encoded JSON response body which can be send to Alexa as it is.
+    """
+    __slots__ = ('body',)
+
+
+def freeze(value):
+    """
+    Returns read-only copy of JSON value. Dictionaries are frozen to `FrozenDict` and lists to `FrozenList`.
+    """
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+
+    return value
+
+
+def loads(body):
+    """
+    Deserializes Alexa request body.
+
+    :param (bytes) body: UTF-8 encoded JSON.
+    :rtype: dict
+    :raises ValueError: When body is not valid JSON.
+    """
+    return codec.loads(body)
+
+
+def dumps(message):
+    """
+    Serializes Alexa response.
+
+    Responses created with `prepare_response` are not serialized again.
+
+    :param (dict) message: Alexa response.
+    :return: UTF-8 encoded JSON.
+    :rtype: bytes
+    """
+    try:
+        return message.body
+    except AttributeError:
+        return codec.dumps(message)
+
+
+def prepare_response(message):
+    """
+    Freezes and serializes constant Alexa response, so it can be returned for many requests without any work.
+
+    :param (dict) message: Alexa response, e.g. created with `create_response`.
+    :rtype: PreparedResponse
+    """
+    response = PreparedResponse((key, freeze(item)) for key, item in message.items())
+    response.body = dumps(message)
+
+    return response
+
+
+class EncodedResponse(bytes):
+    """
+    UTF-8 encoded JSON Alexa response rendered by `ResponseTemplate`.
+    """
+    __slots__ = ()
+
+    @property
+    def body(self):
+        return bytes(self)
+
+
+class ResponseTemplate(object):
+    """
+    Alexa response shape compiled once into pre-encoded JSON fragments with holes for values which change.
+
+    Rendering a template only escapes hole values and joins bytes, the response structure is never encoded again.
+    Template holes are:
+        * text: speech output text and card content, always a hole.
+        * card_title: card title, a hole when not given to the template.
+        * should_end_session: a hole when not given to the template.
+
+    Example:
+        greeting = ResponseTemplate(card_title='Greeting', should_end_session=False)
+        body = greeting.render('Hello Joe')
+
+    Accepts the same arguments as `create_response`, except for `text`.
+    """
+    _HOLE = '@@alexa-skill-hole:{}@@'
+
+    def __init__(
+        self, card_title=None, should_end_session=None, reprompt=None, confirm_slots=False, speech_type='SSML'
+    ):
+        holes = {'text': 'string'}
+
+        if card_title is None:
+            card_title = self._HOLE.format('card_title')
+            holes['card_title'] = 'string'
+
+        if should_end_session is None:
+            should_end_session = self._HOLE.format('should_end_session')
+            holes['should_end_session'] = 'flag'
+
+        message = create_response(
+            self._HOLE.format('text'),
+            card_title=card_title,
+            should_end_session=should_end_session,
+            reprompt=reprompt,
+            confirm_slots=confirm_slots,
+            speech_type=speech_type,
+        )
+        skeleton = dumps(message)
+
+        # Flag holes are JSON strings in the skeleton, quotes are replaced together with the hole.
+        markers = {
+            ('"{}"' if kind == 'flag' else '{}').format(self._HOLE.format(name)).encode('ascii'): name
+            for name, kind in holes.items()
+        }
+        hole_pattern = re.compile(b'|'.join(re.escape(marker) for marker in markers))
+
+        fragments = []
+        names = []
+        position = 0
+
+        for match in hole_pattern.finditer(skeleton):
+            fragments.append(skeleton[position:match.start()])
+            names.append(markers[match.group(0)])
+            position = match.end()
+
+        fragments.append(skeleton[position:])
+
+        self.holes = holes
+        self._fragments = tuple(fragments)
+        self._names = tuple(names)
+
+    def render(self, text, card_title=None, should_end_session=None):
+        """
+        Renders Alexa response.
+
+        :param (str) text: Text which should he responded to a user.
+        :param (str) card_title: Title used in alexa cards. Required when template was created without card title.
+        :param (bool) should_end_session: Required when template was created without `should_end_session`.
+
+        :rtype: EncodedResponse
+        """
+        values = {'text': text, 'card_title': card_title, 'should_end_session': should_end_session}
+        encoded = {}
+
+        for name, kind in self.holes.items():
+            value = values[name]
+
+            if value is None:
+                raise TypeError('Template value for {} is required'.format(name))
+
+            if kind == 'flag':
+                encoded[name] = b'true' if value else b'false'
+            else:
+                encoded[name] = json.encoder.encode_basestring_ascii(value)[1:-1].encode('ascii')
+
+        chunks = [self._fragments[0]]
+
+        for name, fragment in zip(self._names, self._fragments[1:]):
+            chunks.append(encoded[name])
+            chunks.append(fragment)
+
+        return EncodedResponse(b''.join(chunks))
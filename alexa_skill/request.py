@@ -0,0 +1,179 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+class cached_field(object):
+    """
+    Computes field of slotted object once, on first access, and stores it in the slot named `_<field name>`.
+    """
+
+    def __init__(self, function):
+        self.function = function
+        self.slot = '_' + function.__name__
+        self.__doc__ = function.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            value = self.function(instance)
+            setattr(instance, self.slot, value)
+            return value
+
+
+class SystemContext(object):
+    """
+    Typed view of `context.System` object of Alexa request.
+
+    Alexa API Reference:
+        https://developer.amazon.com/docs/custom-skills/request-and-response-json-reference.html#system-object
+    """
+    __slots__ = (
+        'application_id', 'user_id', 'user_access_token', 'device_id', 'supported_interfaces',
+        'api_endpoint', 'api_access_token',
+    )
+
+    def __init__(self, system):
+        """
+        :param (dict) system: `context.System` object of Alexa request.
+        """
+        user = system.get('user') or {}
+        device = system.get('device') or {}
+
+        self.application_id = (system.get('application') or {}).get('applicationId')
+        self.user_id = user.get('userId')
+        self.user_access_token = user.get('accessToken')
+        self.device_id = device.get('deviceId')
+        self.supported_interfaces = device.get('supportedInterfaces') or {}
+        self.api_endpoint = system.get('apiEndpoint')
+        self.api_access_token = system.get('apiAccessToken')
+
+
+class AlexaRequest(object):
+    """
+    Read-only view of Alexa request body.
+
+    Every field is extracted from request body once, when it is used for the first time.
+    Missing fields are None.
+
+    Alexa API Reference:
+        https://developer.amazon.com/docs/custom-skills/request-and-response-json-reference.html#request-format
+    """
+    __slots__ = (
+        'body', '_request', '_request_type', '_request_id', '_locale', '_intent', '_intent_name', '_slots',
+        '_session', '_session_id', '_session_attributes', '_application_id', '_user_id', '_system',
+    )
+
+    def __init__(self, body):
+        """
+        :param (dict) body: Alexa request body which was send to fulfiller webhook.
+        """
+        self.body = body
+
+    @cached_field
+    def request(self):
+        return self.body.get('request') or {}
+
+    @cached_field
+    def request_type(self):
+        """
+        Request type, e.g. LaunchRequest, IntentRequest or SessionEndedRequest.
+        """
+        return self.request.get('type')
+
+    @cached_field
+    def request_id(self):
+        return self.request.get('requestId')
+
+    @cached_field
+    def locale(self):
+        """
+        Used for setting i18n internationalization strings
+        """
+        return self.request.get('locale')
+
+    @cached_field
+    def intent(self):
+        return self.request.get('intent') or {}
+
+    @cached_field
+    def intent_name(self):
+        return self.intent.get('name')
+
+    @cached_field
+    def slots(self):
+        """
+        Alexa slots which are defined in Alexa console.
+
+        API Reference:
+            https://developer.amazon.com/docs/custom-skills/slot-type-reference.html
+
+        :rtype: alexa_skill.slots.Slots
+        """
+        from alexa_skill.slots import Slots
+
+        return Slots(self.intent.get('slots'))
+
+    @cached_field
+    def session(self):
+        return self.body.get('session') or {}
+
+    @cached_field
+    def session_id(self):
+        return self.session.get('sessionId')
+
+    @cached_field
+    def session_attributes(self):
+        """
+        Session attributes, compact attributes are decoded on first access.
+
+        :rtype: dict
+        """
+        from alexa_skill.session import decode
+
+        return decode(self.session.get('attributes'))
+
+    @cached_field
+    def system(self):
+        """
+        :rtype: SystemContext
+        """
+        return SystemContext((self.body.get('context') or {}).get('System') or {})
+
+    @cached_field
+    def application_id(self):
+        """
+        Skill application id from session, or from context when request has no session.
+        """
+        application = self.session.get('application') or {}
+
+        return application.get('applicationId') or self.system.application_id
+
+    @cached_field
+    def user_id(self):
+        """
+        User id from session, or from context when request has no session.
+        """
+        user = self.session.get('user') or {}
+
+        return user.get('userId') or self.system.user_id
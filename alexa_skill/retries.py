@@ -0,0 +1,134 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Alexa retries requests when skill is slow, retries have the same `requestId` as the original request.
+"""
+import logging
+import threading
+
+from alexa_skill.cache import TTLCache
+from alexa_skill.request import AlexaRequest
+
+_MISSING = object()
+
+
+class Flight(object):
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class RetryCache(object):
+    def __init__(self, skill, ttl=60, maxsize=1024):
+        """
+        Wraps skill, so the retried request is answered with response of the original request.
+
+        Retry which arrives while the original request is handled waits for its response instead of
+        calling intents handlers again. Requests without request id are always handled by skill.
+
+        Example:
+            application = WSGIApplication(RetryCache(skill))
+
+        :param skill: Skill or router which handles requests.
+        :param (float) ttl: Time in seconds for which responses are kept.
+        :param (int) maxsize: Maximum number of kept responses.
+        """
+        self.skill = skill
+        self.responses = TTLCache(maxsize, ttl)
+        self.flights = {}
+        self.lock = threading.Lock()
+
+    def handle(self, request_body):
+        """
+        Handles Alexa request, see :meth:`alexa_skill.Skill.handle`.
+        """
+        return self.handle_request(AlexaRequest(request_body))
+
+    def handle_request(self, request):
+        request_id = request.request_id
+
+        if not request_id:
+            return self.skill.handle_request(request)
+
+        flight, leader = self.join(request_id)
+
+        if flight is None:
+            logging.info('Request {} was answered from retry cache'.format(request_id))
+            return leader
+
+        if not leader:
+            logging.info('Request {} waits for the original request'.format(request_id))
+            flight.done.wait()
+
+            if flight.error is not None:
+                raise flight.error
+
+            return flight.result
+
+        try:
+            flight.result = result = self.skill.handle_request(request)
+        except Exception as error:
+            flight.error = error
+            raise
+        else:
+            self.responses.set(request_id, result)
+        finally:
+            self.land(request_id)
+            flight.done.set()
+
+        return result
+
+    def join(self, request_id):
+        """
+        Returns (None, cached response), (running flight, False) or (new flight, True).
+        """
+        result = self.responses.get(request_id, _MISSING)
+
+        if result is not _MISSING:
+            return None, result
+
+        with self.lock:
+            flight = self.flights.get(request_id)
+
+            if flight is not None:
+                return flight, False
+
+            # Original request could finish after the first lookup
+            result = self.responses.get(request_id, _MISSING)
+
+            if result is not _MISSING:
+                return None, result
+
+            flight = self.flights[request_id] = self.new_flight()
+
+            return flight, True
+
+    def land(self, request_id):
+        with self.lock:
+            del self.flights[request_id]
+
+    @staticmethod
+    def new_flight():
+        return Flight()
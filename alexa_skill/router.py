@@ -0,0 +1,95 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+from alexa_skill.request import AlexaRequest
+
+
+class UnknownApplication(ValueError):
+    """
+    Raised when request was sent for application which is not hosted by router.
+    """
+
+
+class SkillRouter(object):
+    def __init__(self, skills=None):
+        """
+        Creates router which hosts many skills in one process and routes requests by application id.
+
+        Example:
+            router = SkillRouter({
+                'amzn1.ask.skill.1': first_skill,
+                'amzn1.ask.skill.2': second_skill,
+            })
+            json_response, handled = router.handle(request_body)
+
+        :param (dict) skills: Skills by Alexa application id, e.g. amzn1.ask.skill.[unique-value-here].
+        """
+        self.skills = {}
+
+        for application_id, skill in (skills or {}).items():
+            self.register(application_id, skill)
+
+    def register(self, application_id, skill):
+        """
+        Adds skill to the router.
+
+        :raises ValueError: When application id is missing or already has a skill.
+        """
+        if not application_id:
+            raise ValueError('Application id is required')
+
+        if application_id in self.skills:
+            raise ValueError('Application {} already has a skill'.format(application_id))
+
+        self.skills[application_id] = skill
+
+    def route(self, request):
+        """
+        Returns skill for request.
+
+        :param (alexa_skill.request.AlexaRequest) request: Alexa request.
+        :raises UnknownApplication: When request application id is not hosted by router.
+        """
+        try:
+            return self.skills[request.application_id]
+        except KeyError:
+            raise UnknownApplication('Application {} is unknown'.format(request.application_id))
+
+    def handle(self, request_body):
+        """
+        Handles Alexa request with skill of request application.
+
+        Application id is taken from `session.application`, or from `context.System.application` when
+        request has no session.
+
+        :param (dict) request_body: Alexa request body which was send to fulfiller webhook.
+        :raises UnknownApplication: When request application id is not hosted by router.
+        """
+        return self.handle_request(AlexaRequest(request_body))
+
+    def handle_request(self, request):
+        """
+        Handles Alexa request which was already wrapped, e.g. by :class:`alexa_skill.retries.RetryCache`.
+
+        :param (alexa_skill.request.AlexaRequest) request: Alexa request.
+        :raises UnknownApplication: When request application id is not hosted by router.
+        """
+        return self.route(request).handle_request(request)
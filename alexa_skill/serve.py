@@ -0,0 +1,413 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Pre-fork HTTP server for skills.
+
+Usage:
+    python -m alexa_skill.serve main:skill --workers 4 --port 8000 --path /v1/alexa/fulfiller
+
+Skill is created once in the parent process, workers are forked from it and share its memory copy-on-write.
+Every worker listens on its own socket bound with SO_REUSEPORT, so the kernel balances connections between
+workers. On systems without SO_REUSEPORT workers accept connections from a socket inherited from the parent.
+
+Every worker serves one connection at a time, idle connections are closed after `--timeout` seconds.
+Workers which do not stop within `--graceful-timeout` seconds are killed.
+
+Signals of the parent process:
+    SIGHUP: graceful recycling, old workers are stopped when new ones are listening.
+    SIGTERM, SIGINT: graceful shutdown.
+"""
+import argparse
+import errno
+import gc
+import logging
+import multiprocessing
+import os
+import select
+import signal
+import socket
+import struct
+import sys
+import time
+from wsgiref import simple_server
+
+from alexa_skill.server import WSGIApplication
+
+REUSE_PORT = hasattr(socket, 'SO_REUSEPORT')
+
+
+def load(target):
+    """
+    Imports skill from `module:attribute` string, e.g. `main:skill`.
+
+    :raises ValueError: When target has wrong format or attribute is not a skill.
+    """
+    module_name, _, attribute = target.partition(':')
+
+    if not module_name or not attribute:
+        raise ValueError('Skill should be given as module:attribute, got {}'.format(target))
+
+    skill = getattr(__import__(module_name, fromlist=[attribute]), attribute)
+
+    if not hasattr(skill, 'handle'):
+        raise ValueError('{} is not a skill'.format(target))
+
+    return skill
+
+
+def create_socket(host, port, reuse_port=REUSE_PORT, backlog=128):
+    """
+    Creates TCP socket bound to address.
+
+    Socket with `reuse_port` is not listening, so the kernel does not balance connections to it. It reserves
+    the port for workers and resolves port 0 to a free one.
+    """
+    sock = socket.socket(socket.AF_INET6 if ':' in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
+    sock.bind((host, port))
+
+    if not reuse_port:
+        sock.listen(backlog)
+
+    return sock
+
+
+class RequestHandler(simple_server.WSGIRequestHandler):
+    def setup(self):
+        # Connection which does not send request in time is closed, so it does not block the worker
+        self.timeout = self.server.connection_timeout
+        simple_server.WSGIRequestHandler.setup(self)
+
+    def handle(self):
+        try:
+            simple_server.WSGIRequestHandler.handle(self)
+        except socket.timeout:
+            logging.debug('%s - connection timed out', self.address_string())
+
+    def log_message(self, format, *args):
+        logging.debug('%s - %s', self.address_string(), format % args)
+
+
+class WorkerServer(simple_server.WSGIServer):
+    # Worker wakes up periodically to notice shutdown, even when there are no requests.
+    timeout = 0.5
+
+    def __init__(self, sock, application, connection_timeout=None):
+        simple_server.WSGIServer.__init__(self, sock.getsockname()[:2], RequestHandler, bind_and_activate=False)
+
+        self.connection_timeout = connection_timeout
+
+        self.socket.close()
+        self.socket = sock
+        # Every worker is woken up by a connection on shared socket, only one of them gets it from accept.
+        self.socket.setblocking(False)
+        self.server_address = sock.getsockname()
+        self.server_name = socket.getfqdn(self.server_address[0])
+        self.server_port = self.server_address[1]
+        self.handled = 0
+        self.setup_environ()
+        self.set_app(application)
+
+    def process_request(self, request, client_address):
+        self.handled += 1
+        simple_server.WSGIServer.process_request(self, request, client_address)
+
+
+class Worker(object):
+    # Messages sent to the parent through pipe: worker is listening, worker served `max_requests`.
+    READY = 1
+    RETIRE = 2
+
+    MESSAGE = struct.Struct('=BI')
+
+    def __init__(self, application, sock, pipe, reuse_port=REUSE_PORT, max_requests=None, timeout=None):
+        """
+        Serves requests in forked process until the parent stops it.
+
+        :param application: WSGI application.
+        :param (socket.socket) sock: Socket created by the parent with `create_socket`.
+        :param (int) pipe: Write end of the parent pipe.
+        :param (bool) reuse_port: Worker listens on its own socket bound with SO_REUSEPORT.
+        :param (int) max_requests: Worker asks the parent for replacement after that many requests.
+        :param (float) timeout: Connection socket timeout in seconds. Default: no timeout.
+        """
+        self.application = application
+        self.sock = sock
+        self.pipe = pipe
+        self.reuse_port = reuse_port
+        self.max_requests = max_requests
+        self.timeout = timeout
+        self.parent = os.getppid()
+        self.alive = True
+
+    def stop(self, signum=None, frame=None):
+        self.alive = False
+
+    def notify(self, message):
+        os.write(self.pipe, self.MESSAGE.pack(message, os.getpid()))
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+        if self.reuse_port:
+            host, port = self.sock.getsockname()[:2]
+            self.sock.close()
+            self.sock = create_socket(host, port, reuse_port=True)
+            self.sock.listen(128)
+
+        server = WorkerServer(self.sock, self.application, self.timeout)
+        retiring = False
+
+        self.notify(self.READY)
+
+        # Worker keeps serving until replacement is listening and the parent stops it, so the port
+        # is never left without a listening socket.
+        while self.alive and os.getppid() == self.parent:
+            self.handle_request(server)
+
+            if self.max_requests and server.handled >= self.max_requests and not retiring:
+                retiring = True
+                self.notify(self.RETIRE)
+
+        if self.reuse_port:
+            # Connections already queued on the worker own socket would be reset when it is closed.
+            server.timeout = 0
+
+            for _ in range(128):
+                if not select.select([server.socket], [], [], 0)[0]:
+                    break
+                self.handle_request(server)
+
+        server.server_close()
+
+    @staticmethod
+    def handle_request(server):
+        try:
+            server.handle_request()
+        except (select.error, OSError, IOError) as error:
+            # Python 2 does not retry system calls interrupted by signals
+            if error.args[0] != errno.EINTR:
+                raise
+
+
+class Arbiter(object):
+    def __init__(
+        self, application, sock, workers, reuse_port=REUSE_PORT, max_requests=None, timeout=10, graceful_timeout=10
+    ):
+        """
+        Starts workers and keeps their number.
+
+        Workers which exited are replaced by new ones. Recycled workers are stopped only when their
+        replacements are listening and are killed when they do not stop within `graceful_timeout`.
+
+        :param application: WSGI application, created before workers are forked.
+        :param (socket.socket) sock: Socket created with `create_socket`.
+        :param (int) workers: Number of worker processes.
+        :param (bool) reuse_port: Workers bind their own sockets with SO_REUSEPORT.
+        :param (int) max_requests: Requests served by a worker before it is recycled. Default: no limit.
+        :param (float) timeout: Connection socket timeout of workers in seconds.
+        :param (float) graceful_timeout: Time in seconds after which stopped workers are killed.
+        """
+        self.application = application
+        self.sock = sock
+        self.workers = workers
+        self.reuse_port = reuse_port
+        self.max_requests = max_requests
+        self.timeout = timeout
+        self.graceful_timeout = graceful_timeout
+        self.pids = set()
+        self.ready = set()
+        self.retiring = set()
+        # Time after which stopped worker is killed, by pid
+        self.stopping = {}
+        self.signals = []
+        self.pipe = None
+        self.buffer = b''
+
+    def on_signal(self, signum, frame):
+        self.signals.append(signum)
+
+    def spawn(self):
+        pid = os.fork()
+
+        if pid:
+            self.pids.add(pid)
+            return pid
+
+        exit_code = 0
+
+        try:
+            os.close(self.pipe[0])
+            Worker(
+                self.application, self.sock, self.pipe[1], self.reuse_port, self.max_requests, self.timeout
+            ).run()
+        except Exception:
+            logging.exception('Worker {} failed'.format(os.getpid()))
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def kill(self, pids, signum=signal.SIGTERM):
+        for pid in pids:
+            try:
+                os.kill(pid, signum)
+            except OSError as error:
+                if error.errno != errno.ESRCH:
+                    raise
+
+    def reap(self):
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except OSError as error:
+                if error.errno == errno.ECHILD:
+                    return
+                raise
+
+            if not pid:
+                return
+
+            self.pids.discard(pid)
+            self.ready.discard(pid)
+            self.retiring.discard(pid)
+            self.stopping.pop(pid, None)
+
+    def read_messages(self, timeout):
+        try:
+            readable = select.select([self.pipe[0]], [], [], timeout)[0]
+        except (select.error, OSError) as error:
+            if error.args[0] != errno.EINTR:
+                raise
+            return
+
+        if readable:
+            self.buffer += os.read(self.pipe[0], Worker.MESSAGE.size * 512)
+
+        size = Worker.MESSAGE.size
+
+        while len(self.buffer) >= size:
+            message, pid = Worker.MESSAGE.unpack(self.buffer[:size])
+            self.buffer = self.buffer[size:]
+
+            if message == Worker.RETIRE and pid in self.pids:
+                self.retiring.add(pid)
+            elif message == Worker.READY:
+                self.ready.add(pid)
+
+                if self.retiring:
+                    retired = self.retiring.pop()
+                    self.stopping[retired] = time.time() + self.graceful_timeout
+                    self.kill([retired])
+
+    def kill_late(self):
+        """
+        Kills stopped workers which did not exit within graceful timeout.
+        """
+        now = time.time()
+        late = [pid for pid, deadline in self.stopping.items() if deadline <= now]
+
+        if late:
+            logging.warning('Killing workers {} which did not stop in time'.format(late))
+            self.kill(late, signal.SIGKILL)
+
+    def run(self):
+        self.pipe = os.pipe()
+
+        # Objects created before fork are not tracked by garbage collector, so workers do not touch their pages.
+        if hasattr(gc, 'freeze'):
+            gc.freeze()
+
+        for signum in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self.on_signal)
+
+        while True:
+            self.reap()
+
+            self.kill_late()
+
+            while len(self.pids - self.retiring - set(self.stopping)) < self.workers:
+                self.spawn()
+
+            while self.signals:
+                if self.signals.pop(0) != signal.SIGHUP:
+                    return self.stop()
+
+                logging.info('Recycling workers')
+                # Workers which are not ready yet were just started and have no signal handlers
+                self.retiring.update(self.ready - set(self.stopping))
+
+            self.read_messages(timeout=0.1)
+
+    def stop(self):
+        logging.info('Stopping workers')
+        self.kill(self.pids)
+
+        deadline = time.time() + self.graceful_timeout
+
+        while self.pids and time.time() < deadline:
+            self.reap()
+            time.sleep(0.05)
+
+            # Workers started just before stop could miss the signal before they installed handlers
+            self.kill(self.pids - self.ready)
+
+        self.kill(self.pids, signal.SIGKILL)
+        self.sock.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m alexa_skill.serve', description='Serves Alexa skill.')
+    parser.add_argument('skill', help='Skill or router as module:attribute, e.g. main:skill')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--path', default=None, help='Path of fulfiller webhook. Default: any path.')
+    parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count())
+    parser.add_argument('--max-requests', type=int, default=0, help='Recycle worker after that many requests.')
+    parser.add_argument('--timeout', type=float, default=10, help='Close idle connections after seconds.')
+    parser.add_argument('--graceful-timeout', type=float, default=10,
+                        help='Kill workers which do not stop within seconds.')
+    parser.add_argument('--no-reuse-port', dest='reuse_port', action='store_false', default=REUSE_PORT,
+                        help='Accept connections on one socket shared by workers.')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='[%(process)d] %(levelname)s %(message)s')
+    sys.path.insert(0, os.getcwd())
+
+    application = WSGIApplication(load(args.skill), path=args.path)
+    sock = create_socket(args.host, args.port, reuse_port=args.reuse_port)
+    host, port = sock.getsockname()[:2]
+
+    logging.info('Listening on http://{}:{} with {} workers'.format(host, port, args.workers))
+
+    Arbiter(
+        application, sock, args.workers, args.reuse_port, args.max_requests, args.timeout, args.graceful_timeout
+    ).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import logging
+import sys
+
+from alexa_skill import messages
+from alexa_skill.router import UnknownApplication
+
+if sys.version_info >= (3, 5):
+    from alexa_skill.aio import ASGIApplication  # noqa: F401
+
+_NOT_FOUND = ('404 Not Found', [('Content-Type', 'text/plain'), ('Content-Length', '0')])
+_METHOD_NOT_ALLOWED = ('405 Method Not Allowed', [('Allow', 'POST'), ('Content-Length', '0')])
+_BAD_REQUEST = ('400 Bad Request', [('Content-Type', 'text/plain'), ('Content-Length', '0')])
+
+
+class WSGIApplication(object):
+    def __init__(self, skill, path=None, verifier=None):
+        """
+        Creates WSGI application which serves skill without any web framework.
+
+        Request body is read once, decoded and dispatched straight to the skill, encoded response is returned
+        with precomputed headers.
+
+        :param (alexa_skill.Skill) skill: Skill which handles requests, should be created once at startup.
+            Can be :class:`alexa_skill.router.SkillRouter`, requests of unknown applications get 400.
+        :param (str) path: Path of fulfiller webhook, e.g. /v1/alexa/fulfiller. Default: any path.
+        :param (alexa_skill.verify.Verifier) verifier: Verifies that requests were sent by Alexa, requests
+            which fail verification get 400. Default: requests are not verified.
+
+        Example:
+            application = WSGIApplication(skill, path='/v1/alexa/fulfiller')
+        """
+        self.skill = skill
+        self.path = path
+        self.verifier = verifier
+
+    def __call__(self, environ, start_response):
+        if self.path is not None and environ.get('PATH_INFO') != self.path:
+            start_response(*_NOT_FOUND)
+            return [b'']
+
+        if environ['REQUEST_METHOD'] != 'POST':
+            start_response(*_METHOD_NOT_ALLOWED)
+            return [b'']
+
+        try:
+            length = int(environ.get('CONTENT_LENGTH') or 0)
+            body = environ['wsgi.input'].read(length)
+            request_body = messages.loads(body)
+
+            if self.verifier is not None:
+                self.verifier.verify(
+                    body,
+                    request_body,
+                    environ.get('HTTP_SIGNATURECERTCHAINURL'),
+                    environ.get('HTTP_SIGNATURE'),
+                    environ.get('HTTP_SIGNATURE_256'),
+                )
+        except ValueError:
+            start_response(*_BAD_REQUEST)
+            return [b'']
+
+        try:
+            json_response, handled = self.skill.handle(request_body)
+        except UnknownApplication:
+            start_response(*_BAD_REQUEST)
+            return [b'']
+
+        logging.info('Response was handled by system: {}'.format(handled))
+
+        body = messages.dumps(json_response)
+        start_response('200 OK', [('Content-Type', 'application/json'), ('Content-Length', str(len(body)))])
+
+        return [body]
@@ -0,0 +1,131 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Compact codec for session attributes.
+
+Alexa sends session attributes returned by the skill back with every request of the session, so large state
+costs bandwidth and decoding time on each turn. `encode(attributes)` packs attributes bigger than `threshold`
+bytes into one key with zlib compressed msgpack (when installed, `pip install msgpack`) or JSON in base64.
+`decode(attributes)` reverses it and returns attributes which are not compact unchanged.
+"""
+import base64
+import zlib
+
+from alexa_skill import codec
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+COMPACT_KEY = '_z'
+THRESHOLD = 512
+# Compact attributes are sent by clients, so decompressed size is limited
+MAX_SIZE = 1 << 20
+
+
+def _json_loads(data):
+    return codec.loads(data)
+
+
+def _json_dumps(obj):
+    return codec.dumps(obj)
+
+
+def _msgpack_loads(data):
+    if msgpack is None:
+        raise ValueError('msgpack is required to decode session attributes')
+
+    return msgpack.unpackb(data, raw=False)
+
+
+def _msgpack_dumps(obj):
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+FORMATS = {
+    'json': (_json_loads, _json_dumps),
+    'msgpack': (_msgpack_loads, _msgpack_dumps),
+}
+
+
+def encode(attributes, threshold=THRESHOLD, fmt=None):
+    """
+    Packs session attributes into one compact key.
+
+    :param (dict) attributes: JSON serializable session attributes.
+    :param (int) threshold: Attributes which are smaller in JSON are returned unchanged.
+    :param (str) fmt: msgpack or json. Default: msgpack when installed.
+    :raises ValueError: When packed attributes are bigger than `MAX_SIZE`.
+    :return: Dict which should be returned as session attributes.
+    """
+    if not attributes:
+        return attributes
+
+    if fmt is None:
+        fmt = 'msgpack' if msgpack is not None else 'json'
+
+    plain = codec.dumps(attributes)
+
+    if len(plain) < threshold:
+        return attributes
+
+    packed = plain if fmt == 'json' else FORMATS[fmt][1](attributes)
+
+    if len(packed) > MAX_SIZE:
+        raise ValueError('Session attributes are bigger than {} bytes'.format(MAX_SIZE))
+
+    compact = '{}:{}'.format(fmt, base64.b64encode(zlib.compress(packed)).decode('ascii'))
+
+    if len(compact) >= len(plain):
+        return attributes
+
+    return {COMPACT_KEY: compact}
+
+
+def is_compact(attributes):
+    return isinstance(attributes, dict) and len(attributes) == 1 and COMPACT_KEY in attributes
+
+
+def decode(attributes):
+    """
+    Unpacks session attributes created by `encode`.
+
+    :param (dict) attributes: Session attributes from Alexa request.
+    :raises ValueError: When compact attributes are malformed or bigger than `MAX_SIZE` when decompressed.
+    :return: Dict with session attributes.
+    """
+    if not is_compact(attributes):
+        return attributes
+
+    try:
+        fmt, data = attributes[COMPACT_KEY].split(':', 1)
+        loads = FORMATS[fmt][0]
+        decompressor = zlib.decompressobj()
+        packed = decompressor.decompress(base64.b64decode(data), MAX_SIZE)
+    except (AttributeError, KeyError, TypeError, ValueError, zlib.error):
+        raise ValueError('Malformed compact session attributes')
+
+    if decompressor.unconsumed_tail:
+        raise ValueError('Compact session attributes are bigger than {} bytes'.format(MAX_SIZE))
+
+    return loads(packed)
@@ -0,0 +1,198 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import logging
+
+from alexa_skill import deadlines
+from alexa_skill import messages
+from alexa_skill.request import AlexaRequest
+
+
+def accepts_argument(handler, name):
+    """
+    Checks whether handler can be called with keyword argument.
+    """
+    # inspect is slow to import and is needed only when skill is created
+    import inspect
+
+    if not hasattr(inspect, 'signature'):  # Python 2
+        try:
+            spec = inspect.getargspec(handler)
+        except TypeError:
+            return False
+
+        return name in spec.args or spec.keywords is not None
+
+    try:
+        parameters = inspect.signature(handler).parameters
+    except (TypeError, ValueError):
+        return False
+
+    return name in parameters or any(
+        parameter.kind == parameter.VAR_KEYWORD for parameter in parameters.values()
+    )
+
+
+class Skill(object):
+    # User store which is flushed when session ends, see :class:`alexa_skill.storage.UserStore`
+    store = None
+
+    def __init__(self, buildin_intents, launch_message, session_end_message, *intents):
+        """
+        Creates long-lived Alexa skill which compiles all intents into one dispatch table.
+
+        Unlike :class:`alexa_skill.Processor`, which is created for every request, skill should be created once
+        at application startup and reused by calling :meth:`handle` with each Alexa request body.
+
+        :param (intents.buildins.BuildInIntents) buildin_intents: Instance of intents class which handles
+            Alexa buildin intents
+        :param (str) launch_message: Welcoming intent which will be fired on start for all users
+        :param (str) session_end_message: Session end message which will be fired at the end of session.
+        :param (list) *intents: List of additional intent classes which will handle user responses.
+
+        :raises ValueError: When intent is handled by many intents classes, intent name is missing or intent
+            has no handler.
+
+        Note:
+            Intents classes should inherit from alexa_skill.intents.Base.
+            Buildin intents take precedence over custom intents registered with the same name.
+            Custom intents handlers are called with `slots` keyword argument when intent has slots and
+            with `request` keyword argument (:class:`alexa_skill.request.AlexaRequest`) when they accept it.
+            Handlers with deadline (see :func:`alexa_skill.deadlines.deadline`) are answered with buildin
+            `Timeout` intent response when they are late.
+        """
+        self.buildin_intents = buildin_intents
+        self.launch_message = launch_message
+        self.session_end_message = session_end_message
+
+        dispatch = {}
+
+        for intent in intents:
+            for intent_name, handler in intent.mapper.items():
+                self.check_handler(intent, intent_name, handler)
+
+                if intent_name in dispatch:
+                    raise ValueError('Intent {} is handled by both {!r} and {!r}'.format(
+                        intent_name, dispatch[intent_name][0], handler
+                    ))
+
+                dispatch[intent_name] = (
+                    handler, True, accepts_argument(handler, 'request'),
+                    getattr(handler, 'deadline', getattr(intent, 'default_deadline', None)),
+                )
+
+        for intent_name, handler in buildin_intents.mapper.items():
+            self.check_handler(buildin_intents, intent_name, handler)
+            dispatch[intent_name] = (handler, False, False, None)
+
+        if 'NotHandled' not in dispatch:
+            raise ValueError('Buildin intents have no NotHandled handler')
+
+        self.not_handled = dispatch.pop('NotHandled')[0]
+        self.timed_out = dispatch.pop('Timeout', (self.not_handled,))[0]
+        self.intents_mapper = dispatch
+        self.scheduler = deadlines.default_scheduler
+
+        self.request_types = {
+            'IntentRequest': self.intent_request,
+            'LaunchRequest': self.launch_request,
+            'SessionEndedRequest': self.session_end_request,
+        }
+
+    @staticmethod
+    def check_handler(intent, intent_name, handler):
+        if not intent_name:
+            raise ValueError('Intent name of {!r} in {} is missing'.format(handler, type(intent).__name__))
+
+        if not callable(handler):
+            raise ValueError('Intent {} in {} has no handler'.format(intent_name, type(intent).__name__))
+
+    def handle(self, request_body):
+        """
+        Handles Alexa request.
+
+        :param (dict) request_body: Alexa request body which was send to fulfiller webhook.
+
+        Returns a list with:
+            0: message for user
+            1: bool: True when alexa request was handled by Backend
+        """
+        return self.handle_request(AlexaRequest(request_body))
+
+    def handle_request(self, request):
+        """
+        Handles Alexa request which was already wrapped, e.g. by :class:`alexa_skill.router.SkillRouter`.
+
+        :param (alexa_skill.request.AlexaRequest) request: Alexa request.
+        """
+        return self.request_types[request.request_type](request)
+
+    def session_end_request(self, request):
+        if self.store is not None:
+            try:
+                self.store.flush()
+            except Exception:
+                # Updates are kept pending and saved with the next batch
+                logging.exception('User store was not flushed')
+
+        message = messages.create_response(self.session_end_message, should_end_session=True)
+
+        return message, True
+
+    def launch_request(self, request):
+        message = messages.create_response(self.launch_message, should_end_session=False)
+
+        return message, True
+
+    def intent_request(self, request):
+        intent_name = request.intent_name
+
+        try:
+            handler, with_slots, with_request, deadline = self.intents_mapper[intent_name]
+        except KeyError:
+            logging.error('Intent name: {} not handled'.format(intent_name))
+            return self.not_handled()
+
+        kwargs = self.handler_kwargs(request, with_slots, with_request)
+
+        try:
+            if deadline is None:
+                return handler(**kwargs)
+
+            return self.scheduler.call(handler, kwargs, deadline)
+        except deadlines.DeadlineExceeded:
+            logging.error('Intent name: {} exceeded deadline of {} s'.format(intent_name, deadline))
+            return self.timed_out()
+        except (ValueError, KeyError):
+            logging.error('Intent name: {} not handled'.format(intent_name))
+            return self.not_handled()
+
+    @staticmethod
+    def handler_kwargs(request, with_slots, with_request):
+        kwargs = {}
+
+        if with_slots and request.slots:
+            kwargs['slots'] = request.slots
+
+        if with_request:
+            kwargs['request'] = request
+
+        return kwargs
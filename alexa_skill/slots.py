@@ -0,0 +1,165 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+from alexa_skill import temporal
+from alexa_skill.dates import AmazonDateParser
+from alexa_skill.request import cached_field
+
+
+class Slot(dict):
+    """
+    Alexa intent slot.
+
+    Slot is the raw slot dictionary of Alexa request, e.g. slot['value'], with typed values which are parsed
+    once, when they are used for the first time.
+
+    Alexa API Reference:
+        https://developer.amazon.com/docs/custom-skills/request-types-reference.html#slot-object
+    """
+    __slots__ = ('_resolution', '_date', '_number', '_time', '_duration')
+
+    def __init__(self, raw=None):
+        """
+        :param (dict) raw: Slot object of Alexa request.
+        """
+        super(Slot, self).__init__(raw or {})
+
+    def __repr__(self):
+        return 'Slot({})'.format(dict.__repr__(self))
+
+    @property
+    def name(self):
+        return self.get('name')
+
+    @property
+    def value(self):
+        """
+        Value spoken by user, None when slot was not filled.
+        """
+        return self.get('value')
+
+    @property
+    def confirmation_status(self):
+        return self.get('confirmationStatus')
+
+    @cached_field
+    def resolution(self):
+        """
+        First value matched by entity resolution, a dict with `name` and `id`. None when value was not matched.
+        """
+        resolutions = (self.get('resolutions') or {}).get('resolutionsPerAuthority') or ()
+
+        for authority in resolutions:
+            if (authority.get('status') or {}).get('code') == 'ER_SUCCESS_MATCH' and authority.get('values'):
+                return authority['values'][0]['value']
+
+        return None
+
+    @property
+    def resolved_value(self):
+        """
+        Canonical value of custom slot type, otherwise value spoken by user.
+        """
+        if self.resolution is not None:
+            return self.resolution.get('name')
+
+        return self.value
+
+    @property
+    def resolved_id(self):
+        """
+        Id of canonical value of custom slot type, None when value was not matched.
+        """
+        if self.resolution is not None:
+            return self.resolution.get('id')
+
+        return None
+
+    @cached_field
+    def date(self):
+        """
+        AMAZON.DATE value as a tuple with date and date type, see `AmazonDateParser.to_date`.
+        (None, None) when value is not a date.
+        """
+        if not self.value:
+            return None, None
+
+        try:
+            return AmazonDateParser.to_date(self.value)
+        except ValueError:
+            return None, None
+
+    @cached_field
+    def number(self):
+        """
+        AMAZON.NUMBER value as int or float, None when value is not a number, e.g. "?".
+        """
+        try:
+            return int(self.value)
+        except (TypeError, ValueError):
+            pass
+
+        try:
+            return float(self.value)
+        except (TypeError, ValueError):
+            return None
+
+    @cached_field
+    def time(self):
+        """
+        AMAZON.TIME value, None when value is not a time.
+
+        :rtype: alexa_skill.temporal.Time
+        """
+        return temporal.parse_time(self.value)
+
+    @cached_field
+    def duration(self):
+        """
+        AMAZON.DURATION value, None when value is not a duration.
+
+        :rtype: alexa_skill.temporal.Duration
+        """
+        return temporal.parse_duration(self.value)
+
+
+class Slots(dict):
+    """
+    Dictionary of intent slots by slot name.
+    """
+    __slots__ = ()
+
+    def __init__(self, raw=None):
+        """
+        :param (dict) raw: Slots object of Alexa intent.
+        """
+        super(Slots, self).__init__((name, Slot(slot)) for name, slot in (raw or {}).items())
+
+    def value(self, name, default=None):
+        """
+        Returns value spoken by user for slot, or default when slot is missing or was not filled.
+        """
+        slot = self.get(name)
+
+        if slot is None or slot.value is None:
+            return default
+
+        return slot.value
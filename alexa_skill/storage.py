@@ -0,0 +1,222 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Persistent storage of user data across sessions, keyed by Alexa user id.
+
+`UserStore` keeps recently used users in process memory (read-through LRU cache) and writes changes behind:
+updates are collected and saved in one batch when `batch_size` users are changed, when a session ends
+(`SessionEndedRequest`) or when the store is closed. Most turns of a session do not touch the backend.
+
+Backends implement `load(user_id)` and `save(items)`, `SQLiteBackend` is built in.
+"""
+import os
+import sqlite3
+import threading
+
+from alexa_skill import codec
+from alexa_skill.cache import LRUCache
+
+_NOT_CACHED = object()
+
+
+class Backend(object):
+    """
+    Base class of user store backends.
+    """
+
+    def load(self, user_id):
+        """
+        Returns user data or None when user is not stored.
+
+        :param (str) user_id: Alexa user id.
+        :rtype: dict
+        """
+        raise NotImplementedError
+
+    def save(self, items):
+        """
+        Stores many users at once.
+
+        :param (dict) items: User data by user id.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class SQLiteBackend(Backend):
+    """
+    Stores JSON encoded user data in SQLite database.
+
+    Connection is opened on first use in each process, so backend can be created before workers are forked.
+    """
+
+    def __init__(self, path=':memory:', table='users'):
+        """
+        :param (str) path: Path of database file.
+        :param (str) table: Name of the table, it is created when missing.
+        """
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+
+    @property
+    def connection(self):
+        if self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS {} (user_id TEXT PRIMARY KEY, data BLOB NOT NULL)'.format(self.table)
+            )
+            self._connection.commit()
+            self._pid = os.getpid()
+
+        return self._connection
+
+    def load(self, user_id):
+        with self._lock:
+            row = self.connection.execute(
+                'SELECT data FROM {} WHERE user_id = ?'.format(self.table), (user_id,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return codec.loads(bytes(row[0]))
+
+    def save(self, items):
+        rows = [(user_id, sqlite3.Binary(codec.dumps(data))) for user_id, data in items.items()]
+
+        with self._lock:
+            with self.connection:
+                self.connection.executemany(
+                    'INSERT OR REPLACE INTO {} (user_id, data) VALUES (?, ?)'.format(self.table), rows
+                )
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+
+            self._connection = None
+            self._pid = None
+
+
+class UserStore(object):
+    """
+    User data store with in-process LRU cache and write-behind batching.
+
+    :ivar (alexa_skill.cache.LRUCache) cache: Recently used users, including users which are not stored.
+    :ivar (int) loads: Number of users loaded from backend.
+    :ivar (int) saves: Number of batches saved to backend.
+    """
+
+    def __init__(self, backend=None, maxsize=1024, batch_size=100):
+        """
+        :param (Backend) backend: Backend which stores users. Default: in-memory SQLite database.
+        :param (int) maxsize: Maximum number of users cached in process memory.
+        :param (int) batch_size: Number of changed users which are saved at once.
+        """
+        self.backend = backend if backend is not None else SQLiteBackend()
+        self.batch_size = batch_size
+        self.cache = LRUCache(maxsize)
+        self.loads = 0
+        self.saves = 0
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def get(self, user_id, default=None):
+        """
+        Returns user data, loads it from backend when user is not cached.
+
+        Returned dict is shared with other requests of the user, changes are stored only by :meth:`set`.
+
+        :param (str) user_id: Alexa user id, e.g. `request.user_id`.
+        :param default: Returned when user is not stored.
+        """
+        with self._lock:
+            data = self._pending.get(user_id, _NOT_CACHED)
+
+        if data is _NOT_CACHED:
+            data = self.cache.get(user_id, _NOT_CACHED)
+
+        if data is _NOT_CACHED:
+            loaded = self.backend.load(user_id)
+            self.loads += 1
+
+            # User could be updated while it was loaded, newer data is kept
+            with self._lock:
+                data = self._pending.get(user_id, _NOT_CACHED)
+
+                if data is _NOT_CACHED:
+                    data = self.cache.setdefault(user_id, loaded)
+
+        return default if data is None else data
+
+    def set(self, user_id, data):
+        """
+        Updates user data, it is saved with the next batch.
+
+        :param (str) user_id: Alexa user id.
+        :param (dict) data: JSON serializable user data.
+        """
+        with self._lock:
+            self.cache.set(user_id, data)
+            self._pending[user_id] = data
+            full = len(self._pending) >= self.batch_size
+
+        if full:
+            self.flush()
+
+    def flush(self):
+        """
+        Saves all pending updates in one batch.
+
+        Updates are kept pending when backend fails, so they are saved with the next batch.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return
+
+        try:
+            self.backend.save(pending)
+        except Exception:
+            with self._lock:
+                pending.update(self._pending)
+                self._pending = pending
+            raise
+
+        self.saves += 1
+
+    def close(self):
+        """
+        Saves pending updates and closes backend.
+        """
+        self.flush()
+        self.backend.close()
@@ -0,0 +1,183 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import collections
+import datetime
+import re
+
+from alexa_skill.cache import LRUCache
+
+# Times mapped to day parts returned by Alexa in AMAZON.TIME slots.
+DAY_PARTS = {
+    'MO': (8, 30),  # morning
+    'AF': (13, 00),  # afternoon
+    'AV': (13, 00),  # afternoon, kept for backward compatibility
+    'EV': (18, 00),  # evening
+    'NI': (21, 00),  # night
+}
+
+_TIME_PATTERN = re.compile(
+    r'^(?:(?P<day_part>MO|AF|AV|EV|NI)|(?P<hour>\d{1,2}):(?P<minute>\d{1,2})(?::(?P<second>\d{1,2}))?)$'
+)
+
+_DURATION_PATTERN = re.compile(
+    r"""
+    ^P(?!$)
+    (?:(?P<years>\d+)Y)?
+    (?:(?P<months>\d+)M)?
+    (?:(?P<weeks>\d+)W)?
+    (?:(?P<days>\d+)D)?
+    (?:T(?=\d)
+        (?:(?P<hours>\d+)H)?
+        (?:(?P<minutes>\d+)M)?
+        (?:(?P<seconds>\d+(?:\.\d+)?)S)?
+    )?$
+    """,
+    re.VERBOSE
+)
+
+_MISSING = object()
+_times = LRUCache(maxsize=512)
+_durations = LRUCache(maxsize=512)
+
+
+class Time(collections.namedtuple('Time', ('hour', 'minute', 'second', 'day_part'))):
+    """
+    Time parsed from AMAZON.TIME slot.
+
+    :ivar (str) day_part: Day part code (MO, AF, EV, NI) when Alexa returned day part instead of time,
+        hour and minute are mapped with DAY_PARTS. Otherwise None.
+    """
+    __slots__ = ()
+
+    def to_time(self):
+        """
+        :rtype: datetime.time
+        """
+        return datetime.time(self.hour, self.minute, self.second)
+
+
+class Duration(collections.namedtuple(
+    'Duration', ('years', 'months', 'weeks', 'days', 'hours', 'minutes', 'seconds')
+)):
+    """
+    ISO-8601 duration parsed from AMAZON.DURATION slot, e.g. PT15M or P2DT3H.
+    """
+    __slots__ = ()
+
+    def to_timedelta(self):
+        """
+        :rtype: datetime.timedelta
+        :raises ValueError: When duration has years or months, which do not have fixed length.
+        """
+        if self.years or self.months:
+            raise ValueError('Duration with years or months can not be converted to timedelta')
+
+        return datetime.timedelta(
+            weeks=self.weeks, days=self.days, hours=self.hours, minutes=self.minutes, seconds=self.seconds
+        )
+
+
+def parse_time(amazon_time):
+    """
+    Parses AMAZON.TIME slot value. Parsed values are cached.
+
+    :param (str) amazon_time: Time, e.g. 11:30, 11:30:15 or day part: MO, AF, EV, NI.
+
+    :returns: Parsed time, otherwise None when amazon_time is not parsable.
+    :rtype: Time
+    """
+    try:
+        time = _times.get(amazon_time, _MISSING)
+    except TypeError:
+        return None
+
+    if time is _MISSING:
+        time = _parse_time(amazon_time)
+        _times.set(amazon_time, time)
+
+    return time
+
+
+def _parse_time(amazon_time):
+    try:
+        match = _TIME_PATTERN.match(amazon_time)
+    except TypeError:
+        return None
+
+    if match is None:
+        return None
+
+    day_part, hour, minute, second = match.groups()
+
+    if day_part:
+        hour, minute = DAY_PARTS[day_part]
+        return Time(hour, minute, 0, day_part)
+
+    hour, minute, second = int(hour), int(minute), int(second or 0)
+
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+
+    return Time(hour, minute, second, None)
+
+
+def parse_duration(amazon_duration):
+    """
+    Parses AMAZON.DURATION slot value. Parsed values are cached.
+
+    :param (str) amazon_duration: ISO-8601 duration, e.g. PT15M, P2DT3H, P1Y.
+
+    :returns: Parsed duration, otherwise None when amazon_duration is not parsable.
+    :rtype: Duration
+    """
+    try:
+        duration = _durations.get(amazon_duration, _MISSING)
+    except TypeError:
+        return None
+
+    if duration is _MISSING:
+        duration = _parse_duration(amazon_duration)
+        _durations.set(amazon_duration, duration)
+
+    return duration
+
+
+def _parse_duration(amazon_duration):
+    try:
+        match = _DURATION_PATTERN.match(amazon_duration)
+    except TypeError:
+        return None
+
+    if match is None:
+        return None
+
+    years, months, weeks, days, hours, minutes, seconds = match.groups()
+
+    if seconds and '.' in seconds:
+        seconds = float(seconds)
+    else:
+        seconds = int(seconds or 0)
+
+    return Duration(
+        int(years or 0), int(months or 0), int(weeks or 0), int(days or 0), int(hours or 0), int(minutes or 0),
+        seconds,
+    )
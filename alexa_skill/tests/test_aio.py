@@ -0,0 +1,248 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import asyncio
+import json
+import threading
+
+import pytest
+
+import alexa_skill
+from alexa_skill.aio import AsyncSkill
+from alexa_skill.aio import AsyncRetryCache
+from alexa_skill.aio import AsyncSkillRouter
+from alexa_skill.server import ASGIApplication
+from alexa_skill.intents import BaseIntents
+from alexa_skill.intents import BuildInIntents
+from alexa_skill.intents import deadline
+from alexa_skill.intents import intent
+from alexa_skill.tests.conftest import intent_request
+
+
+class ExampleIntents(BaseIntents):
+    @property
+    def mapper(self):
+        return {
+            'EXAMPLE.async': self.async_intent,
+            'EXAMPLE.sync': self.sync_intent,
+        }
+
+    async def async_intent(self, slots=None):
+        await asyncio.sleep(0)
+        return self.response(slots['name']['value']), True
+
+    def sync_intent(self):
+        return self.response(threading.current_thread().name), True
+
+
+@pytest.fixture
+def skill():
+    return AsyncSkill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', ExampleIntents())
+
+
+def handle(skill, request_body):
+    return asyncio.get_event_loop().run_until_complete(skill.handle(request_body))
+
+
+def test_async_skill_coroutine_intents(skill):
+    assert skill.coroutine_intents == {'EXAMPLE.async'}
+
+
+def test_async_skill_coroutine_handler(skill):
+    message, handled = handle(skill, intent_request('EXAMPLE.async', {'name': {'name': 'name', 'value': 'Joe'}}))
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>Joe</speak>'
+    assert handled is True
+
+
+def test_async_skill_sync_handler_runs_in_executor(skill):
+    message, handled = handle(skill, intent_request('EXAMPLE.sync'))
+
+    assert message['response']['outputSpeech']['ssml'] != '<speak>{}</speak>'.format(threading.current_thread().name)
+
+
+def test_async_skill_buildin_intent(skill):
+    message, handled = handle(skill, intent_request('AMAZON.StopIntent'))
+
+    assert message is skill.buildin_intents.stop_response
+
+
+def test_async_skill_not_handled(skill):
+    message, handled = handle(skill, intent_request('EXAMPLE.async', {'other': {'name': 'other'}}))
+
+    assert message is skill.buildin_intents.not_handled_response
+    assert handled is False
+
+
+def test_async_skill_launch_request(skill):
+    message, handled = handle(skill, {'request': {'type': 'LaunchRequest'}})
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>welcome</speak>'
+
+
+def test_async_skill_session_end_flushes_store_in_executor(skill):
+    flushed = []
+
+    class Store(object):
+        def flush(self):
+            flushed.append(threading.current_thread().name)
+
+    skill.store = Store()
+    message, handled = handle(skill, {'request': {'type': 'SessionEndedRequest'}})
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>bye</speak>'
+    assert len(flushed) == 1
+    assert flushed[0] != threading.current_thread().name
+
+
+def test_async_skill_router(skill):
+    router = AsyncSkillRouter({'amzn1.ask.skill.1': skill})
+    request_body = intent_request('EXAMPLE.async', {'name': {'name': 'name', 'value': 'Joe'}})
+    request_body['session'] = {'application': {'applicationId': 'amzn1.ask.skill.1'}}
+
+    message, handled = handle(router, request_body)
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>Joe</speak>'
+
+    application = ASGIApplication(router)
+    request_body['session']['application']['applicationId'] = 'amzn1.ask.skill.2'
+
+    assert call(application, json.dumps(request_body).encode('utf-8'))[0] == 400
+
+
+def call(application, body, method='POST', path='/'):
+    scope = {'type': 'http', 'method': method, 'path': path, 'headers': []}
+    chunks = [body[:3], body[3:]]
+    sent = []
+
+    async def receive():
+        chunk = chunks.pop(0)
+        return {'type': 'http.request', 'body': chunk, 'more_body': bool(chunks)}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.get_event_loop().run_until_complete(application(scope, receive, send))
+
+    return sent[0]['status'], dict(sent[0]['headers']), sent[1]['body']
+
+
+@pytest.mark.parametrize('skill_class', [AsyncSkill, alexa_skill.Skill])
+def test_asgi_application(skill_class):
+    skill = skill_class(BuildInIntents('help', 'not handled'), 'welcome', 'bye', ExampleIntents())
+    application = ASGIApplication(skill)
+
+    status, headers, body = call(application, json.dumps(intent_request('EXAMPLE.sync')).encode('utf-8'))
+
+    assert status == 200
+    assert headers[b'content-type'] == b'application/json'
+    assert headers[b'content-length'] == str(len(body)).encode('ascii')
+    assert json.loads(body.decode('utf-8'))['response']['shouldEndSession'] is True
+
+
+def test_asgi_application_errors(skill):
+    application = ASGIApplication(skill, path='/v1/alexa/fulfiller')
+
+    assert call(application, b'{}', path='/other')[0] == 404
+    assert call(application, b'', method='GET', path='/v1/alexa/fulfiller')[0] == 405
+    assert call(application, b'{not json', path='/v1/alexa/fulfiller')[0] == 400
+
+
+def test_asgi_application_lifespan(skill):
+    messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message['type'])
+
+    asyncio.get_event_loop().run_until_complete(ASGIApplication(skill)({'type': 'lifespan'}, receive, send))
+
+    assert sent == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
+
+
+class SlowIntents(BaseIntents):
+    @intent('EXAMPLE.slow_async')
+    @deadline(0.05)
+    async def slow_async(self):
+        await asyncio.sleep(1)
+        return self.response('late'), True
+
+    @intent('EXAMPLE.slow_sync')
+    @deadline(0.05)
+    def slow_sync(self):
+        threading.Event().wait(0.5)
+        return self.response('late'), True
+
+
+@pytest.mark.parametrize('intent_name', ['EXAMPLE.slow_async', 'EXAMPLE.slow_sync'])
+def test_async_skill_deadline_exceeded(intent_name):
+    skill = AsyncSkill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', SlowIntents())
+
+    message, handled = handle(skill, intent_request(intent_name))
+
+    assert message is skill.buildin_intents.timeout_response
+    assert handled is False
+
+
+def test_async_retry_cache():
+    calls = []
+
+    class BackendIntents(BaseIntents):
+        @intent('EXAMPLE.backend')
+        async def backend(self):
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return self.response('Backend answered'), True
+
+    skill = AsyncSkill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', BackendIntents())
+    retry_cache = AsyncRetryCache(skill)
+    request_body = intent_request('EXAMPLE.backend')
+    request_body['request']['requestId'] = 'amzn1.echo-api.request.1'
+
+    async def original_and_retries():
+        concurrent = await asyncio.gather(retry_cache.handle(request_body), retry_cache.handle(request_body))
+        return concurrent + [await retry_cache.handle(request_body)]
+
+    results = asyncio.get_event_loop().run_until_complete(original_and_retries())
+
+    assert len(calls) == 1
+    assert results[0] is results[1] is results[2]
+
+
+def test_asgi_application_verifier(skill):
+    from alexa_skill.verify import VerificationError
+
+    class Verifier(object):
+        def __init__(self):
+            self.headers = []
+
+        def verify(self, body, request_body, certificate_url, signature=None, signature_256=None):
+            self.headers.append((certificate_url, signature, signature_256))
+            raise VerificationError('Request signature is not valid')
+
+    verifier = Verifier()
+    application = ASGIApplication(skill, verifier=verifier)
+
+    assert call(application, json.dumps(intent_request('EXAMPLE.sync')).encode('utf-8'))[0] == 400
+    assert verifier.headers == [('', '', '')]
@@ -22,8 +22,10 @@
 import datetime
 
 import dateutil.tz
+import pytest
 
 from alexa_skill import dates as alexa_dates
+from alexa_skill import timezones
 
 
 def test_amazon_dates_normal_day():
@@ -38,14 +40,14 @@ def test_amazon_dates_weekend():
     date_value = '2017-W51-WE'   # "this weekend": 2015-W48-WE
     result, date_type = alexa_dates.AmazonDateParser.to_date(date_value)
 
-    assert result == datetime.datetime(2017, 12, 17).replace(tzinfo=dateutil.tz.gettz('Europe/Berlin'))
+    assert result == datetime.datetime(2017, 12, 24).replace(tzinfo=dateutil.tz.gettz('Europe/Berlin'))
 
 
 def test_amazon_dates_week():
     date_value = '2017-W51'  # "this week", "next week": 2015-W48
     result, date_type = alexa_dates.AmazonDateParser.to_date(date_value)
 
-    assert result == datetime.datetime(2017, 12, 17).replace(tzinfo=dateutil.tz.gettz('Europe/Berlin'))
+    assert result == datetime.datetime(2017, 12, 24).replace(tzinfo=dateutil.tz.gettz('Europe/Berlin'))
 
 
 def test_amazon_dates_english_week():
@@ -100,6 +102,12 @@ def test_amazon_time_evening():
     assert minute == 0
 
 
+def test_amazon_time_to_datetime():
+    result = alexa_dates.AmazonTimeParser.to_datetime('11:30', datetime.date(2018, 6, 1), 'UTC')
+
+    assert result == datetime.datetime(2018, 6, 1, 11, 30, tzinfo=dateutil.tz.UTC)
+
+
 def test_amazon_time_none():
     date_value = None
     time = alexa_dates.AmazonTimeParser.to_time(date_value)
@@ -112,3 +120,220 @@ def test_amazon_time_parsing_error():
     time = alexa_dates.AmazonTimeParser.to_time(date_value)
 
     assert time is None
+
+
+def test_amazon_dates_decade():
+    date_value = '201X'  # "this decade": 201X
+    result, date_type = alexa_dates.AmazonDateParser.to_date(date_value)
+
+    assert result == datetime.datetime(2010, 1, 1).replace(tzinfo=dateutil.tz.gettz('Europe/Berlin'))
+    assert date_type == 'decade'
+
+
+def test_amazon_dates_season():
+    date_value = '2017-WI'  # "next winter": 2017-WI
+    result, date_type = alexa_dates.AmazonDateParser.to_date(date_value)
+
+    assert result == datetime.datetime(2017, 12, 1).replace(tzinfo=dateutil.tz.gettz('Europe/Berlin'))
+    assert date_type == 'season'
+
+
+def test_amazon_dates_present():
+    date_value = 'PRESENT_REF'  # "now": PRESENT_REF
+    result, date_type = alexa_dates.AmazonDateParser.to_date(date_value)
+
+    assert abs(result - datetime.datetime.now(dateutil.tz.gettz('Europe/Berlin'))) < datetime.timedelta(seconds=5)
+    assert date_type == 'present'
+
+
+@pytest.mark.parametrize('date_value,expected', [
+    # ISO-8601 weeks: week 1 contains January 4th
+    ('2016-W01', datetime.datetime(2016, 1, 10)),
+    ('2017-W01', datetime.datetime(2017, 1, 8)),  # year starts on Sunday
+    ('2021-W01', datetime.datetime(2021, 1, 10)),
+    ('2018-W52', datetime.datetime(2018, 12, 30)),
+    ('2015-W53', datetime.datetime(2016, 1, 3)),
+    ('2020-W53', datetime.datetime(2021, 1, 3)),
+])
+def test_amazon_dates_week_numbers(date_value, expected):
+    result, date_type = alexa_dates.AmazonDateParser.to_date(date_value)
+
+    assert result == expected.replace(tzinfo=dateutil.tz.gettz('Europe/Berlin'))
+
+
+def test_amazon_dates_iso_week_period():
+    timezone = dateutil.tz.gettz('Europe/Berlin')
+    start, end = alexa_dates.AmazonDateParser.create_periods('2016-W01', timezone)
+
+    assert start == datetime.datetime(2016, 1, 4, tzinfo=timezone)
+    assert end == datetime.datetime(2016, 1, 10, tzinfo=timezone)
+
+
+@pytest.mark.parametrize('date_value', ['', 'tomorrow', '2018-1', '2018-W123', '2018-11-25-WE'])
+def test_amazon_dates_not_parsable(date_value):
+    assert alexa_dates.AmazonDateParser.to_date(date_value) == (None, None)
+
+
+@pytest.mark.parametrize('date_value', ['2018-13', '2018-02-30', '2018-W0', '2018-W53', '2018-W54'])
+def test_amazon_dates_invalid(date_value):
+    with pytest.raises(ValueError):
+        alexa_dates.AmazonDateParser.to_date(date_value)
+
+
+def test_amazon_dates_cache():
+    alexa_dates.AmazonDateParser.to_date('2018-11-25')
+
+    assert '2018-11-25' in alexa_dates.AmazonDateParser._cache
+
+
+def test_amazon_dates_timezone():
+    date_value = '2018-11-25'
+    result, date_type = alexa_dates.AmazonDateParser.to_date(date_value, timezone='America/New_York')
+
+    assert result == datetime.datetime(2018, 11, 25).replace(tzinfo=dateutil.tz.gettz('America/New_York'))
+    assert result.tzinfo is timezones.get('America/New_York')
+
+
+def test_amazon_dates_periods_timezone():
+    timezone = dateutil.tz.gettz('Asia/Tokyo')
+
+    start, end = alexa_dates.AmazonDateParser.create_periods('2018-06', timezone=timezone)
+
+    assert start == datetime.datetime(2018, 6, 1, tzinfo=timezone)
+    assert end == datetime.datetime(2018, 6, 30, tzinfo=timezone)
+
+
+@pytest.mark.parametrize('date_value,start,end', [
+    ('2018-06', datetime.datetime(2018, 6, 1), datetime.datetime(2018, 6, 30)),
+    ('2017-WI', datetime.datetime(2017, 12, 1), datetime.datetime(2018, 2, 28)),
+    ('2016-SU', datetime.datetime(2016, 6, 1), datetime.datetime(2016, 8, 31)),
+    ('2018', datetime.datetime(2018, 1, 1), datetime.datetime(2018, 12, 31)),
+    ('201X', datetime.datetime(2010, 1, 1), datetime.datetime(2019, 12, 31)),
+])
+def test_amazon_dates_periods(date_value, start, end):
+    timezone = dateutil.tz.gettz('Europe/Berlin')
+
+    assert alexa_dates.AmazonDateParser.create_periods(date_value) == (
+        start.replace(tzinfo=timezone), end.replace(tzinfo=timezone)
+    )
+
+
+def test_parse_many():
+    numpy = pytest.importorskip('numpy')
+    today = datetime.datetime(2018, 6, 6, 12, 0)
+
+    starts, ends, codes = alexa_dates.parse_many(
+        ['2018-06', 'tomorrow', '2018-02-30', '2018-06', 'PRESENT_REF', '2018-W23-WE'], today=today
+    )
+
+    assert starts.dtype == numpy.dtype('datetime64[s]')
+    assert list(codes) == [
+        alexa_dates.DATE_TYPE_CODES['month'], 0, 0, alexa_dates.DATE_TYPE_CODES['month'],
+        alexa_dates.DATE_TYPE_CODES['present'], alexa_dates.DATE_TYPE_CODES['weekend'],
+    ]
+    assert starts[0] == starts[3] == numpy.datetime64('2018-06-01T00:00:00')
+    assert ends[0] == numpy.datetime64('2018-06-30T00:00:00')
+    assert numpy.isnat(starts[1]) and numpy.isnat(ends[2])
+    assert starts[4] == ends[4] == numpy.datetime64('2018-06-06T12:00:00')
+    assert starts[5] == numpy.datetime64('2018-06-09T00:00:00')
+    assert ends[5] == numpy.datetime64('2018-06-10T00:00:00')
+
+
+def test_parse_many_matches_create_periods():
+    numpy = pytest.importorskip('numpy')
+    values = ['2018-11-25', '2018-W47', '2018-SP', '2018', '201X']
+    timezone = dateutil.tz.gettz('Europe/Berlin')
+
+    starts, ends, codes = alexa_dates.parse_many(values, timezone=timezone)
+
+    for value, start, end in zip(values, starts, ends):
+        expected_start, expected_end = alexa_dates.AmazonDateParser.create_periods(value, timezone=timezone)
+
+        assert start == numpy.datetime64(expected_start.replace(tzinfo=None), 's')
+        assert end == numpy.datetime64(expected_end.replace(tzinfo=None), 's')
+
+
+def test_amazon_dates_periods_weekend_clock():
+    timezone = dateutil.tz.gettz('Europe/Berlin')
+    saturday_noon = alexa_dates.FixedClock(datetime.datetime(2018, 6, 9, 12, 0))
+    friday = alexa_dates.FixedClock(datetime.datetime(2018, 6, 8, 12, 0))
+
+    start, end = alexa_dates.AmazonDateParser.create_periods('2018-W23-WE', clock=saturday_noon)
+
+    assert start == datetime.datetime(2018, 6, 9, 12, 0, tzinfo=timezone)
+    assert end == datetime.datetime(2018, 6, 10, tzinfo=timezone)
+
+    start, end = alexa_dates.AmazonDateParser.create_periods('2018-W23-WE', clock=friday)
+
+    assert start == datetime.datetime(2018, 6, 9, tzinfo=timezone)
+
+
+def test_amazon_dates_periods_present_clock():
+    clock = alexa_dates.FixedClock(datetime.datetime(2018, 6, 9, 10, 0, tzinfo=dateutil.tz.UTC))
+
+    start, end = alexa_dates.AmazonDateParser.create_periods('PRESENT_REF', timezone='Europe/Berlin', clock=clock)
+
+    assert start == end == clock.current
+    assert start.tzinfo is timezones.get('Europe/Berlin')
+
+
+def test_amazon_dates_periods_cache_cleared_at_midnight():
+    parser = alexa_dates.AmazonDateParser
+    evening = alexa_dates.FixedClock(datetime.datetime(2030, 6, 9, 23, 59))
+    midnight = alexa_dates.FixedClock(datetime.datetime(2030, 6, 10, 0, 0))
+
+    parser.create_periods('2018-06', clock=evening)
+    key = ('2018-06', id(timezones.get()), datetime.date(2030, 6, 9))
+
+    assert key in parser._periods
+
+    parser.create_periods('2018-06', clock=midnight)
+
+    assert key not in parser._periods
+    assert ('2018-06', id(timezones.get()), datetime.date(2030, 6, 10)) in parser._periods
+
+    parser._periods.clear()
+    parser._periods_day = datetime.date.min
+
+
+@pytest.mark.parametrize('date_slot,time_slot,start,end', [
+    ('2018-06-08', None, datetime.datetime(2018, 6, 8), datetime.datetime(2018, 6, 9)),
+    ('2018-06-08', 'EV', datetime.datetime(2018, 6, 8, 17), datetime.datetime(2018, 6, 8, 21)),
+    ('2018-06-08', 'NI', datetime.datetime(2018, 6, 8, 21), datetime.datetime(2018, 6, 9)),
+    ('2018-06-08', '19:45', datetime.datetime(2018, 6, 8, 19, 45), datetime.datetime(2018, 6, 8, 19, 45)),
+    (None, 'MO', datetime.datetime(2018, 6, 6, 5), datetime.datetime(2018, 6, 6, 12)),
+    ('PRESENT_REF', '20:00', datetime.datetime(2018, 6, 6, 20), datetime.datetime(2018, 6, 6, 20)),
+    ('2018-06', 'EV', datetime.datetime(2018, 6, 1), datetime.datetime(2018, 7, 1)),
+    ('2018-W23-WE', None, datetime.datetime(2018, 6, 9), datetime.datetime(2018, 6, 11)),
+])
+def test_resolve(date_slot, time_slot, start, end):
+    timezone = dateutil.tz.gettz('Europe/Berlin')
+    clock = alexa_dates.FixedClock(datetime.datetime(2018, 6, 6, 12, 0))
+
+    result = alexa_dates.resolve(date_slot, time_slot, timezone=timezone, clock=clock)
+
+    assert result == (start.replace(tzinfo=timezone), end.replace(tzinfo=timezone))
+
+
+def test_resolve_present():
+    clock = alexa_dates.FixedClock(datetime.datetime(2018, 6, 6, 12, 0))
+
+    start, end = alexa_dates.resolve('PRESENT_REF', clock=clock)
+
+    assert start == end == datetime.datetime(2018, 6, 6, 12, 0, tzinfo=timezones.get())
+
+
+def test_resolve_timezone():
+    timezone = dateutil.tz.gettz('America/New_York')
+    clock = alexa_dates.FixedClock(datetime.datetime(2018, 6, 6, 2, 0, tzinfo=dateutil.tz.UTC))
+
+    start, end = alexa_dates.resolve(None, '10:00', timezone=timezone, clock=clock)
+
+    assert start == datetime.datetime(2018, 6, 5, 10, 0, tzinfo=timezone)
+
+
+@pytest.mark.parametrize('date_slot,time_slot', [
+    ('tomorrow', None), ('2018-06-08', '11:dwa'), ('2018-02-30', None), ('2018-W60', '10:00'), ('2018-06-08', '25:00'),
+])
+def test_resolve_not_parsable(date_slot, time_slot):
+    assert alexa_dates.resolve(date_slot, time_slot) == (None, None)
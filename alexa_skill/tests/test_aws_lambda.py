@@ -0,0 +1,73 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import alexa_skill
+from alexa_skill import timezones
+from alexa_skill.intents import BaseIntents
+from alexa_skill.intents import BuildInIntents
+from alexa_skill.intents import intent
+from alexa_skill.messages import ResponseTemplate
+from alexa_skill.tests.conftest import intent_request
+
+
+class ExampleIntents(BaseIntents):
+    template = ResponseTemplate(card_title='Example', should_end_session=True)
+
+    @intent('EXAMPLE.hello')
+    def hello(self):
+        return self.template.render('Hello'), True
+
+
+def create_skill():
+    return alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', ExampleIntents())
+
+
+def test_lambda_handler():
+    handler = alexa_skill.lambda_handler(create_skill)
+
+    response = handler({'request': {'type': 'LaunchRequest'}}, None)
+
+    assert response['response']['outputSpeech']['ssml'] == '<speak>welcome</speak>'
+    assert handler.init_duration > 0
+    assert isinstance(handler.skill, alexa_skill.Skill)
+
+
+def test_lambda_handler_encoded_response():
+    handler = alexa_skill.lambda_handler(create_skill())
+
+    response = handler(intent_request('EXAMPLE.hello'))
+
+    assert response['response']['outputSpeech']['ssml'] == '<speak>Hello</speak>'
+    assert response['response']['card']['title'] == 'Example'
+
+
+def test_lambda_handler_prepared_response():
+    handler = alexa_skill.lambda_handler(create_skill)
+
+    assert handler(intent_request('AMAZON.HelpIntent')) is handler.skill.buildin_intents.help_response
+
+
+def test_lambda_handler_warm_up_timezones(monkeypatch):
+    monkeypatch.setattr(timezones, '_timezones', {})
+
+    alexa_skill.lambda_handler(create_skill, timezones=['Europe/Warsaw'])
+
+    assert list(timezones._timezones) == ['Europe/Warsaw']
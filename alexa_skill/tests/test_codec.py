@@ -0,0 +1,58 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import pytest
+
+from alexa_skill import codec
+
+
+@pytest.fixture(params=sorted(codec.BACKENDS))
+def backend(request):
+    previous = codec.backend
+    codec.use(request.param)
+    yield request.param
+    codec.use(previous)
+
+
+def test_codec_default_backend():
+    assert codec.backend in codec.BACKENDS
+    assert codec.BACKENDS['json']
+
+
+def test_codec_round_trip(backend):
+    message = {'response': {'outputSpeech': {'type': 'SSML', 'ssml': u'<speak>Gr\u00fc\u00df dich</speak>'}}, 'version': '1.0'}
+
+    body = codec.dumps(message)
+
+    assert isinstance(body, bytes)
+    assert b', ' not in body and b': ' not in body
+    assert codec.loads(body) == message
+    assert codec.loads(body.decode('utf-8')) == message
+
+
+def test_codec_invalid_json(backend):
+    with pytest.raises(ValueError):
+        codec.loads(b'{not json')
+
+
+def test_codec_unknown_backend():
+    with pytest.raises(ValueError):
+        codec.use('simplejson-unknown')
@@ -0,0 +1,190 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import threading
+import time
+
+import pytest
+
+import alexa_skill
+from alexa_skill.deadlines import DeadlineExceeded
+from alexa_skill.deadlines import Scheduler
+from alexa_skill.intents import BaseIntents
+from alexa_skill.intents import BuildInIntents
+from alexa_skill.intents import deadline
+from alexa_skill.intents import intent
+from alexa_skill.tests.conftest import intent_request
+
+
+class SlowIntents(BaseIntents):
+    def __init__(self):
+        self.released = threading.Event()
+
+    @intent('EXAMPLE.fast')
+    @deadline(1)
+    def fast(self):
+        return self.response(threading.current_thread().name), True
+
+    @intent('EXAMPLE.slow')
+    @deadline(0.05)
+    def slow(self):
+        self.released.wait(1)
+        return self.response('late'), True
+
+    @intent('EXAMPLE.failing')
+    @deadline(1)
+    def failing(self):
+        raise ValueError('Backend error')
+
+
+class BudgetIntents(BaseIntents):
+    default_deadline = 0.05
+
+    @intent('EXAMPLE.budget')
+    def budget(self):
+        time.sleep(0.5)
+        return self.response('late'), True
+
+    @intent('EXAMPLE.quick')
+    @deadline(1)
+    def quick(self):
+        return self.response('quick'), True
+
+
+@pytest.fixture
+def skill():
+    return alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', SlowIntents(), BudgetIntents())
+
+
+def test_deadline_decorator():
+    assert SlowIntents.slow.deadline == 0.05
+
+    with pytest.raises(ValueError):
+        deadline(0)
+
+
+def test_scheduler():
+    scheduler = Scheduler()
+
+    assert scheduler.call(lambda value: value * 2, {'value': 2}, 1) == 4
+    assert scheduler.call(lambda value: value * 3, {'value': 2}, 1) == 6
+
+    # Worker is reused when it is idle
+    assert scheduler.idle == 1
+
+
+def test_scheduler_error():
+    def fail():
+        raise KeyError('missing')
+
+    with pytest.raises(KeyError):
+        Scheduler().call(fail, {}, 1)
+
+
+def test_scheduler_deadline_exceeded():
+    released = threading.Event()
+
+    with pytest.raises(DeadlineExceeded):
+        Scheduler().call(released.wait, {'timeout': 1}, 0.01)
+
+    released.set()
+
+
+def test_scheduler_saturated():
+    scheduler = Scheduler(max_workers=2)
+    released = threading.Event()
+
+    for _ in range(2):
+        with pytest.raises(DeadlineExceeded):
+            scheduler.call(released.wait, {'timeout': 1}, 0.01)
+
+    started = time.time()
+
+    with pytest.raises(DeadlineExceeded):
+        scheduler.call(released.wait, {'timeout': 1}, 1)
+
+    assert time.time() - started < 0.5
+    assert scheduler.workers == 2
+
+    released.set()
+
+    while scheduler.idle < 2:
+        time.sleep(0.01)
+
+    assert scheduler.call(lambda: 'done', {}, 1) == 'done'
+    assert scheduler.workers == 2
+
+
+def test_skill_deadline(skill):
+    message, handled = skill.handle(intent_request('EXAMPLE.fast'))
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>alexa-skill-deadline</speak>'
+
+
+def test_skill_deadline_exceeded(skill):
+    started = time.time()
+
+    message, handled = skill.handle(intent_request('EXAMPLE.slow'))
+
+    assert time.time() - started < 0.5
+    assert message is skill.buildin_intents.timeout_response
+    assert handled is False
+
+    skill.intents_mapper['EXAMPLE.slow'][0].__self__.released.set()
+
+
+def test_skill_class_deadline(skill):
+    message, handled = skill.handle(intent_request('EXAMPLE.budget'))
+
+    assert message is skill.buildin_intents.timeout_response
+
+    # Decorator takes precedence over class default
+    assert skill.intents_mapper['EXAMPLE.budget'][3] == 0.05
+    assert skill.intents_mapper['EXAMPLE.quick'][3] == 1
+
+
+def test_skill_deadline_handler_error(skill):
+    message, handled = skill.handle(intent_request('EXAMPLE.failing'))
+
+    assert message is skill.buildin_intents.not_handled_response
+
+
+def test_processor_deadline_exceeded():
+    intents = SlowIntents()
+    buildin_intents = BuildInIntents('help', 'not handled')
+
+    message, handled = alexa_skill.Processor(intent_request('EXAMPLE.slow'), buildin_intents, 'welcome', 'bye', intents)()
+
+    assert message is buildin_intents.timeout_response
+
+    intents.released.set()
+
+
+def test_processor_class_deadline():
+    buildin_intents = BuildInIntents('help', 'not handled')
+    started = time.time()
+
+    message, handled = alexa_skill.Processor(
+        intent_request('EXAMPLE.budget'), buildin_intents, 'welcome', 'bye', BudgetIntents()
+    )()
+
+    assert time.time() - started < 0.5
+    assert message is buildin_intents.timeout_response
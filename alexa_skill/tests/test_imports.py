@@ -0,0 +1,90 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Import time of the package together with everything a typical skill needs on startup is measured only
+# when budget is given, e.g. `ALEXA_SKILL_IMPORT_BUDGET_MS=100 pytest`, wall-clock time is not stable on CI.
+IMPORT_TIME_BUDGET_MS = float(os.environ.get('ALEXA_SKILL_IMPORT_BUDGET_MS') or 0)
+
+STARTUP_IMPORT = 'import alexa_skill, alexa_skill.skill, alexa_skill.intents, alexa_skill.request'
+
+HEAVY_MODULES = ('dateutil', 'numpy', 'asyncio', 'inspect', 'alexa_skill.dates', 'alexa_skill.slots')
+
+
+def run(code, *options):
+    process = subprocess.Popen(
+        [sys.executable] + list(options) + ['-c', code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    stdout, stderr = process.communicate()
+
+    assert process.returncode == 0, stderr
+
+    return stdout.decode('utf-8'), stderr.decode('utf-8')
+
+
+def test_heavy_modules_are_not_imported_on_startup():
+    stdout, stderr = run(
+        STARTUP_IMPORT + '; import sys; print(" ".join(sorted(sys.modules)))'
+    )
+
+    assert set(stdout.split()).isdisjoint(HEAVY_MODULES)
+
+
+def test_lazy_names():
+    stdout, stderr = run(
+        'import sys, alexa_skill; before = "alexa_skill.skill" in sys.modules; '
+        'print(" ".join([str(before), alexa_skill.Skill.__module__, alexa_skill.messages.__name__]))'
+    )
+
+    assert stdout.split() == [
+        str(sys.version_info < (3, 7)),
+        'alexa_skill.skill',
+        'alexa_skill.messages',
+    ]
+
+
+def test_unknown_name():
+    import alexa_skill
+
+    with pytest.raises(AttributeError):
+        alexa_skill.unknown_name
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='-X importtime requires Python 3.7')
+@pytest.mark.skipif(not IMPORT_TIME_BUDGET_MS, reason='ALEXA_SKILL_IMPORT_BUDGET_MS is not set')
+def test_import_time_budget():
+    stdout, stderr = run(STARTUP_IMPORT, '-X', 'importtime')
+
+    # Lines look like: "import time:      1642 |      45086 | alexa_skill.skill", nested imports are indented.
+    cumulative = sum(
+        int(line.split('|')[1])
+        for line in stderr.splitlines()
+        if line.startswith('import time:') and line.split('|')[2].startswith(' alexa_skill')
+    )
+
+    assert cumulative / 1000.0 < IMPORT_TIME_BUDGET_MS
@@ -0,0 +1,236 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import pytest
+
+import alexa_skill
+from alexa_skill import messages
+from alexa_skill.intents import BaseIntents
+from alexa_skill.intents import BuildInIntents
+from alexa_skill.intents import cached_intent
+from alexa_skill.intents import intent
+from alexa_skill.router import SkillRouter
+
+
+class ExampleIntents(BaseIntents):
+    @intent('EXAMPLE.hello')
+    @intent('EXAMPLE.hi')
+    def hello(self):
+        return self.response('Hello'), True
+
+    @intent('EXAMPLE.bye')
+    def bye(self):
+        return self.response('Bye'), True
+
+
+class ExtendedIntents(ExampleIntents):
+    @intent('EXAMPLE.bye')
+    def see_you(self):
+        return self.response('See you'), True
+
+
+def test_intents_registry():
+    assert ExampleIntents.intents_registry == {'EXAMPLE.hello': 'hello', 'EXAMPLE.hi': 'hello', 'EXAMPLE.bye': 'bye'}
+
+
+def test_intents_registry_inheritance():
+    assert ExtendedIntents.intents_registry['EXAMPLE.bye'] == 'see_you'
+    assert ExtendedIntents.intents_registry['EXAMPLE.hello'] == 'hello'
+
+
+def test_intents_mapper_is_built_once():
+    intents = ExampleIntents()
+
+    assert intents.mapper is intents.mapper
+    assert isinstance(intents.mapper, messages.FrozenDict)
+    assert intents.mapper['EXAMPLE.hi']() == intents.hello()
+
+
+def test_buildin_intents_mapper():
+    buildin_intents = BuildInIntents('help', 'not handled')
+
+    assert set(buildin_intents.mapper) == {
+        'AMAZON.CancelIntent', 'AMAZON.StopIntent', 'AMAZON.HelpIntent', 'NotHandled', 'Timeout',
+    }
+
+
+def test_intent_registered_twice():
+    with pytest.raises(ValueError):
+        class DuplicatedIntents(BaseIntents):
+            @intent('EXAMPLE.hello')
+            def hello(self):
+                pass
+
+            @intent('EXAMPLE.hello')
+            def hi(self):
+                pass
+
+
+def test_intent_without_name():
+    with pytest.raises(ValueError):
+        intent('')
+
+
+def test_skill_intent_handled_twice():
+    with pytest.raises(ValueError):
+        alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', ExampleIntents(), ExtendedIntents())
+
+
+def test_skill_intent_without_handler():
+    class MissingIntents(BaseIntents):
+        @property
+        def mapper(self):
+            return {'EXAMPLE.missing': None}
+
+    with pytest.raises(ValueError):
+        alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', MissingIntents())
+
+
+class ProgramIntents(BaseIntents):
+    def __init__(self):
+        self.calls = 0
+
+    @intent('EXAMPLE.program')
+    @cached_intent(ttl=60, maxsize=2)
+    def program(self, slots=None):
+        self.calls += 1
+        return self.response('Program for {}'.format(slots['channel']['value'])), True
+
+    @intent('EXAMPLE.recommendation')
+    @cached_intent(scope='user')
+    def recommendation(self, slots=None, request=None):
+        self.calls += 1
+        return self.response('Recommendation for {}'.format(request.user_id)), True
+
+
+def program_request(channel, user_id='amzn1.ask.account.1', name='EXAMPLE.program', locale='en-US'):
+    return {
+        'session': {'sessionId': 'amzn1.echo-api.session.1', 'user': {'userId': user_id}},
+        'request': {
+            'type': 'IntentRequest',
+            'locale': locale,
+            'intent': {'name': name, 'slots': {'channel': {'name': 'channel', 'value': channel}}},
+        },
+    }
+
+
+@pytest.fixture
+def program_skill():
+    ProgramIntents.program.cache.clear()
+    ProgramIntents.recommendation.cache.clear()
+
+    return alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', ProgramIntents())
+
+
+def test_cached_intent(program_skill):
+    intents = program_skill.intents_mapper['EXAMPLE.program'][0].__self__
+
+    first, handled = program_skill.handle(program_request('ARD'))
+    second, handled = program_skill.handle(program_request(' ard '))
+
+    assert second is first
+    assert isinstance(first, messages.PreparedResponse)
+    assert first['response']['outputSpeech']['ssml'] == '<speak>Program for ARD</speak>'
+    assert handled is True
+    assert intents.calls == 1
+    assert (ProgramIntents.program.cache.hits, ProgramIntents.program.cache.misses) == (1, 1)
+
+    program_skill.handle(program_request('ZDF'))
+    program_skill.handle(program_request('ARD', locale='de-DE'))
+
+    assert intents.calls == 3
+    assert len(ProgramIntents.program.cache) == 2
+
+
+def test_cached_intent_user_scope(program_skill):
+    intents = program_skill.intents_mapper['EXAMPLE.recommendation'][0].__self__
+
+    first, handled = program_skill.handle(program_request('ARD', name='EXAMPLE.recommendation'))
+    other, handled = program_skill.handle(
+        program_request('ARD', name='EXAMPLE.recommendation', user_id='amzn1.ask.account.2')
+    )
+
+    assert program_skill.handle(program_request('ARD', name='EXAMPLE.recommendation'))[0] is first
+    assert other['response']['outputSpeech']['ssml'] == '<speak>Recommendation for amzn1.ask.account.2</speak>'
+    assert intents.calls == 2
+
+
+def test_cached_intent_processor(program_skill):
+    intents = ProgramIntents()
+
+    for _ in range(2):
+        alexa_skill.Processor(program_request('ARD'), BuildInIntents('help', 'not handled'), 'welcome', 'bye', intents)()
+
+    assert intents.calls == 1
+
+
+class Greeter(BaseIntents):
+    def __init__(self, name):
+        self.name = name
+
+    @intent('EXAMPLE.greet')
+    @cached_intent()
+    def greet(self, slots=None):
+        return self.response('hi from {}'.format(self.name)), True
+
+
+def test_cached_intent_per_skill():
+    Greeter.greet.cache.clear()
+    router = SkillRouter()
+
+    for name in ('A', 'B'):
+        router.register(name, alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', Greeter(name)))
+
+    for name in ('A', 'B', 'A', 'B'):
+        body = program_request('ARD', name='EXAMPLE.greet')
+        body['session']['application'] = {'applicationId': name}
+        message, handled = router.handle(body)
+
+        assert message['response']['outputSpeech']['ssml'] == '<speak>hi from {}</speak>'.format(name)
+
+    assert (Greeter.greet.cache.hits, Greeter.greet.cache.misses) == (2, 2)
+
+
+def test_cached_intent_per_instance():
+    Greeter.greet.cache.clear()
+
+    for name in ('A', 'B'):
+        skill = alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', Greeter(name))
+        message, handled = skill.handle(program_request('ARD', name='EXAMPLE.greet'))
+
+        assert message['response']['outputSpeech']['ssml'] == '<speak>hi from {}</speak>'.format(name)
+
+
+def test_cached_intent_without_request():
+    intents = ProgramIntents()
+
+    intents.program(slots={'channel': {'name': 'channel', 'value': 'ARD'}})
+    intents.program(slots={'channel': {'name': 'channel', 'value': 'ARD'}})
+
+    assert intents.calls == 2
+
+
+def test_cached_intent_keeps_registration():
+    assert ProgramIntents.intents_registry['EXAMPLE.program'] == 'program'
+    assert ProgramIntents.program.__name__ == 'program'
+
+    with pytest.raises(ValueError):
+        cached_intent(scope='device')
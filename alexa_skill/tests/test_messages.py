@@ -19,6 +19,11 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
+import copy
+import json
+
+import pytest
+
 from alexa_skill import messages
 
 
@@ -94,3 +99,77 @@ def test_confirm_slots_directives():
     assert result[0]['type'] == 'Dialog.ConfirmSlot'
     assert result[0]['slotToConfirm'] == intent_name
     assert result[0]['updatedIntent'] == slots[intent_name]
+
+
+def test_create_response_session_attributes():
+    message = messages.create_response('Hello', should_end_session=False, session_attributes={'counter': 1})
+
+    assert message['sessionAttributes'] == {'counter': 1}
+    assert 'sessionAttributes' not in messages.create_response('Hello')
+
+
+def test_prepare_response():
+    message = messages.create_response('Test text', confirm_slots={'slot': {'name': 'intent'}})
+
+    result = messages.prepare_response(message)
+
+    assert result == message
+    assert json.loads(result.body.decode('utf-8')) == message
+    assert messages.dumps(result) is result.body
+
+
+def test_prepare_response_is_read_only():
+    result = messages.prepare_response(messages.create_response('Test text'))
+
+    with pytest.raises(TypeError):
+        result['version'] = '2.0'
+
+    with pytest.raises(TypeError):
+        result['response'].update(shouldEndSession=False)
+
+    with pytest.raises(TypeError):
+        del result['response']['card']
+
+
+def test_prepare_response_deepcopy_is_mutable():
+    result = copy.deepcopy(messages.prepare_response(messages.create_response('Test text')))
+
+    result['response']['shouldEndSession'] = False
+
+    assert type(result['response']) is dict
+
+
+def test_dumps():
+    message = messages.create_response(u'Gr\xfc\xdfe')
+
+    assert json.loads(messages.dumps(message).decode('utf-8')) == message
+
+
+def test_response_template():
+    template = messages.ResponseTemplate(card_title='My app', should_end_session=False)
+
+    result = template.render(u'Test "text" \xfc')
+
+    assert isinstance(result, messages.EncodedResponse)
+    assert json.loads(result.decode('utf-8')) == messages.create_response(
+        u'Test "text" \xfc', card_title='My app', should_end_session=False
+    )
+    assert messages.dumps(result) == result
+
+
+def test_response_template_holes():
+    template = messages.ResponseTemplate(speech_type='PlainText', reprompt=messages.reprompt('Again?'))
+
+    result = template.render('Test text', card_title='My app', should_end_session=True)
+
+    assert json.loads(result.decode('utf-8')) == messages.create_response(
+        'Test text', card_title='My app', should_end_session=True,
+        speech_type='PlainText', reprompt=messages.reprompt('Again?')
+    )
+
+
+def test_response_template_missing_value():
+    template = messages.ResponseTemplate(card_title='My app')
+
+    with pytest.raises(TypeError):
+        template.render('Test text')
@@ -0,0 +1,141 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import pytest
+
+from alexa_skill.request import AlexaRequest
+
+
+@pytest.fixture
+def request_body():
+    return {
+        "version": "1.0",
+        "session": {
+            "new": True,
+            "sessionId": "amzn1.echo-api.session.1",
+            "application": {
+                "applicationId": "amzn1.ask.skill.1"
+            },
+            "attributes": {
+                "key": "string value"
+            },
+            "user": {
+                "userId": "amzn1.ask.account.1",
+            }
+        },
+        "context": {
+            "System": {
+                "device": {
+                    "deviceId": "device",
+                    "supportedInterfaces": {
+                        "AudioPlayer": {}
+                    }
+                },
+                "application": {
+                    "applicationId": "amzn1.ask.skill.1"
+                },
+                "user": {
+                    "userId": "amzn1.ask.account.1",
+                    "accessToken": "Atza|AAAAAAAA..."
+                },
+                "apiEndpoint": "https://api.amazonalexa.com",
+                "apiAccessToken": "AxThk..."
+            }
+        },
+        "request": {
+            "type": "IntentRequest",
+            "requestId": "amzn1.echo-api.request.1",
+            "locale": "de-DE",
+            "intent": {
+                "name": "EXAMPLE.hello",
+                "slots": {
+                    "name": {"name": "name", "value": "Joe"}
+                }
+            }
+        }
+    }
+
+
+def test_alexa_request_fields(request_body):
+    request = AlexaRequest(request_body)
+
+    assert request.request_type == 'IntentRequest'
+    assert request.request_id == 'amzn1.echo-api.request.1'
+    assert request.locale == 'de-DE'
+    assert request.intent_name == 'EXAMPLE.hello'
+    assert request.slots == {'name': {'name': 'name', 'value': 'Joe'}}
+    assert request.session_id == 'amzn1.echo-api.session.1'
+    assert request.session_attributes == {'key': 'string value'}
+    assert request.application_id == 'amzn1.ask.skill.1'
+    assert request.user_id == 'amzn1.ask.account.1'
+
+
+def test_alexa_request_system(request_body):
+    system = AlexaRequest(request_body).system
+
+    assert system.application_id == 'amzn1.ask.skill.1'
+    assert system.user_id == 'amzn1.ask.account.1'
+    assert system.user_access_token == 'Atza|AAAAAAAA...'
+    assert system.device_id == 'device'
+    assert system.supported_interfaces == {'AudioPlayer': {}}
+    assert system.api_endpoint == 'https://api.amazonalexa.com'
+    assert system.api_access_token == 'AxThk...'
+
+
+def test_alexa_request_fields_are_extracted_once(request_body):
+    request = AlexaRequest(request_body)
+
+    assert request.intent_name == 'EXAMPLE.hello'
+
+    request_body['request']['intent']['name'] = 'EXAMPLE.other'
+
+    assert request.intent_name == 'EXAMPLE.hello'
+
+
+def test_alexa_request_compact_session_attributes(request_body):
+    from alexa_skill import session
+
+    attributes = {'history': ['turn {}'.format(index) for index in range(100)]}
+    request_body['session']['attributes'] = session.encode(attributes)
+
+    request = AlexaRequest(request_body)
+
+    assert not hasattr(request, '_session_attributes')
+    assert request.session_attributes == attributes
+    assert request.session_attributes is request.session_attributes
+
+
+def test_alexa_request_without_session(request_body):
+    del request_body['session']
+    request_body['request'] = {'type': 'AudioPlayer.PlaybackStarted'}
+
+    request = AlexaRequest(request_body)
+
+    assert request.session_id is None
+    assert request.intent_name is None
+    assert request.slots == {}
+    assert request.application_id == 'amzn1.ask.skill.1'
+    assert request.user_id == 'amzn1.ask.account.1'
+
+
+def test_alexa_request_is_slotted(request_body):
+    with pytest.raises(AttributeError):
+        AlexaRequest(request_body).other = True
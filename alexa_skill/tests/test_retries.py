@@ -0,0 +1,182 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import threading
+
+import pytest
+
+import alexa_skill
+from alexa_skill.cache import TTLCache
+from alexa_skill.intents import BaseIntents
+from alexa_skill.intents import BuildInIntents
+from alexa_skill.intents import intent
+from alexa_skill.retries import RetryCache
+from alexa_skill.router import SkillRouter
+from alexa_skill.tests.conftest import intent_request
+
+REQUEST_ID = 'amzn1.echo-api.request.1'
+
+
+class BackendIntents(BaseIntents):
+    def __init__(self):
+        self.calls = 0
+        self.started = threading.Event()
+        self.released = threading.Event()
+
+    @intent('EXAMPLE.backend')
+    def backend(self):
+        self.calls += 1
+        self.started.set()
+        self.released.wait(5)
+        return self.response('Backend answered {} times'.format(self.calls)), True
+
+    @intent('EXAMPLE.failing')
+    def failing(self):
+        self.calls += 1
+        self.started.set()
+        self.released.wait(5)
+        raise RuntimeError('Backend is down')
+
+
+class ObservedRetryCache(RetryCache):
+    def __init__(self, *args, **kwargs):
+        super(ObservedRetryCache, self).__init__(*args, **kwargs)
+        self.waiting = threading.Event()
+
+    def join(self, request_id):
+        flight, leader = super(ObservedRetryCache, self).join(request_id)
+
+        if flight is not None and not leader:
+            self.waiting.set()
+
+        return flight, leader
+
+
+@pytest.fixture
+def intents():
+    return BackendIntents()
+
+
+@pytest.fixture
+def retry_cache(intents):
+    return ObservedRetryCache(alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', intents))
+
+
+def test_retry_is_answered_from_cache(retry_cache, intents):
+    intents.released.set()
+
+    first = retry_cache.handle(intent_request('EXAMPLE.backend', request_id=REQUEST_ID))
+    retry = retry_cache.handle(intent_request('EXAMPLE.backend', request_id=REQUEST_ID))
+    other = retry_cache.handle(intent_request('EXAMPLE.backend', request_id='amzn1.echo-api.request.2'))
+
+    assert retry is first
+    assert other is not first
+    assert intents.calls == 2
+    assert retry_cache.responses.hits == 1
+
+
+def test_request_without_id(retry_cache, intents):
+    intents.released.set()
+
+    retry_cache.handle(intent_request('EXAMPLE.backend'))
+    retry_cache.handle(intent_request('EXAMPLE.backend'))
+
+    assert intents.calls == 2
+    assert len(retry_cache.responses) == 0
+
+
+def run_concurrently(retry_cache, intents, request_body):
+    results = []
+
+    def handle():
+        try:
+            results.append(retry_cache.handle(request_body))
+        except RuntimeError as error:
+            results.append(error)
+
+    original = threading.Thread(target=handle)
+    original.start()
+    intents.started.wait(5)
+
+    retry = threading.Thread(target=handle)
+    retry.start()
+
+    retry_cache.waiting.wait(5)
+    intents.released.set()
+    original.join(5)
+    retry.join(5)
+
+    return results
+
+
+def test_retry_waits_for_original_request(retry_cache, intents):
+    results = run_concurrently(retry_cache, intents, intent_request('EXAMPLE.backend', request_id=REQUEST_ID))
+
+    assert intents.calls == 1
+    assert results[0] is results[1]
+    assert not retry_cache.flights
+
+
+def test_retry_gets_error_of_original_request(retry_cache, intents):
+    results = run_concurrently(retry_cache, intents, intent_request('EXAMPLE.failing', request_id=REQUEST_ID))
+
+    assert intents.calls == 1
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert len(retry_cache.responses) == 0
+
+
+def test_retry_cache_of_router(intents):
+    intents.released.set()
+    skill = alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', intents)
+    retry_cache = RetryCache(SkillRouter({'amzn1.ask.skill.1': skill}))
+    request_body = intent_request('EXAMPLE.backend', request_id=REQUEST_ID)
+    request_body['session'] = {'application': {'applicationId': 'amzn1.ask.skill.1'}}
+
+    assert retry_cache.handle(request_body) is retry_cache.handle(request_body)
+    assert intents.calls == 1
+
+
+def test_ttl_cache():
+    now = [0]
+    cache = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+
+    cache.set('a', 1)
+    now[0] = 5
+    cache.set('b', 2)
+
+    assert cache.get('a') == 1
+
+    now[0] = 11
+
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+
+    cache.set('c', 3)
+
+    assert 'a' not in cache
+    assert cache.pop('b') == 2
+    assert cache.pop('b') is None
+
+    cache.set('d', 4)
+    cache.set('e', 5)
+
+    assert len(cache) == 2
+    assert 'c' not in cache
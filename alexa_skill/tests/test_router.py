@@ -0,0 +1,88 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import pytest
+
+import alexa_skill
+from alexa_skill.intents import BuildInIntents
+from alexa_skill.router import SkillRouter
+from alexa_skill.router import UnknownApplication
+
+
+def launch_request(application_id, with_session=True):
+    application = {'application': {'applicationId': application_id}}
+    request_body = {'request': {'type': 'LaunchRequest'}}
+
+    if with_session:
+        request_body['session'] = application
+    else:
+        request_body['context'] = {'System': application}
+
+    return request_body
+
+
+@pytest.fixture
+def router():
+    return SkillRouter({
+        'amzn1.ask.skill.1': alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'first', 'bye'),
+        'amzn1.ask.skill.2': alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'second', 'bye'),
+    })
+
+
+def speech(response):
+    return response['response']['outputSpeech']['ssml']
+
+
+def test_router(router):
+    first, first_handled = router.handle(launch_request('amzn1.ask.skill.1'))
+    second, second_handled = router.handle(launch_request('amzn1.ask.skill.2'))
+
+    assert speech(first) == '<speak>first</speak>'
+    assert speech(second) == '<speak>second</speak>'
+    assert first_handled is second_handled is True
+
+
+def test_router_without_session(router):
+    response, handled = router.handle(launch_request('amzn1.ask.skill.2', with_session=False))
+
+    assert speech(response) == '<speak>second</speak>'
+
+
+def test_router_unknown_application(router):
+    with pytest.raises(UnknownApplication):
+        router.handle(launch_request('amzn1.ask.skill.3'))
+
+    with pytest.raises(ValueError):
+        router.handle({'request': {'type': 'LaunchRequest'}})
+
+
+def test_router_register(router):
+    skill = alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'third', 'bye')
+
+    router.register('amzn1.ask.skill.3', skill)
+
+    assert router.route(alexa_skill.AlexaRequest(launch_request('amzn1.ask.skill.3'))) is skill
+
+    with pytest.raises(ValueError):
+        router.register('amzn1.ask.skill.3', skill)
+
+    with pytest.raises(ValueError):
+        router.register('', skill)
@@ -0,0 +1,198 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+import alexa_skill
+from alexa_skill import codec
+from alexa_skill import serve
+from alexa_skill.intents import BaseIntents
+from alexa_skill.intents import BuildInIntents
+from alexa_skill.intents import intent
+
+try:
+    from http.client import HTTPConnection
+except ImportError:
+    from httplib import HTTPConnection
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'fork'), reason='Pre-fork server requires os.fork')
+
+
+class ProcessIntents(BaseIntents):
+    @intent('EXAMPLE.pid')
+    def pid(self):
+        return self.response(str(os.getpid())), True
+
+
+# Served by the server process started in tests
+skill = alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', ProcessIntents())
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def free_port():
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+
+    return port
+
+
+def worker_pid(port):
+    connection = HTTPConnection('127.0.0.1', port, timeout=5)
+    connection.request(
+        'POST', '/v1/alexa/fulfiller',
+        body=b'{"request": {"type": "IntentRequest", "intent": {"name": "EXAMPLE.pid"}}}',
+        headers={'Content-Type': 'application/json'},
+    )
+    response = connection.getresponse()
+    response_body = response.read()
+    connection.close()
+
+    assert response.status == 200
+
+    return int(codec.loads(response_body)['response']['card']['content'])
+
+
+def start_server(port, *args):
+    command = [
+        sys.executable, '-m', 'alexa_skill.serve', 'alexa_skill.tests.test_serve:skill',
+        '--port', str(port), '--path', '/v1/alexa/fulfiller',
+    ] + list(args)
+
+    process = subprocess.Popen(command, cwd=ROOT)
+    deadline = time.time() + 10
+
+    try:
+        while True:
+            try:
+                worker_pid(port)
+                return process
+            except (socket.error, IOError):
+                assert time.time() < deadline and process.poll() is None, 'Server did not start'
+                time.sleep(0.1)
+    except Exception:
+        stop_server(process)
+        raise
+
+
+def stop_server(process):
+    if process.poll() is None:
+        process.terminate()
+        process.wait()
+
+
+@pytest.fixture(params=[True, False] if serve.REUSE_PORT else [False])
+def server(request):
+    port = free_port()
+    args = ['--workers', '2', '--max-requests', '3']
+
+    if not request.param:
+        args.append('--no-reuse-port')
+
+    process = start_server(port, *args)
+
+    try:
+        yield process, port
+    finally:
+        stop_server(process)
+
+
+def test_load():
+    assert serve.load('alexa_skill.tests.test_serve:skill') is skill
+
+    with pytest.raises(ValueError):
+        serve.load('alexa_skill.tests.test_serve')
+
+    with pytest.raises(ValueError):
+        serve.load('alexa_skill.tests.test_serve:free_port')
+
+
+def test_create_socket():
+    sock = serve.create_socket('127.0.0.1', 0, reuse_port=False)
+
+    try:
+        assert sock.getsockname()[1] != 0
+    finally:
+        sock.close()
+
+
+def test_serve(server):
+    process, port = server
+
+    pids = [worker_pid(port) for _ in range(20)]
+
+    # Workers are recycled after three requests
+    assert len(set(pids)) > 2
+    assert process.pid not in pids
+
+    process.send_signal(signal.SIGHUP)
+    time.sleep(1.5)
+
+    assert set(worker_pid(port) for _ in range(4)).isdisjoint(pids)
+
+    process.send_signal(signal.SIGTERM)
+
+    assert process.wait() == 0
+
+
+def test_idle_connection_is_closed():
+    port = free_port()
+    process = start_server(port, '--workers', '1', '--timeout', '0.5')
+    idle = socket.create_connection(('127.0.0.1', port))
+
+    try:
+        started = time.time()
+
+        assert worker_pid(port) != process.pid
+        assert time.time() - started < 3
+    finally:
+        idle.close()
+        stop_server(process)
+
+
+def test_arbiter_kills_late_workers():
+    ignoring = subprocess.Popen([
+        sys.executable, '-c', 'import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); time.sleep(30)',
+    ])
+    arbiter = serve.Arbiter(None, None, 1)
+
+    try:
+        arbiter.stopping[ignoring.pid] = time.time() + 60
+        arbiter.kill_late()
+
+        assert ignoring.poll() is None
+
+        arbiter.stopping[ignoring.pid] = time.time()
+        arbiter.kill_late()
+
+        assert ignoring.wait() == -signal.SIGKILL
+    finally:
+        if ignoring.poll() is None:
+            ignoring.kill()
@@ -0,0 +1,97 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import io
+import json
+import wsgiref.util
+
+import pytest
+
+import alexa_skill
+from alexa_skill.intents import BuildInIntents
+from alexa_skill.server import WSGIApplication
+
+
+@pytest.fixture
+def application():
+    skill = alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye')
+
+    return WSGIApplication(skill, path='/v1/alexa/fulfiller')
+
+
+def call(application, body, method='POST', path='/v1/alexa/fulfiller'):
+    environ = {
+        'REQUEST_METHOD': method,
+        'PATH_INFO': path,
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.input': io.BytesIO(body),
+    }
+    wsgiref.util.setup_testing_defaults(environ)
+    response = {}
+
+    def start_response(status, headers):
+        response['status'] = status
+        response['headers'] = dict(headers)
+
+    response['body'] = b''.join(application(environ, start_response))
+
+    return response
+
+
+def test_wsgi_application(application):
+    response = call(application, json.dumps({'request': {'type': 'LaunchRequest'}}).encode('utf-8'))
+
+    assert response['status'] == '200 OK'
+    assert response['headers']['Content-Type'] == 'application/json'
+    assert response['headers']['Content-Length'] == str(len(response['body']))
+    assert json.loads(response['body'].decode('utf-8'))['response']['outputSpeech']['ssml'] == (
+        '<speak>welcome</speak>'
+    )
+
+
+def test_wsgi_application_prepared_response(application):
+    request = {'request': {'type': 'IntentRequest', 'intent': {'name': 'AMAZON.HelpIntent'}}}
+
+    response = call(application, json.dumps(request).encode('utf-8'))
+
+    assert response['body'] == application.skill.buildin_intents.help_response.body
+
+
+def test_wsgi_application_not_found(application):
+    assert call(application, b'{}', path='/other')['status'] == '404 Not Found'
+
+
+def test_wsgi_application_method_not_allowed(application):
+    assert call(application, b'', method='GET')['status'] == '405 Method Not Allowed'
+
+
+def test_wsgi_application_bad_request(application):
+    assert call(application, b'{not json')['status'] == '400 Bad Request'
+
+
+def test_wsgi_application_unknown_application():
+    from alexa_skill.router import SkillRouter
+
+    skill = alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye')
+    application = WSGIApplication(SkillRouter({'amzn1.ask.skill.1': skill}))
+    request = {'session': {'application': {'applicationId': 'amzn1.ask.skill.2'}}, 'request': {'type': 'LaunchRequest'}}
+
+    assert call(application, json.dumps(request).encode('utf-8'))['status'] == '400 Bad Request'
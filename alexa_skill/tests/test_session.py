@@ -0,0 +1,100 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import base64
+import zlib
+
+import pytest
+
+from alexa_skill import session
+
+ATTRIBUTES = {
+    'history': ['Good morning {}'.format(index) for index in range(100)],
+    'counter': 7,
+    'name': u'J\u00fcrgen',
+}
+
+
+@pytest.fixture(params=['json', 'msgpack'])
+def fmt(request):
+    if request.param == 'msgpack' and session.msgpack is None:
+        pytest.skip('msgpack is not installed')
+
+    return request.param
+
+
+def test_encode_small_attributes_are_plain():
+    assert session.encode({'counter': 1}) == {'counter': 1}
+    assert session.encode({}) == {}
+    assert session.encode(None) is None
+
+
+def test_encode_large_attributes_are_compact(fmt):
+    compact = session.encode(ATTRIBUTES, fmt=fmt)
+
+    assert list(compact) == [session.COMPACT_KEY]
+    assert compact[session.COMPACT_KEY].startswith(fmt + ':')
+    assert len(session.codec.dumps(compact)) < len(session.codec.dumps(ATTRIBUTES)) / 4
+    assert session.decode(compact) == ATTRIBUTES
+
+
+def test_encode_threshold():
+    assert session.encode({'counter': 1}, threshold=0, fmt='json') == {'counter': 1}
+    assert session.is_compact(session.encode(ATTRIBUTES, threshold=0, fmt='json'))
+    assert session.encode(ATTRIBUTES, threshold=1 << 20) is ATTRIBUTES
+
+
+def test_decode_plain_attributes():
+    assert session.decode({'counter': 1}) == {'counter': 1}
+    assert session.decode({session.COMPACT_KEY: 1, 'counter': 1}) == {session.COMPACT_KEY: 1, 'counter': 1}
+    assert session.decode(None) is None
+
+
+@pytest.mark.parametrize('value', ['', 'json', 'json:AAAA', 'unknown:AAAA', 1])
+def test_decode_malformed(value):
+    with pytest.raises(ValueError):
+        session.decode({session.COMPACT_KEY: value})
+
+
+def test_decode_size_limit():
+    bomb = base64.b64encode(zlib.compress(b' ' * (session.MAX_SIZE + 1), 9)).decode('ascii')
+
+    with pytest.raises(ValueError):
+        session.decode({session.COMPACT_KEY: 'json:' + bomb})
+
+
+def test_encode_size_limit():
+    with pytest.raises(ValueError):
+        session.encode({'data': 'x' * session.MAX_SIZE}, fmt='json')
+
+
+def test_json_format_uses_current_codec(monkeypatch):
+    compact = session.encode(ATTRIBUTES, fmt='json')
+    decoded = []
+
+    def loads(data):
+        decoded.append(data)
+        return {}
+
+    monkeypatch.setattr(session.codec, 'loads', loads)
+
+    assert session.decode(compact) == {}
+    assert len(decoded) == 1
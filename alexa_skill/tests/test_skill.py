@@ -0,0 +1,157 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import json
+
+import pytest
+
+import alexa_skill
+from alexa_skill import messages
+from alexa_skill.intents import BaseIntents
+from alexa_skill.intents import BuildInIntents
+from alexa_skill.tests.conftest import intent_request
+
+
+class ExampleIntents(BaseIntents):
+    @property
+    def mapper(self):
+        return {
+            'EXAMPLE.hello': self.hello,
+            'EXAMPLE.slots': self.with_slots,
+        }
+
+    def hello(self):
+        return self.response('Hello'), True
+
+    def with_slots(self, slots=None):
+        return self.response(slots['name']['value']), True
+
+
+@pytest.fixture
+def buildin_intents():
+    return BuildInIntents(help_message='help', not_handled_message='not handled')
+
+
+@pytest.fixture
+def skill(buildin_intents):
+    return alexa_skill.Skill(buildin_intents, 'welcome', 'bye', ExampleIntents())
+
+
+def test_skill_dispatch_table(skill):
+    assert set(skill.intents_mapper) == {
+        'EXAMPLE.hello', 'EXAMPLE.slots', 'AMAZON.CancelIntent', 'AMAZON.StopIntent', 'AMAZON.HelpIntent',
+    }
+
+
+def test_skill_launch_request(skill):
+    message, handled = skill.handle({'request': {'type': 'LaunchRequest'}})
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>welcome</speak>'
+    assert message['response']['shouldEndSession'] is False
+    assert handled is True
+
+
+def test_skill_session_end_request(skill):
+    message, handled = skill.handle({'request': {'type': 'SessionEndedRequest'}})
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>bye</speak>'
+    assert message['response']['shouldEndSession'] is True
+
+
+def test_skill_intent_request(skill):
+    message, handled = skill.handle(intent_request('EXAMPLE.hello'))
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>Hello</speak>'
+    assert handled is True
+
+
+def test_skill_intent_request_with_slots(skill):
+    message, handled = skill.handle(intent_request('EXAMPLE.slots', {'name': {'name': 'name', 'value': 'Joe'}}))
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>Joe</speak>'
+
+
+def test_skill_buildin_intent(skill):
+    message, handled = skill.handle(intent_request('AMAZON.HelpIntent'))
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>help</speak>'
+
+
+@pytest.mark.parametrize('name', ['EXAMPLE.unknown', 'AMAZON.FallbackIntent', None])
+def test_skill_not_handled_intent(skill, name):
+    message, handled = skill.handle(intent_request(name))
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>not handled</speak>'
+    assert handled is False
+
+
+def test_skill_not_handled_on_handler_error(skill):
+    message, handled = skill.handle(intent_request('EXAMPLE.slots', {'other': {'name': 'other'}}))
+
+    assert handled is False
+
+
+def test_processor_registers_intents(buildin_intents):
+    processor = alexa_skill.Processor(
+        intent_request('EXAMPLE.hello'), buildin_intents, 'welcome', 'bye', ExampleIntents()
+    )
+
+    message, handled = processor()
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>Hello</speak>'
+    assert handled is True
+
+
+def test_processor_compile(buildin_intents):
+    skill = alexa_skill.Processor.compile(buildin_intents, 'welcome', 'bye', ExampleIntents())
+
+    assert isinstance(skill, alexa_skill.Skill)
+    assert 'EXAMPLE.hello' in skill.intents_mapper
+
+
+def test_buildin_intents_responses_are_prepared(buildin_intents):
+    first, handled = buildin_intents.stop()
+    second, handled = buildin_intents.stop()
+
+    assert first is second
+    assert isinstance(first, messages.PreparedResponse)
+    assert json.loads(first.body.decode('utf-8'))['response']['outputSpeech']['ssml'] == '<speak>stop</speak>'
+
+
+class RequestIntents(BaseIntents):
+    @property
+    def mapper(self):
+        return {
+            'EXAMPLE.locale': self.locale,
+        }
+
+    def locale(self, request):
+        return self.response(request.locale), True
+
+
+def test_skill_passes_request_to_handler(buildin_intents):
+    skill = alexa_skill.Skill(buildin_intents, 'welcome', 'bye', RequestIntents())
+    request_body = intent_request('EXAMPLE.locale')
+    request_body['request']['locale'] = 'de-DE'
+
+    message, handled = skill.handle(request_body)
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>de-DE</speak>'
@@ -0,0 +1,124 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import datetime
+import json
+
+import dateutil.tz
+
+from alexa_skill import temporal
+from alexa_skill.slots import Slot
+from alexa_skill.slots import Slots
+
+
+def test_slots():
+    raw = {
+        'name': {'name': 'name', 'value': 'Joe', 'confirmationStatus': 'NONE'},
+        'empty': {'name': 'empty', 'confirmationStatus': 'NONE'},
+    }
+
+    slots = Slots(raw)
+
+    assert slots == raw
+    assert slots['name']['value'] == 'Joe'
+    assert slots['name'].name == 'name'
+    assert slots['name'].confirmation_status == 'NONE'
+    assert slots.value('name') == 'Joe'
+    assert slots.value('empty', 'default') == 'default'
+    assert slots.value('missing') is None
+
+
+def test_slots_are_dicts():
+    raw = {'name': {'name': 'name', 'value': 'Joe'}}
+    slots = Slots(raw)
+    slot = slots['name']
+
+    assert isinstance(slot, dict)
+    assert json.loads(json.dumps(slots)) == raw
+    assert dict(slot) == raw['name']
+    assert sorted(slot) == sorted(slot.keys()) == ['name', 'value']
+    assert dict(slot.items()) == raw['name']
+    assert slot == raw['name'] and not slot != raw['name']
+
+
+def test_slot_resolution():
+    slot = Slot({
+        'name': 'drink',
+        'value': 'coke',
+        'resolutions': {
+            'resolutionsPerAuthority': [
+                {
+                    'authority': 'amzn1.er-authority.echo-sdk.1.Drinks',
+                    'status': {'code': 'ER_SUCCESS_NO_MATCH'},
+                },
+                {
+                    'authority': 'amzn1.er-authority.echo-sdk.2.Drinks',
+                    'status': {'code': 'ER_SUCCESS_MATCH'},
+                    'values': [{'value': {'name': 'Coca-Cola', 'id': 'COCA_COLA'}}],
+                },
+            ]
+        }
+    })
+
+    assert slot.value == 'coke'
+    assert slot.resolved_value == 'Coca-Cola'
+    assert slot.resolved_id == 'COCA_COLA'
+
+
+def test_slot_without_resolution():
+    slot = Slot({'name': 'drink', 'value': 'coke'})
+
+    assert slot.resolved_value == 'coke'
+    assert slot.resolved_id is None
+
+
+def test_slot_date():
+    date, date_type = Slot({'name': 'date', 'value': '2018-11-25'}).date
+
+    assert date == datetime.datetime(2018, 11, 25, tzinfo=dateutil.tz.gettz('Europe/Berlin'))
+    assert date_type == 'normal'
+
+
+def test_slot_invalid_date():
+    assert Slot({'name': 'date', 'value': '2018-02-30'}).date == (None, None)
+    assert Slot({'name': 'date'}).date == (None, None)
+
+
+def test_slot_number():
+    assert Slot({'name': 'number', 'value': '42'}).number == 42
+    assert Slot({'name': 'number', 'value': '4.5'}).number == 4.5
+    assert Slot({'name': 'number', 'value': '?'}).number is None
+    assert Slot({'name': 'number'}).number is None
+
+
+def test_slot_time_and_duration():
+    assert Slot({'name': 'time', 'value': '11:30'}).time == temporal.Time(11, 30, 0, None)
+    assert Slot({'name': 'duration', 'value': 'PT15M'}).duration == temporal.Duration(0, 0, 0, 0, 0, 15, 0)
+
+
+def test_slot_typed_value_is_cached():
+    slot = Slot({'name': 'number', 'value': '42'})
+
+    assert slot.number == 42
+
+    slot['value'] = '43'
+
+    assert slot.number == 42
@@ -0,0 +1,255 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import threading
+
+import pytest
+
+import alexa_skill
+from alexa_skill.intents import BaseIntents
+from alexa_skill.intents import BuildInIntents
+from alexa_skill.intents import intent
+from alexa_skill.cache import LRUCache
+from alexa_skill.storage import Backend
+from alexa_skill.storage import SQLiteBackend
+from alexa_skill.storage import UserStore
+
+
+class MemoryBackend(Backend):
+    def __init__(self):
+        self.data = {}
+        self.batches = []
+        self.fail = False
+
+    def load(self, user_id):
+        return self.data.get(user_id)
+
+    def save(self, items):
+        if self.fail:
+            raise IOError('backend is down')
+
+        self.batches.append(sorted(items))
+        self.data.update(items)
+
+
+@pytest.fixture
+def backend():
+    return MemoryBackend()
+
+
+def test_sqlite_backend(tmpdir):
+    path = str(tmpdir.join('users.db'))
+    backend = SQLiteBackend(path)
+
+    assert backend.load('user') is None
+
+    backend.save({'user': {'name': u'J\u00fcrgen', 'visits': 1}, 'other': {}})
+    backend.close()
+
+    backend = SQLiteBackend(path)
+
+    assert backend.load('user') == {'name': u'J\u00fcrgen', 'visits': 1}
+    assert backend.load('other') == {}
+
+    backend.save({'user': {'visits': 2}})
+
+    assert backend.load('user') == {'visits': 2}
+
+
+def test_user_store_read_through(backend):
+    backend.data['user'] = {'visits': 1}
+    store = UserStore(backend)
+
+    assert store.get('user') == {'visits': 1}
+    assert store.get('user') == {'visits': 1}
+    assert store.get('missing') is None
+    assert store.get('missing', {}) == {}
+    assert store.loads == 2
+
+
+def test_user_store_write_behind(backend):
+    store = UserStore(backend, batch_size=3)
+
+    store.set('a', {'visits': 1})
+    store.set('b', {'visits': 1})
+    store.set('a', {'visits': 2})
+
+    assert backend.batches == []
+    assert len(store) == 2
+    assert store.get('a') == {'visits': 2}
+
+    store.set('c', {'visits': 1})
+
+    assert backend.batches == [['a', 'b', 'c']]
+    assert backend.data['a'] == {'visits': 2}
+    assert len(store) == 0
+    assert store.saves == 1
+    assert store.loads == 0
+
+
+def test_user_store_evicted_pending_user(backend):
+    store = UserStore(backend, maxsize=1)
+
+    store.set('a', {'visits': 1})
+    store.set('b', {'visits': 1})
+
+    assert store.get('a') == {'visits': 1}
+    assert store.loads == 0
+
+
+def test_user_store_update_during_load(backend):
+    backend.data['a'] = {'visits': 1}
+    loading = threading.Event()
+    updated = threading.Event()
+    load = backend.load
+
+    def slow_load(user_id):
+        data = load(user_id)
+        loading.set()
+        updated.wait(5)
+        return data
+
+    backend.load = slow_load
+    store = UserStore(backend, batch_size=1)
+    results = []
+    reader = threading.Thread(target=lambda: results.append(store.get('a')))
+    reader.start()
+    loading.wait(5)
+
+    # Update is saved by batch flush before the stale load populates cache
+    store.set('a', {'visits': 2})
+    updated.set()
+    reader.join(5)
+
+    assert results == [{'visits': 2}]
+    assert store.get('a') == {'visits': 2}
+
+
+def test_lru_cache_setdefault():
+    cache = LRUCache(maxsize=2)
+
+    assert cache.setdefault('a', 1) == 1
+    assert cache.setdefault('a', 2) == 1
+    assert cache.setdefault('b', 2) == 2
+    assert cache.setdefault('c', 3) == 3
+    assert 'a' not in cache
+    assert len(cache) == 2
+
+
+def test_user_store_flush_failure_keeps_updates(backend):
+    store = UserStore(backend)
+    store.set('a', {'visits': 1})
+    backend.fail = True
+
+    with pytest.raises(IOError):
+        store.flush()
+
+    store.set('b', {'visits': 1})
+    backend.fail = False
+    store.flush()
+    store.flush()
+
+    assert backend.batches == [['a', 'b']]
+
+
+def test_user_store_close(backend):
+    store = UserStore(backend)
+    store.set('a', {'visits': 1})
+    store.close()
+
+    assert backend.data == {'a': {'visits': 1}}
+
+
+class VisitIntents(BaseIntents):
+    store = None
+
+    @intent('EXAMPLE.visit')
+    def visit(self, slots=None, request=None):
+        visits = self.store.get(request.user_id, {}).get('visits', 0) + 1
+        self.store.set(request.user_id, {'visits': visits})
+
+        return self.response('Visit {}'.format(visits)), True
+
+
+def user_request(request_type, **request):
+    request['type'] = request_type
+
+    return {'session': {'user': {'userId': 'amzn1.ask.account.1'}}, 'request': request}
+
+
+def test_skill_flushes_store_on_session_end(backend):
+    store = UserStore(backend)
+    intents = VisitIntents()
+    intents.store = store
+    skill = alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', intents)
+    skill.store = store
+
+    for visits in range(1, 3):
+        message, handled = skill.handle(user_request('IntentRequest', intent={'name': 'EXAMPLE.visit'}))
+        assert message['response']['outputSpeech']['ssml'] == '<speak>Visit {}</speak>'.format(visits)
+
+    assert backend.data == {}
+
+    skill.handle(user_request('SessionEndedRequest'))
+
+    assert backend.data == {'amzn1.ask.account.1': {'visits': 2}}
+    assert store.loads == 1
+
+
+def test_processor_flushes_store_on_session_end(backend):
+    store = UserStore(backend)
+    store.set('amzn1.ask.account.1', {'visits': 1})
+
+    class StoreProcessor(alexa_skill.Processor):
+        pass
+
+    StoreProcessor.store = store
+    StoreProcessor(user_request('SessionEndedRequest'), BuildInIntents('help', 'not handled'), 'welcome', 'bye')()
+
+    assert backend.data == {'amzn1.ask.account.1': {'visits': 1}}
+
+
+def test_session_end_with_failing_store(backend):
+    store = UserStore(backend)
+    store.set('amzn1.ask.account.1', {'visits': 1})
+    backend.fail = True
+    skill = alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye', VisitIntents())
+    skill.store = store
+
+    message, handled = skill.handle(user_request('SessionEndedRequest'))
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>bye</speak>'
+
+    class StoreProcessor(alexa_skill.Processor):
+        pass
+
+    StoreProcessor.store = store
+    message, handled = StoreProcessor(
+        user_request('SessionEndedRequest'), BuildInIntents('help', 'not handled'), 'welcome', 'bye'
+    )()
+
+    assert message['response']['outputSpeech']['ssml'] == '<speak>bye</speak>'
+    assert len(store) == 1
+
+    backend.fail = False
+    skill.handle(user_request('SessionEndedRequest'))
+
+    assert backend.data == {'amzn1.ask.account.1': {'visits': 1}}
@@ -0,0 +1,76 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import datetime
+
+import pytest
+
+from alexa_skill import temporal
+
+
+def test_parse_time():
+    time = temporal.parse_time('11:30')
+
+    assert time == temporal.Time(11, 30, 0, None)
+    assert time.to_time() == datetime.time(11, 30)
+
+
+def test_parse_time_with_seconds():
+    assert temporal.parse_time('23:05:59') == temporal.Time(23, 5, 59, None)
+
+
+@pytest.mark.parametrize('day_part,hour,minute', [('MO', 8, 30), ('AF', 13, 0), ('EV', 18, 0), ('NI', 21, 0)])
+def test_parse_time_day_part(day_part, hour, minute):
+    assert temporal.parse_time(day_part) == temporal.Time(hour, minute, 0, day_part)
+
+
+@pytest.mark.parametrize('value', [None, '', '11:dwa', '24:00', '11:60', '11:30:60', 'XX', ['11:30']])
+def test_parse_time_not_parsable(value):
+    assert temporal.parse_time(value) is None
+
+
+@pytest.mark.parametrize('value,expected', [
+    ('PT15M', temporal.Duration(0, 0, 0, 0, 0, 15, 0)),
+    ('P2DT3H', temporal.Duration(0, 0, 0, 2, 3, 0, 0)),
+    ('P1Y2M3W4DT5H6M7S', temporal.Duration(1, 2, 3, 4, 5, 6, 7)),
+    ('PT0.5S', temporal.Duration(0, 0, 0, 0, 0, 0, 0.5)),
+])
+def test_parse_duration(value, expected):
+    assert temporal.parse_duration(value) == expected
+
+
+@pytest.mark.parametrize('value', [None, '', 'P', 'PT', 'P1YT', '15M', 'PT15', 'P1H'])
+def test_parse_duration_not_parsable(value):
+    assert temporal.parse_duration(value) is None
+
+
+def test_duration_to_timedelta():
+    assert temporal.parse_duration('P1DT2H30M').to_timedelta() == datetime.timedelta(days=1, hours=2, minutes=30)
+
+
+def test_duration_with_months_to_timedelta():
+    with pytest.raises(ValueError):
+        temporal.parse_duration('P1M').to_timedelta()
+
+
+def test_parsed_values_are_cached():
+    assert temporal.parse_duration('PT20M') is temporal.parse_duration('PT20M')
+    assert temporal.parse_time('10:15') is temporal.parse_time('10:15')
@@ -0,0 +1,47 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import datetime
+
+import dateutil.tz
+import pytest
+
+from alexa_skill import timezones
+
+
+def test_get_default_timezone():
+    assert timezones.get() is timezones.get(timezones.DEFAULT_TIMEZONE)
+    assert timezones.get().utcoffset(datetime.datetime(2018, 1, 1)) == datetime.timedelta(hours=1)
+
+
+def test_get_timezone_is_resolved_once():
+    assert timezones.get('America/New_York') is timezones.get('America/New_York')
+
+
+def test_get_timezone_object():
+    timezone = dateutil.tz.tzoffset(None, 3600)
+
+    assert timezones.get(timezone) is timezone
+
+
+def test_get_unknown_timezone():
+    with pytest.raises(ValueError):
+        timezones.get('Europe/Atlantis')
@@ -0,0 +1,248 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import base64
+import calendar
+import datetime
+import io
+import json
+import time
+
+import pytest
+
+from alexa_skill import verify
+from alexa_skill.verify import VerificationError
+
+CERTIFICATE_URL = 'https://s3.amazonaws.com/echo.api/echo-api-cert.pem'
+
+NOW = calendar.timegm((2018, 5, 10, 12, 0, 0))
+
+
+@pytest.mark.parametrize('url', [
+    'https://s3.amazonaws.com/echo.api/echo-api-cert.pem',
+    'https://s3.amazonaws.com:443/echo.api/echo-api-cert.pem',
+    'https://s3.amazonaws.com/echo.api/../echo.api/echo-api-cert.pem',
+    'HTTPS://S3.AMAZONAWS.COM/echo.api/echo-api-cert.pem',
+])
+def test_check_certificate_url(url):
+    verify.check_certificate_url(url)
+
+
+@pytest.mark.parametrize('url', [
+    'http://s3.amazonaws.com/echo.api/echo-api-cert.pem',
+    'https://notamazon.com/echo.api/echo-api-cert.pem',
+    'https://s3.amazonaws.com/EcHo.aPi/echo-api-cert.pem',
+    'https://s3.amazonaws.com/invalid.path/echo-api-cert.pem',
+    'https://s3.amazonaws.com:563/echo.api/echo-api-cert.pem',
+    'https://s3.amazonaws.com/echo.api/../invalid.path/echo-api-cert.pem',
+    None,
+])
+def test_check_invalid_certificate_url(url):
+    with pytest.raises(VerificationError):
+        verify.check_certificate_url(url)
+
+
+def test_check_timestamp():
+    verify.check_timestamp({'request': {'timestamp': '2018-05-10T12:02:00Z'}}, now=NOW)
+    verify.check_timestamp({'request': {'timestamp': '2018-05-10T11:58:00.123Z'}}, now=NOW)
+
+    with pytest.raises(VerificationError):
+        verify.check_timestamp({'request': {'timestamp': '2018-05-10T11:57:00Z'}}, now=NOW)
+
+    with pytest.raises(VerificationError):
+        verify.check_timestamp({'request': {}}, now=NOW)
+
+
+@pytest.fixture(scope='module')
+def certificates():
+    pytest.importorskip('cryptography')
+
+    from cryptography import x509
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    def create(common_name, issuer=None, issuer_key=None, domain=None, ca=False, path_length=None):
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048, backend=default_backend())
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, common_name)])
+        builder = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(issuer.subject if issuer else name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(datetime.datetime(2018, 1, 1))
+            .not_valid_after(datetime.datetime(2019, 1, 1))
+        )
+
+        if domain:
+            builder = builder.add_extension(x509.SubjectAlternativeName([x509.DNSName(domain)]), critical=False)
+
+        builder = builder.add_extension(x509.BasicConstraints(ca=ca, path_length=path_length), critical=True)
+        builder = builder.add_extension(x509.KeyUsage(
+            digital_signature=not ca, content_commitment=False, key_encipherment=not ca, data_encipherment=False,
+            key_agreement=False, key_cert_sign=ca, crl_sign=ca, encipher_only=False, decipher_only=False,
+        ), critical=True)
+
+        certificate = builder.sign(issuer_key or key, hashes.SHA256(), default_backend())
+
+        return certificate, key
+
+    root, root_key = create('Test Root', ca=True)
+    intermediate, intermediate_key = create('Test Intermediate', root, root_key, ca=True, path_length=0)
+    leaf, leaf_key = create('echo-api.amazon.com', intermediate, intermediate_key, domain='echo-api.amazon.com')
+    other, other_key = create('other.example.com', intermediate, intermediate_key, domain='other.example.com')
+    # Certificates issued by end-entity certificate and by CA below path length of the intermediate
+    leaf_signed, _ = create('echo-api.amazon.com', other, other_key, domain='echo-api.amazon.com')
+    sub_intermediate, sub_intermediate_key = create('Test Sub Intermediate', intermediate, intermediate_key, ca=True)
+    too_deep, _ = create('echo-api.amazon.com', sub_intermediate, sub_intermediate_key, domain='echo-api.amazon.com')
+
+    def pem(*chain):
+        return b''.join(certificate.public_bytes(serialization.Encoding.PEM) for certificate in chain)
+
+    return {
+        'root': root,
+        'chain': pem(leaf, intermediate),
+        'other_chain': pem(other, intermediate),
+        'untrusted_chain': pem(leaf),
+        'leaf_signed_chain': pem(leaf_signed, other, intermediate),
+        'path_length_chain': pem(too_deep, sub_intermediate, intermediate),
+        'key': leaf_key,
+    }
+
+
+class Fetcher(object):
+    def __init__(self, chain):
+        self.chain = chain
+        self.calls = 0
+
+    def __call__(self, url):
+        self.calls += 1
+        return self.chain
+
+
+def signed_request(certificates, timestamp='2018-05-10T12:00:00Z'):
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+
+    request_body = {'request': {'type': 'LaunchRequest', 'timestamp': timestamp}}
+    body = json.dumps(request_body).encode('utf-8')
+    signature = base64.b64encode(certificates['key'].sign(body, padding.PKCS1v15(), hashes.SHA256()))
+
+    return body, request_body, signature.decode('ascii')
+
+
+def create_verifier(certificates, chain='chain'):
+    fetcher = Fetcher(certificates[chain])
+
+    return verify.Verifier(fetcher, ca_certificates=[certificates['root']], clock=lambda: NOW), fetcher
+
+
+def test_verifier(certificates):
+    verifier, fetcher = create_verifier(certificates)
+    body, request_body, signature = signed_request(certificates)
+
+    verifier.verify(body, request_body, CERTIFICATE_URL, signature_256=signature)
+    verifier.verify(body, request_body, CERTIFICATE_URL, signature_256=signature)
+
+    # Certificate chain is fetched and validated once
+    assert fetcher.calls == 1
+
+
+def test_verifier_invalid_signature(certificates):
+    verifier, fetcher = create_verifier(certificates)
+    body, request_body, signature = signed_request(certificates)
+
+    with pytest.raises(VerificationError):
+        verifier.verify(body + b' ', request_body, CERTIFICATE_URL, signature_256=signature)
+
+    with pytest.raises(VerificationError):
+        verifier.verify(body, request_body, CERTIFICATE_URL, signature=signature)
+
+    with pytest.raises(VerificationError):
+        verifier.verify(body, request_body, CERTIFICATE_URL)
+
+
+def test_verifier_old_request(certificates):
+    verifier, fetcher = create_verifier(certificates)
+    body, request_body, signature = signed_request(certificates, timestamp='2018-05-10T11:50:00Z')
+
+    with pytest.raises(VerificationError):
+        verifier.verify(body, request_body, CERTIFICATE_URL, signature_256=signature)
+
+
+@pytest.mark.parametrize('chain', ['other_chain', 'untrusted_chain'])
+def test_verifier_invalid_chain(certificates, chain):
+    verifier, fetcher = create_verifier(certificates, chain)
+    body, request_body, signature = signed_request(certificates)
+
+    with pytest.raises(VerificationError):
+        verifier.verify(body, request_body, CERTIFICATE_URL, signature_256=signature)
+
+
+@pytest.mark.parametrize('chain', ['leaf_signed_chain', 'path_length_chain'])
+def test_verifier_chain_issued_by_non_ca(certificates, chain):
+    verifier, fetcher = create_verifier(certificates, chain)
+
+    with pytest.raises(VerificationError):
+        verifier.signing_key(CERTIFICATE_URL)
+
+
+def test_verifier_expired_certificate(certificates):
+    verifier, fetcher = create_verifier(certificates)
+    verifier.clock = lambda: calendar.timegm((2019, 5, 10, 12, 0, 0))
+    body, request_body, signature = signed_request(certificates, timestamp='2019-05-10T12:00:00Z')
+
+    with pytest.raises(VerificationError):
+        verifier.verify(body, request_body, CERTIFICATE_URL, signature_256=signature)
+
+
+def test_wsgi_application_verifier(certificates):
+    import alexa_skill
+    from alexa_skill.intents import BuildInIntents
+    from alexa_skill.server import WSGIApplication
+
+    verifier, fetcher = create_verifier(certificates)
+    skill = alexa_skill.Skill(BuildInIntents('help', 'not handled'), 'welcome', 'bye')
+    application = WSGIApplication(skill, verifier=verifier)
+    body, request_body, signature = signed_request(certificates)
+    statuses = []
+
+    def call(**headers):
+        environ = {
+            'REQUEST_METHOD': 'POST',
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.input': io.BytesIO(body),
+            'HTTP_SIGNATURECERTCHAINURL': CERTIFICATE_URL,
+        }
+        environ.update(headers)
+        application(environ, lambda status, response_headers: statuses.append(status))
+
+    call(HTTP_SIGNATURE_256=signature)
+    call(HTTP_SIGNATURE_256=base64.b64encode(b'invalid').decode('ascii'))
+
+    assert statuses == ['200 OK', '400 Bad Request']
+
+
+def test_default_verifier_time():
+    assert abs(verify.Verifier().clock() - time.time()) < 1
@@ -0,0 +1,64 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import datetime
+import threading
+
+DEFAULT_TIMEZONE = 'Europe/Berlin'
+
+_timezones = {}
+_lock = threading.Lock()
+
+
+def get(timezone=None):
+    """
+    Returns timezone object for timezone name.
+
+    Every timezone is resolved only once, timezone objects are shared between requests and threads.
+    `dateutil` is imported on first call, so skills which do not use dates do not pay for its import.
+
+    :param timezone: IANA timezone name, e.g. 'Europe/Berlin', or timezone object which is returned as it is.
+        Default: DEFAULT_TIMEZONE
+    :rtype: datetime.tzinfo
+    :raises ValueError: When timezone is unknown.
+    """
+    if timezone is None:
+        timezone = DEFAULT_TIMEZONE
+
+    elif isinstance(timezone, datetime.tzinfo):
+        return timezone
+
+    try:
+        return _timezones[timezone]
+    except KeyError:
+        pass
+
+    with _lock:
+        import dateutil.tz
+
+        tzinfo = _timezones.get(timezone) or dateutil.tz.gettz(timezone)
+
+        if tzinfo is None:
+            raise ValueError('Unknown timezone: {}'.format(timezone))
+
+        _timezones[timezone] = tzinfo
+
+    return tzinfo
@@ -0,0 +1,369 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Verification of requests sent by Alexa, required for skills hosted outside of AWS Lambda.
+
+Reference:
+    https://developer.amazon.com/docs/custom-skills/host-a-custom-skill-as-a-web-service.html
+
+Requires `cryptography`, install it with `pip install alexa-skill[verify]`.
+"""
+import base64
+import calendar
+import posixpath
+import re
+import ssl
+import threading
+import time
+
+try:
+    from urllib.parse import urlparse
+    from urllib.request import urlopen
+except ImportError:  # Python 2
+    from urlparse import urlparse
+    from urllib2 import urlopen
+
+from alexa_skill.cache import LRUCache
+
+TIMESTAMP_TOLERANCE = 150
+
+SIGNING_CERTIFICATE_DOMAIN = 'echo-api.amazon.com'
+
+_PEM_PATTERN = re.compile(b'-----BEGIN CERTIFICATE-----.+?-----END CERTIFICATE-----', re.DOTALL)
+
+
+class VerificationError(ValueError):
+    """
+    Raised when request was not sent by Alexa, skill should answer with 400 Bad Request.
+    """
+
+
+def check_certificate_url(url):
+    """
+    Checks that certificate chain is hosted by Amazon.
+
+    :param (str) url: Value of SignatureCertChainUrl header.
+    :raises VerificationError: When URL is not Alexa certificate chain URL.
+    """
+    parsed = urlparse(url or '')
+
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+
+    path = posixpath.normpath(parsed.path) if parsed.path else ''
+
+    if (
+        parsed.scheme.lower() != 'https'
+        or (parsed.hostname or '').lower() != 's3.amazonaws.com'
+        or port not in (None, 443)
+        or not path.startswith('/echo.api/')
+    ):
+        raise VerificationError('Certificate chain URL {} is not valid'.format(url))
+
+
+def check_timestamp(request_body, tolerance=TIMESTAMP_TOLERANCE, now=None):
+    """
+    Checks that request is not older than tolerance, which protects skill from replay attacks.
+
+    :param (dict) request_body: Alexa request body.
+    :param (int) tolerance: Maximum age of request in seconds.
+    :param (float) now: Current UNIX time. Default: time.time()
+    :raises VerificationError: When timestamp is missing or is not within tolerance.
+    """
+    try:
+        timestamp = request_body['request']['timestamp']
+        # Fractions of seconds are not used for tolerance
+        timestamp = calendar.timegm(time.strptime(timestamp.split('.')[0].rstrip('Z'), '%Y-%m-%dT%H:%M:%S'))
+    except (KeyError, TypeError, ValueError, AttributeError):
+        raise VerificationError('Request timestamp is missing or not valid')
+
+    if abs((time.time() if now is None else now) - timestamp) > tolerance:
+        raise VerificationError('Request timestamp is not within tolerance')
+
+
+def fetch(url):
+    """
+    Downloads certificate chain.
+
+    :rtype: bytes
+    """
+    response = urlopen(url, timeout=5)
+
+    try:
+        return response.read()
+    finally:
+        response.close()
+
+
+def default_ca_file():
+    try:
+        import certifi
+    except ImportError:
+        return ssl.get_default_verify_paths().cafile
+
+    return certifi.where()
+
+
+def load_certificates(pem, skip_invalid=False):
+    """
+    Parses PEM encoded certificates.
+
+    :param (bytes) pem: One or many PEM certificates.
+    :param (bool) skip_invalid: Skips certificates which cannot be parsed, e.g. in system bundle.
+    :rtype: list
+    :raises VerificationError: When certificate cannot be parsed.
+    """
+    from cryptography import x509
+    from cryptography.hazmat.backends import default_backend
+
+    certificates = []
+
+    for block in _PEM_PATTERN.findall(pem):
+        try:
+            certificates.append(x509.load_pem_x509_certificate(block, default_backend()))
+        except ValueError:
+            if not skip_invalid:
+                raise VerificationError('Certificate cannot be parsed')
+
+    return certificates
+
+
+def _utc_timestamp(certificate, attribute):
+    value = getattr(certificate, attribute + '_utc', None) or getattr(certificate, attribute)
+
+    return calendar.timegm(value.utctimetuple())
+
+
+def _verify_issued(certificate, issuer):
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.hazmat.primitives.asymmetric import padding
+
+    public_key = issuer.public_key()
+
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        public_key.verify(
+            certificate.signature, certificate.tbs_certificate_bytes, ec.ECDSA(certificate.signature_hash_algorithm)
+        )
+    else:
+        public_key.verify(
+            certificate.signature, certificate.tbs_certificate_bytes, padding.PKCS1v15(),
+            certificate.signature_hash_algorithm,
+        )
+
+
+class Verifier(object):
+    def __init__(self, fetcher=fetch, ca_certificates=None, tolerance=TIMESTAMP_TOLERANCE, clock=time.time):
+        """
+        Verifies signatures and timestamps of Alexa requests.
+
+        Certificate chains are downloaded, parsed and validated once per URL and are cached until the signing
+        certificate expires, so verification of a request costs one signature check.
+
+        Example:
+            application = WSGIApplication(skill, verifier=Verifier())
+
+        :param fetcher: Function which downloads certificate chain from URL and returns PEM bytes.
+        :param (list) ca_certificates: Trusted root certificates (`cryptography.x509.Certificate`).
+            Default: certifi bundle, or system certificates when certifi is not installed.
+        :param (int) tolerance: Maximum age of request in seconds.
+        :param clock: Function which returns current UNIX time.
+        """
+        self.fetcher = fetcher
+        self.ca_certificates = ca_certificates
+        self.tolerance = tolerance
+        self.clock = clock
+        self.chains = LRUCache(maxsize=16)
+        self._lock = threading.Lock()
+
+    def verify(self, body, request_body, certificate_url, signature=None, signature_256=None):
+        """
+        Verifies Alexa request.
+
+        :param (bytes) body: Raw request body, signature is checked against exact bytes which were sent.
+        :param (dict) request_body: Decoded request body.
+        :param (str) certificate_url: Value of SignatureCertChainUrl header.
+        :param (str) signature: Value of Signature header, SHA-1 signature of the body.
+        :param (str) signature_256: Value of Signature-256 header, SHA-256 signature which is preferred.
+        :raises VerificationError: When request was not sent by Alexa.
+        """
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+
+        if signature_256:
+            encoded_signature, algorithm = signature_256, hashes.SHA256()
+        elif signature:
+            encoded_signature, algorithm = signature, hashes.SHA1()
+        else:
+            raise VerificationError('Request signature is missing')
+
+        public_key = self.signing_key(certificate_url)
+
+        try:
+            public_key.verify(base64.b64decode(encoded_signature), body, padding.PKCS1v15(), algorithm)
+        except (InvalidSignature, TypeError, ValueError):
+            raise VerificationError('Request signature is not valid')
+
+        check_timestamp(request_body, self.tolerance, self.clock())
+
+    def signing_key(self, certificate_url):
+        """
+        Returns public key of valid signing certificate.
+
+        :raises VerificationError: When URL or certificate chain is not valid.
+        """
+        now = self.clock()
+        cached = self.chains.get(certificate_url)
+
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        check_certificate_url(certificate_url)
+
+        try:
+            pem = self.fetcher(certificate_url)
+        except Exception as error:
+            raise VerificationError('Certificate chain {} cannot be fetched: {}'.format(certificate_url, error))
+
+        certificates = load_certificates(pem)
+        self.check_chain(certificates, now)
+
+        expires = min(_utc_timestamp(certificate, 'not_valid_after') for certificate in certificates)
+        public_key = certificates[0].public_key()
+        self.chains.set(certificate_url, (public_key, expires))
+
+        return public_key
+
+    def check_chain(self, certificates, now):
+        """
+        Checks that signing certificate is valid for Alexa and its chain leads to trusted root certificate.
+
+        :param (list) certificates: Signing certificate followed by intermediate certificates.
+        :raises VerificationError: When certificate chain is not valid.
+        """
+        from cryptography import x509
+
+        if not certificates:
+            raise VerificationError('Certificate chain is empty')
+
+        for certificate in certificates:
+            if not _utc_timestamp(certificate, 'not_valid_before') <= now <= _utc_timestamp(
+                certificate, 'not_valid_after'
+            ):
+                raise VerificationError('Certificate {} is expired'.format(certificate.subject))
+
+        try:
+            names = certificates[0].extensions.get_extension_for_class(
+                x509.SubjectAlternativeName
+            ).value.get_values_for_type(x509.DNSName)
+        except x509.ExtensionNotFound:
+            names = []
+
+        if SIGNING_CERTIFICATE_DOMAIN not in names:
+            raise VerificationError('Certificate is not issued for {}'.format(SIGNING_CERTIFICATE_DOMAIN))
+
+        self.check_key_usage(certificates[0], 'digital_signature')
+
+        roots = self.trusted_roots()
+        chain = list(certificates)
+
+        # Every issuer has to be CA which may sign certificates, `depth` intermediate CAs are below it
+        for depth, (certificate, issuer) in enumerate(zip(chain, chain[1:])):
+            self.check_issued(certificate, issuer)
+            self.check_ca(issuer, depth)
+
+        last = chain[-1]
+
+        for root in roots:
+            if root.subject == last.issuer:
+                self.check_issued(last, root)
+                self.check_ca(root, len(chain) - 1)
+                return
+
+        raise VerificationError('Certificate chain does not lead to trusted certificate')
+
+    @staticmethod
+    def check_key_usage(certificate, usage):
+        """
+        Checks that key usage extension of certificate allows `usage`, e.g. `key_cert_sign`.
+
+        :raises VerificationError: When extension is missing or does not allow usage.
+        """
+        from cryptography import x509
+
+        try:
+            key_usage = certificate.extensions.get_extension_for_class(x509.KeyUsage).value
+        except x509.ExtensionNotFound:
+            raise VerificationError('Certificate {} has no key usage'.format(certificate.subject))
+
+        if not getattr(key_usage, usage):
+            raise VerificationError('Certificate {} key usage does not allow {}'.format(certificate.subject, usage))
+
+    @classmethod
+    def check_ca(cls, certificate, depth):
+        """
+        Checks that certificate is CA which may issue certificates with `depth` intermediate CAs below it.
+
+        :raises VerificationError: When certificate is not CA or its path length is exceeded.
+        """
+        from cryptography import x509
+
+        try:
+            constraints = certificate.extensions.get_extension_for_class(x509.BasicConstraints).value
+        except x509.ExtensionNotFound:
+            constraints = None
+
+        if constraints is None or not constraints.ca:
+            raise VerificationError('Certificate {} is not CA'.format(certificate.subject))
+
+        if constraints.path_length is not None and depth > constraints.path_length:
+            raise VerificationError('Path length of certificate {} is exceeded'.format(certificate.subject))
+
+        cls.check_key_usage(certificate, 'key_cert_sign')
+
+    @staticmethod
+    def check_issued(certificate, issuer):
+        from cryptography.exceptions import InvalidSignature
+
+        if certificate.issuer != issuer.subject:
+            raise VerificationError('Certificate {} is not issued by {}'.format(certificate.subject, issuer.subject))
+
+        try:
+            _verify_issued(certificate, issuer)
+        except (InvalidSignature, TypeError, ValueError):
+            raise VerificationError('Certificate {} has invalid signature'.format(certificate.subject))
+
+    def trusted_roots(self):
+        if self.ca_certificates is None:
+            with self._lock:
+                if self.ca_certificates is None:
+                    ca_file = default_ca_file()
+
+                    if not ca_file:
+                        raise VerificationError('Trusted certificates are not available')
+
+                    with open(ca_file, 'rb') as certificates:
+                        self.ca_certificates = load_certificates(certificates.read(), skip_invalid=True)
+
+        return self.ca_certificates
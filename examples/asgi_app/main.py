@@ -0,0 +1,58 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import asyncio
+
+from alexa_skill.aio import AsyncSkill
+from alexa_skill.server import ASGIApplication
+from alexa_skill.intents import BaseIntents
+from alexa_skill.intents import BuildInIntents
+from alexa_skill.intents import intent
+
+
+class ExampleIntents(BaseIntents):
+    @intent('EXAMPLE.hello')
+    def hello(self):
+        return self.response('Hello. Nice to meet you.'), True
+
+    @intent('EXAMPLE.backend')
+    async def backend(self):
+        # Waiting for a backend does not block other requests
+        await asyncio.sleep(0.01)
+        return self.response('Backend answered.'), True
+
+
+buildin_intents = BuildInIntents(
+    help_message='Say "HI" to us',
+    not_handled_message="Sorry, I don't understand you. Could you repeat?",
+    stop_message='stop',
+    cancel_message='cancel'
+)
+
+skill = AsyncSkill(
+    buildin_intents,
+    'Welcome to Alexa skill bot',
+    'Good bye',
+    ExampleIntents(),
+)
+
+# Run with: uvicorn main:app
+app = ASGIApplication(skill, path='/v1/alexa/fulfiller')
@@ -26,23 +26,20 @@ import falcon
 import alexa_skill
 from alexa_skill.intents import BaseIntents
 from alexa_skill.intents import BuildInIntents
-from alexa_skill import dates
+from alexa_skill.intents import intent
+from alexa_skill import messages
 
 
 class ExampleIntents(BaseIntents):
-    @property
-    def mapper(self):
-        return {
-            'EXAMPLE.hello': self.hello,
-            'EXAMPLE.date_intent': self.date_intent,
-        }
-
+    @intent('EXAMPLE.hello')
     def hello(self):
         return self.response('Hello. Nice to meet you.'), True
 
+    @intent('EXAMPLE.date_intent')
     def date_intent(self, slots=None):
 
-        date, date_type = dates.AmazonDateParser.to_date(slots['dateslot']['value'])
+        # Date is parsed once and cached on the slot
+        date, date_type = slots['dateslot'].date
 
         text = "Your date is <say-as interpret-as='date'>{}</say-as> and it is a {}".format(
             date.strftime('%Y%m%d'),
@@ -60,20 +57,26 @@ buildin_intents = BuildInIntents(
 )
 
 
+skill = alexa_skill.Skill(
+    buildin_intents,
+    'Welcome to Alexa skill bot',
+    'Good bye',
+    ExampleIntents(),
+)
+
+
 class Fulfiller(object):
     def on_post(self, req, resp):
-        get_response = alexa_skill.Processor(
-            req.media,
-            buildin_intents,
-            'Welcome to Alexa skill bot',
-            'Good bye',
-            ExampleIntents(),
-        )
-        json_response, handled = get_response()
+        try:
+            request_body = messages.loads(req.bounded_stream.read())
+        except ValueError:
+            raise falcon.HTTPBadRequest('Invalid request', 'Request body is not valid JSON')
+
+        json_response, handled = skill.handle(request_body)
 
         logging.info('Response was handled by system: {}'.format(handled))
 
-        resp.media = json_response
+        resp.data = messages.dumps(json_response)
 
 
 app = falcon.API(media_type=falcon.MEDIA_JSON)
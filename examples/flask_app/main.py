@@ -21,11 +21,13 @@
 # THE SOFTWARE.
 import logging
 
-from flask import Flask, request, jsonify
+from flask import Flask, abort, request
 
 import alexa_skill
 from alexa_skill.intents import BaseIntents
+from alexa_skill import messages
 from alexa_skill.intents import BuildInIntents
+from alexa_skill.intents import intent
 
 
 app = Flask(__name__)
@@ -39,27 +41,28 @@ buildin_intents = BuildInIntents(
 
 
 class ExampleIntents(BaseIntents):
-    @property
-    def mapper(self):
-        return {
-            'EXAMPLE.hello': self.hello,
-        }
-
+    @intent('EXAMPLE.hello')
     def hello(self):
         return self.response('Hello. Nice to meet you.'), True
 
 
+skill = alexa_skill.Skill(
+    buildin_intents,
+    'Welcome to Alexa skill bot',
+    'Good bye',
+    ExampleIntents(),
+)
+
+
 @app.route("/v1/alexa/fulfiller", methods=['POST'])
 def fulfiller():
-    get_response = alexa_skill.Processor(
-        request.json,
-        buildin_intents,
-        'Welcome to Alexa skill bot',
-        'Good bye',
-        ExampleIntents(),
-    )
-    json_response, handled = get_response()
+    try:
+        request_body = messages.loads(request.get_data())
+    except ValueError:
+        abort(400)
+
+    json_response, handled = skill.handle(request_body)
 
     logging.info('Response was handled by system: {}'.format(handled))
 
-    return jsonify(json_response)
+    return app.response_class(messages.dumps(json_response), mimetype='application/json')
@@ -0,0 +1,62 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import alexa_skill
+from alexa_skill.intents import BaseIntents
+from alexa_skill.intents import BuildInIntents
+from alexa_skill.intents import intent
+
+
+class ExampleIntents(BaseIntents):
+    @intent('EXAMPLE.hello')
+    def hello(self):
+        return self.response('Hello. Nice to meet you.'), True
+
+    @intent('EXAMPLE.date_intent')
+    def date_intent(self, slots=None):
+        date, date_type = slots['dateslot'].date
+
+        text = "Your date is <say-as interpret-as='date'>{}</say-as> and it is a {}".format(
+            date.strftime('%Y%m%d'),
+            date_type
+        )
+
+        return self.response(text), True
+
+
+def create_skill():
+    buildin_intents = BuildInIntents(
+        help_message='Say "HI" to us',
+        not_handled_message="Sorry, I don't understand you. Could you repeat?",
+        stop_message='stop',
+        cancel_message='cancel'
+    )
+
+    return alexa_skill.Skill(
+        buildin_intents,
+        'Welcome to Alexa skill bot',
+        'Good bye',
+        ExampleIntents(),
+    )
+
+
+# Skill is created during Lambda init, set handler of the function to lambda_function.lambda_handler
+lambda_handler = alexa_skill.lambda_handler(create_skill, timezones=['Europe/Berlin'])
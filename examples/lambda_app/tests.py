@@ -0,0 +1,77 @@
+# The MIT License (MIT)
+# 
+# Copyright (c) 2018 stanwood GmbH
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import pytest
+
+import lambda_function
+
+
+@pytest.fixture
+def alexa_request_body():
+    return {
+            "version": "1.0",
+            "session": {
+                "new": True,
+                "sessionId": "amzn1.echo-api.session.[unique-value-here]",
+                "application": {
+                    "applicationId": "amzn1.ask.skill.[unique-value-here]"
+                },
+                "user": {
+                    "userId": "amzn1.ask.account.[unique-value-here]"
+                }
+            },
+            "request": {
+                "type": "LaunchRequest"
+            }
+        }
+
+
+def test_launch_request(alexa_request_body):
+    response = lambda_function.lambda_handler(alexa_request_body, None)
+
+    assert response['response']['outputSpeech']['ssml'] == '<speak>Welcome to Alexa skill bot</speak>'
+    assert response['response']['shouldEndSession'] is False
+
+
+def test_date_intent_request(alexa_request_body):
+    request_body = alexa_request_body.copy()
+    request_body['request'] = {
+        'type': 'IntentRequest',
+        'intent': {
+            'name': 'EXAMPLE.date_intent',
+            'slots': {
+                'dateslot': {
+                    'name': 'dateslot',
+                    'value': '2018-05-10'
+                }
+            }
+        }
+    }
+
+    response = lambda_function.lambda_handler(request_body, None)
+
+    assert response['response']['outputSpeech']['ssml'] == (
+        "<speak>Your date is <say-as interpret-as='date'>20180510</say-as> and it is a normal</speak>"
+    )
+
+
+def test_init_duration():
+    assert lambda_function.lambda_handler.init_duration < 1
@@ -46,6 +46,21 @@ setuptools.setup(
             'sphinx',
             'sphinx-rtd-theme',
         ],
+        'msgpack': [
+            'msgpack',
+        ],
+        'numpy': [
+            'numpy',
+        ],
+        'orjson': [
+            'orjson',
+        ],
+        'ujson': [
+            'ujson',
+        ],
+        'verify': [
+            'cryptography',
+        ],
         'docs': [
             'sphinx',
             'sphinx-autobuild',
@@ -54,6 +69,7 @@ setuptools.setup(
     },
     classifiers=(
         "Programming Language :: Python :: 2",
+        "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ),